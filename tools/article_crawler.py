@@ -1,5 +1,5 @@
 from datetime import datetime
-import sys
+import argparse
 
 
 from feed_retrieval import (
@@ -14,6 +14,16 @@ import logging
 logging.getLogger("elasticsearch").setLevel(logging.CRITICAL)
 logging.getLogger("zeeguu.core").setLevel(logging.INFO)
 
+parser = argparse.ArgumentParser(description="Retrieves new articles from the feeds")
+parser.add_argument("language", nargs="?", help="only crawl feeds in this language")
+parser.add_argument(
+    "--workers",
+    type=int,
+    default=1,
+    help="number of threads downloading feeds and articles in parallel",
+)
+args = parser.parse_args()
+
 start = datetime.now()
 log(f"started at: {datetime.now()}")
 print("LAST VERSION!!!")
@@ -23,10 +33,12 @@ from zeeguu.api.app import create_app
 app = create_app()
 app.app_context().push()
 
-if len(sys.argv) > 1:
-    retrieve_articles_for_language(sys.argv[1], send_email=False)
+if args.language:
+    retrieve_articles_for_language(
+        args.language, send_email=False, workers=args.workers
+    )
 else:
-    retrieve_articles_from_all_feeds()
+    retrieve_articles_from_all_feeds(workers=args.workers)
 
 end = datetime.now()
 log(f"done at: {end}")
@@ -49,7 +49,9 @@ class CrawlReport:
                 "sents_to_url": {},
             },
             "last_article_date": None,
+            "not_modified": False,
             "feed_errors": [],
+            "es_indexing_errors": {},
             "crawl_time": None,
             "total_articles": None,
             "total_downloaded": None,
@@ -64,6 +66,14 @@ class CrawlReport:
         feed_dict = self._get_feed_dict(feed)
         feed_dict["feed_errors"].append(error)
 
+    def add_es_indexing_error(self, feed, url: str, error: str):
+        feed_dict = self._get_feed_dict(feed)
+        feed_dict.setdefault("es_indexing_errors", {})[url] = error
+
+    def set_feed_not_modified(self, feed):
+        feed_dict = self._get_feed_dict(feed)
+        feed_dict["not_modified"] = True
+
     def set_feed_crawl_time(self, feed, crawl_time):
         feed_dict = self._get_feed_dict(feed)
         feed_dict["crawl_time"] = crawl_time
@@ -206,6 +216,16 @@ class CrawlReport:
                 total_counts += Counter(feed_dict["article_report"]["quality_error"])
         return total_counts
 
+    def get_total_not_modified_feeds(self, langs_to_load: list[str] = None):
+        langs_to_load = self.__load_languages(langs_to_load)
+
+        total = 0
+        for lang in langs_to_load:
+            for feed_dict in self.data["lang"][lang]["feeds"].values():
+                if feed_dict.get("not_modified"):
+                    total += 1
+        return total
+
     def get_total_removed_sents_counts(self, langs_to_load: list[str] = None):
         langs_to_load = self.__load_languages(langs_to_load)
 
@@ -26,24 +26,58 @@ import zeeguu.core
 from zeeguu.core.emailer.zeeguu_mailer import ZeeguuMailer
 from zeeguu.logging import log, logp
 
-from zeeguu.core.content_retriever.article_downloader import download_from_feed
+from zeeguu.core.content_retriever.article_downloader import (
+    DEFAULT_ARTICLES_PER_FEED,
+    download_from_feed,
+    crawl_report_es_indexer,
+)
+from zeeguu.core.content_retriever.crawling_pool import CrawlingPool
 from zeeguu.core.model import Feed, Language
 from crawl_summary.crawl_report import CrawlReport
 
 db_session = zeeguu.core.model.db.session
 
+# with several workers, this many upcoming feeds are listed, and the
+# articles of the first few of them downloaded, while the current feed
+# is being processed
+FEEDS_TO_LIST = 10
+FEEDS_TO_PREFETCH = 2
 
-def download_for_feeds(list_of_feeds, crawl_report):
+
+def download_for_feeds(list_of_feeds, crawl_report, workers=1):
+    """
+    With workers > 1 the feeds and articles are downloaded by that many
+    threads; saving to the DB and the crawl report stays in this thread.
+    """
 
     summary_stream = ""
     counter = 0
     all_feeds_count = len(list_of_feeds)
 
+    es_indexer = crawl_report_es_indexer(db_session, crawl_report)
+    # feeds often share articles; each is only looked at once per crawl
+    seen_urls = set()
+
+    crawling_pool = None
+    active_feeds = [feed for feed in list_of_feeds if not feed.deactivated]
+    if workers > 1:
+        crawling_pool = CrawlingPool(workers)
+
     for feed in list_of_feeds:
         crawl_report.add_feed(feed)
         if feed.deactivated:
             continue
 
+        if crawling_pool:
+            position = active_feeds.index(feed)
+            crawling_pool.list_feeds(
+                active_feeds[position : position + 1 + FEEDS_TO_LIST]
+            )
+            for upcoming in active_feeds[position : position + 1 + FEEDS_TO_PREFETCH]:
+                crawling_pool.prefetch(
+                    upcoming, seen_urls, limit=DEFAULT_ARTICLES_PER_FEED
+                )
+
         counter += 1
         try:
             msg = f">>>>>>>>> {feed.title} ({counter}/{all_feeds_count}) <<<<<<<<<< "  # .encode('utf-8')
@@ -55,6 +89,10 @@ def download_for_feeds(list_of_feeds, crawl_report):
                     feed,
                     zeeguu.core.model.db.session,
                     crawl_report,
+                    limit=DEFAULT_ARTICLES_PER_FEED,
+                    crawling_pool=crawling_pool,
+                    es_indexer=es_indexer,
+                    seen_urls=seen_urls,
                 )
                 + "\n\n"
             )
@@ -71,11 +109,22 @@ def download_for_feeds(list_of_feeds, crawl_report):
             traceback.print_exc()
             crawl_report.add_feed_error(feed, str(e))
 
+        finally:
+            if crawling_pool:
+                crawling_pool.done_with(feed)
+            es_indexer.flush_if_due()
+
+    if crawling_pool:
+        crawling_pool.shutdown()
+
+    es_indexer.flush()
+    logp(f"Indexed {es_indexer.indexed} articles in ES ({es_indexer.failed} failed)")
+
     logp(f"Successfully finished processing {counter} feeds.")
     return summary_stream
 
 
-def retrieve_articles_for_language(language_code, send_email=False):
+def retrieve_articles_for_language(language_code, send_email=False, workers=1):
 
     start_time = time()
     language = Language.find(language_code)
@@ -85,7 +134,7 @@ def retrieve_articles_for_language(language_code, send_email=False):
     crawl_report = CrawlReport()
     crawl_report.add_language(language_code)
 
-    summary_stream = download_for_feeds(all_language_feeds, crawl_report)
+    summary_stream = download_for_feeds(all_language_feeds, crawl_report, workers)
     if send_email:
 
         logp("sending summary email")
@@ -104,10 +153,10 @@ def retrieve_articles_for_language(language_code, send_email=False):
     return crawl_report
 
 
-def retrieve_articles_from_all_feeds():
+def retrieve_articles_from_all_feeds(workers=1):
     all_feeds = Feed.query.all()
     crawl_report = CrawlReport()
-    download_for_feeds(all_feeds, crawl_report)
+    download_for_feeds(all_feeds, crawl_report, workers)
     crawl_report.save_crawl_report()
 
 
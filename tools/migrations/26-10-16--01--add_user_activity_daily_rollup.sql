@@ -0,0 +1,17 @@
+CREATE TABLE `zeeguu_test`.`user_activity_daily_rollup` (
+    `id` INT NOT NULL AUTO_INCREMENT,
+    `user_id` INT NOT NULL,
+    `day` DATE NOT NULL,
+    `language_id` INT NOT NULL,
+    `reading_ms` BIGINT NULL DEFAULT 0,
+    `exercise_ms` BIGINT NULL DEFAULT 0,
+    `translations` INT NULL DEFAULT 0,
+    `exercises` INT NULL DEFAULT 0,
+    `correct_on_first_try` INT NULL DEFAULT 0,
+    `words_learned` INT NULL DEFAULT 0,
+    PRIMARY KEY (`id`),
+    UNIQUE INDEX `user_activity_daily_rollup_user_day_language` (`user_id` ASC, `day` ASC, `language_id` ASC) VISIBLE,
+    INDEX `user_activity_daily_rollup_ibfk_2_idx` (`language_id` ASC) VISIBLE,
+    CONSTRAINT `user_activity_daily_rollup_ibfk_1` FOREIGN KEY (`user_id`) REFERENCES `zeeguu_test`.`user` (`id`) ON DELETE CASCADE ON UPDATE RESTRICT,
+    CONSTRAINT `user_activity_daily_rollup_ibfk_2` FOREIGN KEY (`language_id`) REFERENCES `zeeguu_test`.`language` (`id`) ON DELETE NO ACTION ON UPDATE NO ACTION
+);
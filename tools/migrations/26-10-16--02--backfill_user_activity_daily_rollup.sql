@@ -0,0 +1,56 @@
+-- Fills user_activity_daily_rollup with all the activity so far; the same
+-- sums as UserActivityDailyRollup.recompute. Run right after
+-- 26-10-16--01--add_user_activity_daily_rollup.sql, before deploying the
+-- API that reads the rollup.
+
+INSERT INTO `zeeguu_test`.`user_activity_daily_rollup`
+    (`user_id`, `day`, `language_id`, `reading_ms`, `exercise_ms`,
+     `translations`, `exercises`, `correct_on_first_try`, `words_learned`)
+SELECT user_id, day, language_id,
+    SUM(reading_ms), SUM(exercise_ms), SUM(translations),
+    SUM(exercises), SUM(correct_on_first_try), SUM(words_learned)
+FROM (
+    SELECT urs.user_id, DATE(urs.start_time) AS day, a.language_id,
+        urs.duration AS reading_ms, 0 AS exercise_ms, 0 AS translations,
+        0 AS exercises, 0 AS correct_on_first_try, 0 AS words_learned
+    FROM `zeeguu_test`.`user_reading_session` AS urs
+    JOIN `zeeguu_test`.`article` AS a ON urs.article_id = a.id
+
+    UNION ALL
+
+    SELECT ues.user_id, DATE(ues.start_time),
+        (SELECT MAX(uw.language_id)
+            FROM `zeeguu_test`.`exercise` AS e
+            JOIN `zeeguu_test`.`bookmark_exercise_mapping` AS bem ON bem.exercise_id = e.id
+            JOIN `zeeguu_test`.`bookmark` AS b ON bem.bookmark_id = b.id
+            JOIN `zeeguu_test`.`user_word` AS uw ON b.origin_id = uw.id
+            WHERE e.session_id = ues.id),
+        0, ues.duration, 0, 0, 0, 0
+    FROM `zeeguu_test`.`user_exercise_session` AS ues
+
+    UNION ALL
+
+    SELECT b.user_id, DATE(b.time), uw.language_id, 0, 0, 1, 0, 0, 0
+    FROM `zeeguu_test`.`bookmark` AS b
+    JOIN `zeeguu_test`.`user_word` AS uw ON b.origin_id = uw.id
+
+    UNION ALL
+
+    SELECT b.user_id, DATE(e.time), uw.language_id, 0, 0, 0, 1,
+        CASE WHEN o.outcome IN ('C', 'Correct') THEN 1 ELSE 0 END, 0
+    FROM `zeeguu_test`.`exercise` AS e
+    JOIN `zeeguu_test`.`bookmark_exercise_mapping` AS bem ON bem.exercise_id = e.id
+    JOIN `zeeguu_test`.`bookmark` AS b ON bem.bookmark_id = b.id
+    JOIN `zeeguu_test`.`exercise_outcome` AS o ON e.outcome_id = o.id
+    JOIN `zeeguu_test`.`user_word` AS uw ON b.origin_id = uw.id
+
+    UNION ALL
+
+    SELECT b.user_id, DATE(b.learned_time), uw.language_id, 0, 0, 0, 0, 0, 1
+    FROM `zeeguu_test`.`bookmark` AS b
+    JOIN `zeeguu_test`.`user_word` AS uw ON b.origin_id = uw.id
+    WHERE b.learned_time IS NOT NULL
+) AS activity
+-- exercise sessions without exercises have no language and are not counted
+WHERE user_id IS NOT NULL AND day IS NOT NULL AND language_id IS NOT NULL
+GROUP BY user_id, day, language_id;
@@ -0,0 +1,10 @@
+CREATE TABLE `zeeguu_test`.`article_tokenization_cache` (
+    `article_id` INT NOT NULL,
+    `tokenizer_model` INT NOT NULL,
+    `content_hash` VARCHAR(64) NULL,
+    `format_version` INT NULL,
+    `tokenized_paragraphs` LONGBLOB NULL,
+    `tokenized_title` LONGBLOB NULL,
+    PRIMARY KEY (`article_id`, `tokenizer_model`),
+    CONSTRAINT `article_tokenization_cache_ibfk_1` FOREIGN KEY (`article_id`) REFERENCES `zeeguu_test`.`article` (`id`) ON DELETE CASCADE ON UPDATE RESTRICT
+);
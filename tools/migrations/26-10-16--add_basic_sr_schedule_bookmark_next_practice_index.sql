@@ -0,0 +1 @@
+CREATE INDEX `basic_sr_schedule_bookmark_next_practice` ON `zeeguu_test`.`basic_sr_schedule` (`bookmark_id` ASC, `next_practice_time` ASC);
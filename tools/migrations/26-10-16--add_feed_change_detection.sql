@@ -0,0 +1,4 @@
+ALTER TABLE `zeeguu_test`.`feed`
+    ADD COLUMN `etag` VARCHAR(255) NULL,
+    ADD COLUMN `last_modified` VARCHAR(64) NULL,
+    ADD COLUMN `content_hash` VARCHAR(64) NULL;
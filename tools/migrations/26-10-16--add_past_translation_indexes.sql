@@ -0,0 +1,2 @@
+CREATE INDEX `text_content_hash` ON `zeeguu_test`.`text` (`content_hash` ASC);
+CREATE INDEX `bookmark_user_text` ON `zeeguu_test`.`bookmark` (`user_id` ASC, `text_id` ASC);
@@ -0,0 +1,61 @@
+"""
+
+Recomputes the user_activity_daily_rollup table from the sessions,
+bookmarks and exercises in the DB.
+
+The API updates the day of a session when the session ends; this is
+run every night from cron (see tools/cron/zeeguu.crontab) with --days 2
+to also catch the sessions that were never ended. The table is backfilled by the migration
+26-10-16--02--backfill_user_activity_daily_rollup.sql; --all does the
+same, e.g. to repair it.
+
+"""
+
+import argparse
+from datetime import date, timedelta
+
+import zeeguu.core
+from zeeguu.api.app import create_app
+from zeeguu.core.model import UserActivityDailyRollup
+
+# the first day for which there is activity in the DB
+FIRST_DAY = date(2017, 1, 1)
+DAYS_PER_STEP = 7
+
+parser = argparse.ArgumentParser(description="Recomputes the daily activity rollup")
+parser.add_argument(
+    "--days",
+    type=int,
+    default=2,
+    help="recompute the last DAYS days, including today (default: 2)",
+)
+parser.add_argument(
+    "--from",
+    dest="from_day",
+    type=date.fromisoformat,
+    help="recompute from this day (YYYY-MM-DD) to today",
+)
+parser.add_argument("--all", action="store_true", help="recompute everything")
+args = parser.parse_args()
+
+app = create_app()
+app.app_context().push()
+
+session = zeeguu.core.model.db.session
+
+to_day = date.today()
+if args.all:
+    from_day = FIRST_DAY
+elif args.from_day:
+    from_day = args.from_day
+else:
+    from_day = to_day - timedelta(days=args.days - 1)
+
+print(f"recomputing the activity rollup from {from_day} to {to_day}")
+
+step_start = from_day
+while step_start <= to_day:
+    step_end = min(step_start + timedelta(days=DAYS_PER_STEP - 1), to_day)
+    UserActivityDailyRollup.recompute(session, step_start, step_end)
+    print(f"done with {step_start} - {step_end}")
+    step_start = step_end + timedelta(days=1)
@@ -12,25 +12,32 @@ app.app_context().push()
 print("starting...")
 
 session = zeeguu.core.model.db.session
-articles_to_update = Article.query.filter(
-    Article.language.has(Language.code.in_(["es", "fr", "it", "nl", "ru"]))
-).all()
-for i, article in enumerate(articles_to_update):
-    if VERBOSE:
-        print(f"Article language: {article.language}")
-        print(f"Difficulty before: {article.fk_difficulty} for {article.title}")
-    fk_estimator = DifficultyEstimatorFactory.get_difficulty_estimator("fk")
-    fk_difficulty = fk_estimator.estimate_difficulty(
-        article.content, article.language, None
-    )["grade"]
-
-    article.fk_difficulty = fk_difficulty
-    if VERBOSE:
-        print(f"Difficulty after: {article.fk_difficulty} for {article.title}\n")
-
-    session.add(article)
-    if (i + 1) % CHECKPOINT_STEP == 0:
+fk_estimator = DifficultyEstimatorFactory.get_difficulty_estimator("fk")
+
+for language_code in ["es", "fr", "it", "nl", "ru"]:
+    language = Language.find(language_code)
+    articles_to_update = Article.query.filter(Article.language == language).all()
+    print(f"Article language: {language} ({len(articles_to_update)} articles)")
+
+    for start in range(0, len(articles_to_update), CHECKPOINT_STEP):
+        batch = articles_to_update[start : start + CHECKPOINT_STEP]
+        difficulties = fk_estimator.estimate_difficulties(
+            [article.content for article in batch], language
+        )
+
+        for article, difficulty in zip(batch, difficulties):
+            if VERBOSE:
+                print(f"Difficulty before: {article.fk_difficulty} for {article.title}")
+            article.fk_difficulty = difficulty["grade"]
+            if VERBOSE:
+                print(
+                    f"Difficulty after: {article.fk_difficulty} for {article.title}\n"
+                )
+            session.add(article)
+
         print("Checkpointing changes, commiting...")
         session.commit()
-        print(f"Checkpoint done, completed ({i+1}/{len(articles_to_update)}).")
+        print(
+            f"Checkpoint done, completed ({start + len(batch)}/{len(articles_to_update)})."
+        )
 session.commit()
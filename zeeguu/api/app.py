@@ -62,8 +62,11 @@ def create_app(testing=False):
     # inspired from: https://stackoverflow.com/a/47278172/1200070
 
     from zeeguu.core.model import db
+    from zeeguu.core.model.reference_cache import invalidate_reference_caches
 
     db.init_app(app)
+    # the cached rows are those of the DB of the previous app, if any
+    invalidate_reference_caches()
 
     # Creating the DB tables if needed
     # Note that this must be called after all the model classes are loaded
@@ -75,6 +78,18 @@ def create_app(testing=False):
 
     app.register_blueprint(api)
 
+    from zeeguu.core.tokenization import configure_nlp_pipelines
+
+    configure_nlp_pipelines(app.config)
+
+    from .utils.route_wrappers import configure_session_cache
+
+    configure_session_cache(app.config)
+
+    from .utils.translation_prefetch import configure_translation_prefetch
+
+    configure_translation_prefetch(app.config)
+
     # We're saving the zeeguu.core.app so we can refer to the config from deep in the code...
     zeeguu.core.app = app
 
@@ -48,7 +48,7 @@ def learned_bookmarks(count):
     """
     user = User.find_by_id(flask.g.user_id)
     top_bookmarks = user.learned_bookmarks(count)
-    json_bookmarks = [b.as_dictionary(with_exercise_info=True) for b in top_bookmarks]
+    json_bookmarks = Bookmark.as_dictionaries(top_bookmarks, with_exercise_info=True)
     return json_result(json_bookmarks)
 
 
@@ -1,6 +1,6 @@
 import flask
 
-from zeeguu.core.model import UserExerciseSession
+from zeeguu.core.model import UserExerciseSession, UserActivityDailyRollup
 
 from zeeguu.api.utils.route_wrappers import requires_session
 from zeeguu.api.utils.json_result import json_result
@@ -42,6 +42,9 @@ def exercise_session_update():
 @requires_session
 def exercise_session_end():
     session = update_activity_session(UserExerciseSession, request, db_session)
+    UserActivityDailyRollup.recompute_day_of(
+        db_session, session.user_id, session.start_time
+    )
     send_user_finished_exercise_session(session)
     return "OK"
 
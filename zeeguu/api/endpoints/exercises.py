@@ -27,12 +27,9 @@ def scheduled_bookmarks_to_study(bookmark_count):
     user = User.find_by_id(flask.g.user_id)
     with_token = parse_json_boolean(request.form.get("with_context", "false"))
     to_study = user.bookmarks_to_study(bookmark_count=int_count, scheduled_only=True)
-    json_bookmarks = [
-        bookmark.as_dictionary(
-            with_exercise_info=True, with_context_tokenized=with_token
-        )
-        for bookmark in to_study
-    ]
+    json_bookmarks = Bookmark.as_dictionaries(
+        to_study, with_exercise_info=True, with_context_tokenized=with_token
+    )
     return json_result(json_bookmarks)
 
 
@@ -61,10 +58,9 @@ def top_bookmarks_to_study(bookmark_count):
     int_count = int(bookmark_count)
     user = User.find_by_id(flask.g.user_id)
     to_study = user.bookmarks_to_study(int_count, scheduled_only=False)
-    json_bookmarks = [
-        bookmark.as_dictionary(with_exercise_info=True, with_context_tokenized=True)
-        for bookmark in to_study
-    ]
+    json_bookmarks = Bookmark.as_dictionaries(
+        to_study, with_exercise_info=True, with_context_tokenized=True
+    )
     return json_result(json_bookmarks)
 
 
@@ -79,12 +75,9 @@ def bookmarks_to_learn_not_scheduled():
     user = User.find_by_id(flask.g.user_id)
     with_tokens = parse_json_boolean(request.form.get("with_tokens", "false"))
     to_study = user.bookmarks_to_learn_not_in_pipeline()
-    json_bookmarks = [
-        bookmark.as_dictionary(
-            with_exercise_info=True, with_context_tokenized=with_tokens
-        )
-        for bookmark in to_study
-    ]
+    json_bookmarks = Bookmark.as_dictionaries(
+        to_study, with_exercise_info=True, with_context_tokenized=with_tokens
+    )
 
     return json_result(json_bookmarks)
 
@@ -100,12 +93,11 @@ def bookmarks_in_pipeline(with_tokens=None):
     user = User.find_by_id(flask.g.user_id)
     with_tokens = parse_json_boolean(request.form.get("with_tokens", "false"))
     bookmarks_in_pipeline = user.bookmarks_in_pipeline()
-    json_bookmarks = [
-        bookmark.as_dictionary(
-            with_exercise_info=True, with_context_tokenized=with_tokens
-        )
-        for bookmark in bookmarks_in_pipeline
-    ]
+    json_bookmarks = Bookmark.as_dictionaries(
+        bookmarks_in_pipeline,
+        with_exercise_info=True,
+        with_context_tokenized=with_tokens,
+    )
     return json_result(json_bookmarks)
 
 
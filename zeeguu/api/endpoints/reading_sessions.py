@@ -4,7 +4,7 @@ from flask import request
 from . import api, db_session
 from zeeguu.api.utils import requires_session, json_result
 from .helpers.activity_sessions import update_activity_session
-from ...core.model import UserReadingSession
+from ...core.model import UserReadingSession, UserActivityDailyRollup
 from datetime import datetime
 
 
@@ -38,6 +38,9 @@ def reading_session_update():
 @requires_session
 def reading_session_end():
     session = update_activity_session(UserReadingSession, request, db_session)
+    UserActivityDailyRollup.recompute_day_of(
+        db_session, session.user_id, session.start_time
+    )
     return "OK"
 
 
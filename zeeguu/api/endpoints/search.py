@@ -251,7 +251,7 @@ def search_for_search_terms(search_terms, page: int = 0):
         use_published_priority=use_published_priority,
         use_readability_priority=use_readability_priority,
     )
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
     return json_result(article_infos)
 
 
@@ -283,7 +283,7 @@ def search_for_latest_search_terms(search_terms):
         use_readability_priority=True,
         score_threshold=2,
     )
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
 
@@ -4,7 +4,11 @@ from flask import request, make_response
 from zeeguu.core.model import Session, User
 from zeeguu.api.utils.abort_handling import make_error
 
-from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.route_wrappers import (
+    SESSION_CACHE,
+    cross_domain,
+    requires_session,
+)
 from . import api, db_session
 
 DAYS_BEFORE_EXPIRE = 30  # Days
@@ -18,6 +22,7 @@ def force_user_to_relog(session_object, reason: str = ""):
     print(
         f"Session for user '{session_object.user_id}' was terminated. Reason: '{reason}'"
     )
+    SESSION_CACHE.invalidate(session_object.uuid)
     db_session.delete(session_object)
     db_session.commit()
 
@@ -125,6 +130,7 @@ def logout():
     try:
         session_uuid = request.args["session"]
         session = Session.find(session_uuid)
+        SESSION_CACHE.invalidate(session_uuid)
         db_session.delete(session)
         db_session.commit()
     except:
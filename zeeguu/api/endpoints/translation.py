@@ -6,6 +6,7 @@ import flask
 from flask import request
 
 from zeeguu.api.utils.translator import (
+    get_best_results,
     get_next_results,
     contribute_trans,
 )
@@ -18,7 +19,9 @@ from zeeguu.core.crowd_translations import (
 from zeeguu.core.model import Bookmark, Article, Text, User
 from zeeguu.core.model.user_word import UserWord
 from . import api, db_session
+from zeeguu.api.utils.abort_handling import make_error
 from zeeguu.api.utils.json_result import json_result
+from zeeguu.api.utils.translation_cache import TRANSLATION_CACHE, best_translation
 from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
 from zeeguu.api.utils.parse_json_boolean import parse_json_boolean
 
@@ -82,19 +85,22 @@ def get_one_translation(from_lang_code, to_lang_code):
             likelihood = None
             source = "DEV_SKIP"
         else:
-            translations = get_next_results(
-                {
-                    "from_lang_code": from_lang_code,
-                    "to_lang_code": to_lang_code,
-                    "word": word_str,
-                    "query": query,
-                    "context": context,
-                },
-                number_of_results=3,
-            ).translations
-            best_guess = translations[0]["translation"]
-            likelihood = translations[0].pop("quality")
-            source = translations[0].pop("service_name")
+            position_key = None
+            if in_content is not False:
+                position_key = TRANSLATION_CACHE.position_key(
+                    article_id,
+                    c_paragraph_i,
+                    c_sent_i,
+                    word_str,
+                    from_lang_code,
+                    to_lang_code,
+                )
+            translation = _translate(
+                word_str, context, from_lang_code, to_lang_code, query, position_key
+            )
+            if translation is None:
+                return make_error(503, "No translator could translate the word")
+            best_guess, likelihood, source = translation
         user = User.find_by_id(flask.g.user_id)
         bookmark = Bookmark.find_or_create(
             db_session,
@@ -126,6 +132,51 @@ def get_one_translation(from_lang_code, to_lang_code):
     )
 
 
+def _translate(
+    word_str, context, from_lang_code, to_lang_code, query, position_key=None
+):
+    """
+    The best translation of the translators for the word in the context,
+    as (translation, likelihood, source), or None if none of them had one;
+    the same word in the same context comes up for all the students that
+    read an article, so the translators are only asked the first time
+
+    position_key: the TRANSLATION_CACHE.position_key of the clicked word
+    in the article, if known; the word might have been translated when
+    the article was opened
+    """
+    key = TRANSLATION_CACHE.key(word_str, context, from_lang_code, to_lang_code)
+    cached = TRANSLATION_CACHE.get(key)
+    if not cached and position_key:
+        cached = TRANSLATION_CACHE.get(position_key)
+    if cached:
+        return cached["translation"], cached["likelihood"], cached["source"]
+
+    def remember_best(response):
+        # once all the translators answered, the next student gets
+        # the best of all their translations
+        if response.translations:
+            TRANSLATION_CACHE.set(key, best_translation(response.translations))
+
+    data = {
+        "from_lang_code": from_lang_code,
+        "to_lang_code": to_lang_code,
+        "word": word_str,
+        "query": query,
+        "context": context,
+    }
+    translations = get_best_results(data, when_all_done=remember_best).translations
+    if not translations:
+        # all the translators failed, or none answered even after waiting
+        # for them longer
+        return None
+
+    best = best_translation(translations)
+    if key not in TRANSLATION_CACHE:
+        TRANSLATION_CACHE.set(key, best)
+    return best["translation"], best["likelihood"], best["source"]
+
+
 @api.route(
     "/get_multiple_translations/<from_lang_code>/<to_lang_code>", methods=["POST"]
 )
@@ -5,6 +5,7 @@ from zeeguu.core.model.article_difficulty_feedback import ArticleDifficultyFeedb
 
 from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
 from zeeguu.api.utils.json_result import json_result
+from zeeguu.api.utils.translation_prefetch import TRANSLATION_PREFETCHER
 from . import api, db_session
 
 from datetime import datetime
@@ -46,7 +47,9 @@ def user_article():
     print(article_id)
     article = Article.query.filter_by(id=article_id).one()
     user = User.find_by_id(flask.g.user_id)
-    return json_result(UserArticle.user_article_info(user, article, with_content=True))
+    info = UserArticle.user_article_info(user, article, with_content=True)
+    TRANSLATION_PREFETCHER.prefetch_for(user, article, info["tokenized_paragraphs"])
+    return json_result(info)
 
 
 # ---------------------------------------------------------------------------
@@ -49,7 +49,7 @@ def user_articles_recommended(count: int = 20, page: int = 0):
             .limit(20)
         )
 
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
 
@@ -65,7 +65,7 @@ def saved_articles(page: int = None):
     else:
         saves = PersonalCopy.all_for(user)
 
-    article_infos = [UserArticle.user_article_info(user, e) for e in saves]
+    article_infos = UserArticle.user_article_infos(user, saves)
 
     return json_result(article_infos)
 
@@ -76,7 +76,7 @@ def saved_articles():
     user = User.find_by_id(flask.g.user_id)
     saves = PersonalCopy.all_for(user)
 
-    article_infos = [UserArticle.user_article_info(user, e) for e in saves]
+    article_infos = UserArticle.user_article_infos(user, saves)
 
     return json_result(article_infos)
 
@@ -109,7 +109,7 @@ def user_articles_topic_filtered():
         difficulty_level,
         topic,
     )
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
 
@@ -153,6 +153,6 @@ def user_articles_foryou():
         capture_exception(e)
         # Usually no recommendations when the user has not liked any articles
         articles = []
-    article_infos = [UserArticle.user_article_info(user, a) for a in articles]
+    article_infos = UserArticle.user_article_infos(user, articles)
 
     return json_result(article_infos)
@@ -0,0 +1,19 @@
+import json
+from datetime import datetime
+
+from zeeguu.api.utils.json_result import json_result
+from zeeguu.core.util.encoding import RawJSON
+
+
+def test_raw_json_is_written_as_it_is():
+    tokens = RawJSON('[[{"text":"Hallo","has_space":true}]]')
+    result = json_result(
+        dict(tokens=tokens, title=RawJSON("[]"), time=datetime(2024, 1, 2))
+    )
+
+    assert json.loads(result.get_data()) == dict(
+        tokens=[[{"text": "Hallo", "has_space": True}]],
+        title=[],
+        time="2024-01-02T00:00:00",
+    )
+    assert tokens.value[0][0]["text"] == "Hallo"
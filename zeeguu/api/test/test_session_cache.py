@@ -0,0 +1,61 @@
+from zeeguu.api.utils.session_cache import (
+    RedisSessionStore,
+    SessionCache,
+    SqliteSessionStore,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = str(value).encode()
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+def test_sessions_expire():
+    cache = SessionCache(timeout=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_sessions_are_evicted():
+    cache = SessionCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 3
+
+
+def test_processes_share_sessions_through_the_store(tmp_path):
+    for store in [
+        SqliteSessionStore(str(tmp_path / "sessions")),
+        RedisSessionStore(FakeRedis()),
+    ]:
+        one_worker, another_worker = SessionCache(), SessionCache()
+        one_worker.configure(store=store)
+        another_worker.configure(store=store)
+
+        one_worker.set("a", 1)
+        assert another_worker.get("a") == 1
+        assert another_worker.stats()["store_hits"] == 1
+
+        one_worker.invalidate("a")
+        assert one_worker.get("a") is None
+        assert store.get("a") is None
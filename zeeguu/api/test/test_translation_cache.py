@@ -0,0 +1,40 @@
+from zeeguu.api.utils.translation_cache import TranslationCache
+
+
+def _translation(word):
+    return dict(translation=word, likelihood=95, source="Google - with context")
+
+
+def test_translations_are_remembered_per_word_and_context():
+    cache = TranslationCache()
+    key = cache.key("Hund", "Der Hund schläft", "de", "en")
+    cache.set(key, _translation("dog"))
+
+    assert cache.get(key) == _translation("dog")
+    assert cache.get(cache.key("Hund", "Der Hund bellt", "de", "en")) is None
+    assert cache.get(cache.key("Hund", "Der Hund schläft", "de", "fr")) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_translations_expire():
+    cache = TranslationCache(timeout=0)
+    key = cache.key("Hund", "Der Hund schläft", "de", "en")
+    cache.set(key, _translation("dog"))
+
+    assert key not in cache
+    assert cache.get(key) is None
+
+
+def test_least_recently_used_translations_are_evicted():
+    cache = TranslationCache(max_size=2)
+    keys = [cache.key(word, "", "de", "en") for word in ["Hund", "Katze", "Maus"]]
+    cache.set(keys[0], _translation("dog"))
+    cache.set(keys[1], _translation("cat"))
+    cache.get(keys[0])
+
+    cache.set(keys[2], _translation("mouse"))
+
+    assert keys[0] in cache
+    assert keys[1] not in cache
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import namedtuple
+
+from zeeguu.api.utils.translation_orchestrator import TranslationOrchestrator
+
+Response = namedtuple("Response", ["translations"])
+
+
+class FakeTranslator:
+    def __init__(self, name, quality, seconds, fails=False):
+        self.name = name
+        self.quality = quality
+        self.seconds = seconds
+        self.fails = fails
+
+    def get_result(self, data):
+        time.sleep(self.seconds)
+        if self.fails:
+            raise ConnectionError("no network")
+        return Response(
+            [
+                dict(
+                    translation=f"{data['query']} by {self.name}",
+                    quality=self.quality,
+                    service_name=self.name,
+                )
+            ]
+        )
+
+
+def test_returns_as_soon_as_a_good_translation_arrives():
+    orchestrator = TranslationOrchestrator(
+        [
+            FakeTranslator("slow and good", 95, 1),
+            FakeTranslator("fast and bad", 60, 0),
+            FakeTranslator("fast and good", 80, 0.1),
+        ],
+    )
+    everything = []
+    all_done = threading.Event()
+
+    def when_all_done(results):
+        everything.extend(results)
+        all_done.set()
+
+    start = time.monotonic()
+    results = orchestrator.translate(dict(query="Hund"), when_all_done=when_all_done)
+
+    assert time.monotonic() - start < 0.9
+    assert [name for name, _ in results] == ["fast and bad", "fast and good"]
+
+    assert all_done.wait(2)
+    assert len(everything) == 3
+    assert orchestrator.stats()["slow and good"]["count"] == 1
+
+
+def test_slow_and_failing_translators_are_not_waited_for():
+    orchestrator = TranslationOrchestrator(
+        [
+            FakeTranslator("too slow", 95, 1),
+            FakeTranslator("failing", 95, 0, fails=True),
+            FakeTranslator("bad", 60, 0),
+        ],
+        timeouts={"too slow": 0.2},
+    )
+
+    start = time.monotonic()
+    results = orchestrator.translate(dict(query="Hund"))
+
+    assert time.monotonic() - start < 0.9
+    assert sorted(name for name, _ in results) == ["bad", "failing"]
+    assert dict(results)["failing"] is None
+
+    stats = orchestrator.stats()
+    assert stats["too slow"]["timeouts"] == 1
+    assert stats["failing"]["errors"] == 1
+    assert stats["bad"]["buckets"]["0.1"] == 1
+
+    # the late answer was already counted as a timeout
+    time.sleep(1)
+    assert orchestrator.stats()["too slow"]["count"] == 0
+
+
+def test_excluded_services_are_not_asked():
+    orchestrator = TranslationOrchestrator(
+        [FakeTranslator("one", 95, 0), FakeTranslator("other", 95, 0)]
+    )
+
+    results = orchestrator.translate(dict(query="Hund"), exclude_services=["one"])
+
+    assert [name for name, _ in results] == ["other"]
+
+
+def test_late_translation_is_waited_for_when_there_is_no_other():
+    slow = FakeTranslator("slow", 95, 0.5)
+    orchestrator = TranslationOrchestrator(
+        [slow, FakeTranslator("failing", 95, 0, fails=True)],
+        timeouts={"slow": 0.2},
+    )
+
+    results = orchestrator.translate(dict(query="Hund"))
+
+    assert sorted(name for name, _ in results) == ["failing", "slow"]
+    assert orchestrator.stats()["slow"]["timeouts"] == 1
+
+
+def test_time_of_a_service_starts_when_it_is_asked():
+    # with one thread, the second service waits for the first one
+    orchestrator = TranslationOrchestrator(
+        [FakeTranslator("first", 60, 0.3), FakeTranslator("second", 60, 0.3)],
+        timeout=0.5,
+        max_workers=1,
+    )
+
+    results = orchestrator.translate(dict(query="Hund"))
+
+    assert sorted(name for name, _ in results) == ["first", "second"]
+    assert orchestrator.stats()["second"]["timeouts"] == 0
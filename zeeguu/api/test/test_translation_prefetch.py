@@ -0,0 +1,134 @@
+from zeeguu.api.utils.translation_cache import TranslationCache
+from zeeguu.api.utils.translation_prefetch import (
+    PrefetchBudget,
+    RedisBudgetStore,
+    SqliteBudgetStore,
+    likely_clicked_words,
+    sentence_text,
+)
+
+
+def _sentence(paragraph_i, sent_i, *words):
+    tokens = [
+        dict(text=w, has_space=True, paragraph_i=paragraph_i, sent_i=sent_i)
+        for w in words
+    ]
+    tokens[-1]["has_space"] = False
+    return tokens + [
+        dict(
+            text=".",
+            is_punct=True,
+            has_space=False,
+            paragraph_i=paragraph_i,
+            sent_i=sent_i,
+        )
+    ]
+
+
+PARAGRAPHS = [
+    [_sentence(0, 0, "Der", "Schmetterling", "fliegt", "über", "den", "Garten")],
+    [
+        _sentence(1, 1, "Das", "Haus", "ist", "alt"),
+        _sentence(1, 2, "Die", "Eichhörnchen", "sammeln", "Nüsse"),
+    ],
+]
+
+
+def test_sentence_is_the_context_of_the_words():
+    assert (
+        sentence_text(PARAGRAPHS[0][0]) == "Der Schmetterling fliegt über den Garten."
+    )
+
+
+def test_rare_words_of_every_paragraph_are_predicted():
+    words = likely_clicked_words(PARAGRAPHS, "de", 3.4, set(), 1)
+
+    assert [w for w, _, _ in words] == ["Schmetterling", "Eichhörnchen"]
+    assert words[1][1] == "Die Eichhörnchen sammeln Nüsse."
+    assert words[1][2] == (1, 2)
+
+
+def test_known_and_translated_words_are_not_predicted():
+    beginner = likely_clicked_words(PARAGRAPHS, "de", 0, set(), 10)
+    advanced = likely_clicked_words(PARAGRAPHS, "de", 10, set(), 10)
+    assert "Haus" not in [w for w, _, _ in beginner]
+    assert len(advanced) < len(beginner)
+
+    translated = likely_clicked_words(PARAGRAPHS, "de", 0, {"schmetterling"}, 10)
+    assert "Schmetterling" not in [w for w, _, _ in translated]
+
+
+def test_budget_is_per_user():
+    budget = PrefetchBudget(10, period=60)
+
+    assert budget.take(1, 8) == 8
+    assert budget.take(1, 8) == 2
+    assert budget.take(1, 8) == 0
+    assert budget.take(2, 8) == 8
+
+
+def test_prefetched_words_are_found_by_what_the_reader_sends():
+    word, _, (paragraph_i, sent_i) = likely_clicked_words(
+        PARAGRAPHS, "de", 3.4, set(), 1
+    )[1]
+    prefetched = TranslationCache.position_key(
+        42, paragraph_i, sent_i, word, "de", "en"
+    )
+
+    # the form of /get_one_translation, with a context that is not the
+    # whole sentence
+    form = dict(
+        word="Eichhörnchen",
+        context="Eichhörnchen sammeln",
+        articleID="42",
+        c_paragraph_i="1",
+        c_sent_i="2",
+        c_token_i="1",
+        left_ellipsis="true",
+    )
+    clicked = TranslationCache.position_key(
+        form["articleID"],
+        form["c_paragraph_i"],
+        form["c_sent_i"],
+        form["word"],
+        "de",
+        "en",
+    )
+
+    assert clicked == prefetched
+    assert TranslationCache.position_key(None, "1", "2", word, "de", "en") is None
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, value, ex=None, nx=False):
+        if not (nx and key in self.values):
+            self.values[key] = int(value)
+
+    def incrby(self, key, amount):
+        self.values[key] = self.values.get(key, 0) + amount
+        return self.values[key]
+
+    def decrby(self, key, amount):
+        return self.incrby(key, -amount)
+
+    def ttl(self, key):
+        return 60
+
+    def expire(self, key, seconds):
+        pass
+
+
+def test_processes_share_the_budget_through_the_store(tmp_path):
+    for store in [
+        SqliteBudgetStore(str(tmp_path / "budget")),
+        RedisBudgetStore(FakeRedis()),
+    ]:
+        one_worker = PrefetchBudget(10, store=store)
+        another_worker = PrefetchBudget(10, store=store)
+
+        assert one_worker.take(1, 8) == 8
+        assert another_worker.take(1, 8) == 2
+        assert another_worker.take(2, 8) == 8
@@ -1,9 +1,12 @@
 import decimal
 import json
+import uuid
 from datetime import datetime, date
 
 import flask
 
+from zeeguu.core.util.encoding import RawJSON
+
 
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, o):
@@ -19,6 +22,20 @@ class DateTimeEncoder(json.JSONEncoder):
 
 
 def json_result(dictionary):
-    stringified = json.dumps(dictionary, cls=DateTimeEncoder)
+    # RawJSON values are encoded as unique placeholder strings which are
+    # then replaced by their JSON text
+    raw_values = []
+    placeholder = uuid.uuid4().hex
+
+    class Encoder(DateTimeEncoder):
+        def default(self, o):
+            if isinstance(o, RawJSON):
+                raw_values.append(o.json)
+                return f"{placeholder}{len(raw_values) - 1}"
+            return DateTimeEncoder.default(self, o)
+
+    stringified = json.dumps(dictionary, cls=Encoder)
+    for i, raw in enumerate(raw_values):
+        stringified = stringified.replace(f'"{placeholder}{i}"', raw, 1)
     resp = flask.Response(stringified, status=200, mimetype="application/json")
     return resp
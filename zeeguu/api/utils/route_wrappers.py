@@ -4,12 +4,28 @@ from werkzeug.exceptions import BadRequestKeyError
 
 from zeeguu.logging import log
 from zeeguu.core.model.session import Session
+from zeeguu.api.utils.session_cache import SessionCache, session_store_from_url
 
-from datetime import datetime, timedelta
 import zeeguu
 
-SESSION_CACHE = {}
-SESSION_CACHE_TIMEOUT = 60  # Seconds
+SESSION_CACHE = SessionCache()
+
+
+def configure_session_cache(config):
+    """
+    - SESSION_CACHE_MAX_SIZE: how many sessions a process remembers
+    (default: 10000)
+    - SESSION_CACHE_TIMEOUT: for how many seconds (default: 60)
+    - SESSION_CACHE_STORE: sqlite:///path or redis://host:port/db, shared
+    by the processes so that they don't all look up the same sessions
+    (default: none)
+    """
+    store_url = config.get("SESSION_CACHE_STORE", None)
+    SESSION_CACHE.configure(
+        config.get("SESSION_CACHE_MAX_SIZE", SessionCache.DEFAULT_MAX_SIZE),
+        config.get("SESSION_CACHE_TIMEOUT", SessionCache.DEFAULT_TIMEOUT),
+        session_store_from_url(store_url) if store_url else None,
+    )
 
 
 def requires_session(view):
@@ -27,14 +43,8 @@ def requires_session(view):
         print("--> /" + view.__name__)
         try:
             session_uuid = flask.request.args["session"]
-            user_id, session_expiry_time = SESSION_CACHE.get(
-                session_uuid,
-                (
-                    None,
-                    None,
-                ),
-            )
-            if session_expiry_time is None or datetime.now() > session_expiry_time:
+            user_id = SESSION_CACHE.get(session_uuid)
+            if user_id is None:
                 from zeeguu.api.endpoints.sessions import (
                     is_session_too_old,
                     force_user_to_relog,
@@ -48,10 +58,7 @@ def requires_session(view):
                     force_user_to_relog(session_object)
                     flask.abort(401)
                 user_id = session_object.user_id
-                SESSION_CACHE[session_uuid] = (
-                    user_id,
-                    datetime.now() + timedelta(0, SESSION_CACHE_TIMEOUT),
-                )
+                SESSION_CACHE.set(session_uuid, user_id)
 
             flask.g.user_id = user_id
             flask.g.session_uuid = session_uuid
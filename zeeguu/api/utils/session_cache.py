@@ -0,0 +1,216 @@
+"""
+
+Remembers for a little while which user a session belongs to, so that
+requires_session does not have to look the session up in the DB on
+every request.
+
+Every process keeps a small LRU cache; optionally, the processes share a
+second level store (a sqlite file for the workers of one machine, or a
+Redis server for several machines), so that a session looked up by one
+worker does not have to be looked up again by all the others.
+
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from zeeguu.logging import warning
+
+
+class SqliteStore:
+    """
+    A sqlite file shared by the workers of one machine; SCHEMA creates
+    the table of the store, if it's not there yet.
+    """
+
+    SCHEMA = None
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._connection().execute(self.SCHEMA)
+
+    def _connection(self):
+        # a connection per thread, and never one opened before a fork
+        if getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=1, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+
+class SqliteSessionStore(SqliteStore):
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS session_cache "
+        "(uuid TEXT PRIMARY KEY, user_id INTEGER, expires REAL)"
+    )
+
+    def get(self, uuid):
+        row = (
+            self._connection()
+            .execute(
+                "SELECT user_id FROM session_cache WHERE uuid = ? AND expires > ?",
+                (uuid, time.time()),
+            )
+            .fetchone()
+        )
+        return row[0] if row else None
+
+    def set(self, uuid, user_id, timeout):
+        connection = self._connection()
+        now = time.time()
+        connection.execute(
+            "INSERT OR REPLACE INTO session_cache VALUES (?, ?, ?)",
+            (uuid, user_id, now + timeout),
+        )
+        connection.execute("DELETE FROM session_cache WHERE expires <= ?", (now,))
+
+    def delete(self, uuid):
+        self._connection().execute("DELETE FROM session_cache WHERE uuid = ?", (uuid,))
+
+
+class RedisSessionStore:
+    """
+    Works with a redis.Redis client, or with anything else that has
+    its get, set (with ex) and delete.
+    """
+
+    KEY_PREFIX = "zeeguu_session:"
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, uuid):
+        user_id = self.client.get(self.KEY_PREFIX + uuid)
+        return int(user_id) if user_id is not None else None
+
+    def set(self, uuid, user_id, timeout):
+        self.client.set(self.KEY_PREFIX + uuid, user_id, ex=int(timeout))
+
+    def delete(self, uuid):
+        self.client.delete(self.KEY_PREFIX + uuid)
+
+
+def session_store_from_url(url):
+    """
+    sqlite:///path/to/file or redis://host:port/db
+    """
+    if url.startswith("sqlite:///"):
+        return SqliteSessionStore(url[len("sqlite:///") :])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        import redis
+
+        return RedisSessionStore(redis.Redis.from_url(url))
+    raise ValueError(f"Unknown session cache store: {url}")
+
+
+class SessionCache:
+    """
+    Maps session uuids to user ids for timeout seconds.
+
+    At most max_size sessions are kept in the memory of the process;
+    when there's no more room, the least recently used one is dropped.
+    """
+
+    DEFAULT_MAX_SIZE = 10000
+    DEFAULT_TIMEOUT = 60  # Seconds
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, timeout=DEFAULT_TIMEOUT):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.store = None
+
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_size=DEFAULT_MAX_SIZE, timeout=DEFAULT_TIMEOUT, store=None):
+        with self._lock:
+            self.max_size = max_size
+            self.timeout = timeout
+            self.store = store
+            self._sessions.clear()
+
+    def get(self, uuid):
+        """
+        :return: the id of the user of the session, or None if we
+        have to look the session up in the DB
+        """
+        now = time.monotonic()
+        with self._lock:
+            user_id, expires = self._sessions.get(uuid, (None, None))
+            if expires is not None and now < expires:
+                self.hits += 1
+                self._sessions.move_to_end(uuid)
+                return user_id
+            self._sessions.pop(uuid, None)
+
+        user_id = self._from_store(uuid)
+
+        with self._lock:
+            if user_id is None:
+                self.misses += 1
+                return None
+            self.store_hits += 1
+            self._remember(uuid, user_id, now)
+            return user_id
+
+    def set(self, uuid, user_id):
+        with self._lock:
+            self._remember(uuid, user_id, time.monotonic())
+        if self.store is not None:
+            try:
+                self.store.set(uuid, user_id, self.timeout)
+            except Exception as e:
+                warning(f"Could not save session in the session cache store: {e}")
+
+    def invalidate(self, uuid):
+        with self._lock:
+            self._sessions.pop(uuid, None)
+        if self.store is not None:
+            try:
+                self.store.delete(uuid)
+            except Exception as e:
+                warning(f"Could not remove session from the session cache store: {e}")
+
+    def _from_store(self, uuid):
+        if self.store is None:
+            return None
+        try:
+            return self.store.get(uuid)
+        except Exception as e:
+            # the DB still knows
+            warning(f"Could not read from the session cache store: {e}")
+            return None
+
+    def _remember(self, uuid, user_id, now):
+        # must be called with self._lock held
+        self._sessions[uuid] = (user_id, now + self.timeout)
+        self._sessions.move_to_end(uuid)
+        while len(self._sessions) > max(self.max_size, 1):
+            self._sessions.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                size=len(self._sessions),
+                max_size=self.max_size,
+                timeout=self.timeout,
+                store=type(self.store).__name__ if self.store else None,
+                hits=self.hits,
+                store_hits=self.store_hits,
+                misses=self.misses,
+                evictions=self.evictions,
+            )
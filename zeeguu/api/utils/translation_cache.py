@@ -0,0 +1,119 @@
+"""
+
+Remembers what the translators said about a word in a context, for all
+the users: the students of a class read the same articles and click on
+the same words, so without it we would ask the translators the same
+question again and again.
+
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from zeeguu.core.util import text_hash
+
+
+class TranslationCache:
+    """
+    Maps (word, context, from language, to language) to the best
+    translation of the translators for timeout seconds.
+
+    At most max_size translations are kept; when there's no more room,
+    the least recently used one is dropped.
+    """
+
+    DEFAULT_MAX_SIZE = 20000
+    DEFAULT_TIMEOUT = 24 * 60 * 60  # Seconds
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, timeout=DEFAULT_TIMEOUT):
+        self.max_size = max_size
+        self.timeout = timeout
+
+        self._translations = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(word, context, from_lang_code, to_lang_code):
+        return word, text_hash(context), from_lang_code, to_lang_code
+
+    @staticmethod
+    def position_key(
+        article_id, paragraph_i, sentence_i, word, from_lang_code, to_lang_code
+    ):
+        """
+        The key of a word in a sentence of an article, as the reader sends
+        it when the word is clicked (articleID, c_paragraph_i, c_sent_i);
+        the translations prefetched for an article are remembered by it.
+
+        :return: None if the position is not known
+        """
+        try:
+            position = int(article_id), int(paragraph_i), int(sentence_i)
+        except (TypeError, ValueError):
+            return None
+        return position + (word, from_lang_code, to_lang_code)
+
+    def get(self, key):
+        """
+        :return: dictionary with the translation, likelihood and source,
+        or None if the translators have to be asked
+        """
+        with self._lock:
+            translation, expires = self._translations.get(key, (None, None))
+            if expires is None or time.monotonic() >= expires:
+                self._translations.pop(key, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._translations.move_to_end(key)
+            return dict(translation)
+
+    def set(self, key, translation):
+        with self._lock:
+            self._translations[key] = (
+                dict(translation),
+                time.monotonic() + self.timeout,
+            )
+            self._translations.move_to_end(key)
+            while len(self._translations) > max(self.max_size, 1):
+                self._translations.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key):
+        with self._lock:
+            _, expires = self._translations.get(key, (None, None))
+            return expires is not None and time.monotonic() < expires
+
+    def __len__(self):
+        return len(self._translations)
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                size=len(self._translations),
+                max_size=self.max_size,
+                timeout=self.timeout,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+            )
+
+
+def best_translation(translations):
+    """
+    :return: what the cache remembers about the first (i.e. best) of the
+    translations of a TranslationResponse
+    """
+    return dict(
+        translation=translations[0]["translation"],
+        likelihood=translations[0]["quality"],
+        source=translations[0]["service_name"],
+    )
+
+
+TRANSLATION_CACHE = TranslationCache()
@@ -0,0 +1,245 @@
+"""
+
+Asks several translation services at the same time and answers as soon
+as one of them gives a good enough translation, instead of waiting for
+the slowest one: the translation of a clicked word is what the reader
+waits for most often.
+
+The services that did not answer yet keep working in the background;
+whoever asked can be told when all of them are done (e.g. to cache the
+best of all the translations). If none of the services has a translation
+by its timeout, the ones still working are waited for a while longer
+instead of being asked again.
+
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from zeeguu.logging import log, warning
+
+DEFAULT_TIMEOUT = 3  # Seconds
+# how long a translation is waited for at most, when none of the services
+# had one by its timeout
+DEFAULT_GIVE_UP_TIMEOUT = 10  # Seconds
+# how often the deadlines of the services are checked while some of them
+# are still queued for a thread
+QUEUED_POLL_INTERVAL = 0.1  # Seconds
+# the translations with context of Google have 95 and of Microsoft 80
+DEFAULT_GOOD_ENOUGH_QUALITY = 80
+
+# upper bounds (in seconds) of the buckets of the latency histograms
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2, 5, float("inf")]
+
+
+class ServiceLatency:
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total_seconds = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def record(self, seconds):
+        self.count += 1
+        self.total_seconds += seconds
+        for i, upper_bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= upper_bound:
+                self.buckets[i] += 1
+                break
+
+    def as_dictionary(self):
+        return dict(
+            count=self.count,
+            average_seconds=self.total_seconds / self.count if self.count else None,
+            buckets={str(b): n for b, n in zip(LATENCY_BUCKETS, self.buckets)},
+            timeouts=self.timeouts,
+            errors=self.errors,
+        )
+
+
+def _has_translations(response):
+    return response is not None and bool(response.translations)
+
+
+def _quality(response):
+    if not _has_translations(response):
+        return 0
+    return max(t.get("quality", 0) for t in response.translations)
+
+
+class TranslationOrchestrator:
+    """
+    services are objects with a name and a get_result(data) that returns
+    a TranslationResponse, or None if they have no translation.
+
+    timeouts maps the name of a service to how long we wait for it at
+    most; the others get the default timeout. The time of a service starts
+    when a thread starts asking it: under load, the calls can be queued
+    behind those of other translations, which keep running after their
+    translate() returned.
+    """
+
+    def __init__(
+        self,
+        services,
+        timeout=DEFAULT_TIMEOUT,
+        timeouts=None,
+        good_enough_quality=DEFAULT_GOOD_ENOUGH_QUALITY,
+        give_up_timeout=DEFAULT_GIVE_UP_TIMEOUT,
+        max_workers=16,
+    ):
+        self.services = services
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.give_up_timeout = give_up_timeout
+        self.good_enough_quality = good_enough_quality
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="translator"
+        )
+        self._lock = threading.Lock()
+        self.latencies = {service.name: ServiceLatency() for service in services}
+
+    def translate(self, data, exclude_services=(), when_all_done=None):
+        """
+        :return: list of (service name, TranslationResponse) with the
+        answers that arrived before a good enough one did, or before the
+        services timed out (if none of them had a translation by then, until
+        the first late translation, or give_up_timeout); the answers of the
+        services without a translation are None
+
+        when_all_done, if given, is called (in a background thread) with
+        the list of the answers of all the services once they all answered
+        """
+        services = [s for s in self.services if s.name not in exclude_services]
+        if not services:
+            return []
+
+        start = time.monotonic()
+        give_up_at = start + self.give_up_timeout
+        # every answer counts either as a timeout or as a latency sample,
+        # whichever happens first
+        calls = {
+            service.name: dict(
+                service=service.name, started=None, finished=False, timed_out=False
+            )
+            for service in services
+        }
+        futures = {
+            self.executor.submit(self._ask, service, data, calls[service.name]): service
+            for service in services
+        }
+
+        def deadline(future):
+            service = futures[future]
+            started = calls[service.name]["started"]
+            if started is None:
+                # still queued for a thread
+                return give_up_at
+            return min(
+                started + self.timeouts.get(service.name, self.timeout), give_up_at
+            )
+
+        if when_all_done:
+            self._when_all_done(futures, when_all_done)
+
+        results = []
+        pending = set(futures)
+        timed_out = set()
+        while pending:
+            now = time.monotonic()
+            if now >= give_up_at:
+                break
+            for future in pending - timed_out:
+                if deadline(future) <= now and self._timed_out(
+                    calls[futures[future].name]
+                ):
+                    timed_out.add(future)
+
+            # the services that timed out are only waited for (until
+            # give_up_at) if none of the others had a translation
+            waiting_for = pending
+            if any(_has_translations(response) for _, response in results):
+                waiting_for = pending - timed_out
+            if not waiting_for:
+                break
+
+            wake_up_at = min([give_up_at] + [deadline(f) for f in pending - timed_out])
+            if any(calls[futures[f].name]["started"] is None for f in pending):
+                wake_up_at = min(wake_up_at, now + QUEUED_POLL_INTERVAL)
+            done, _ = wait(
+                waiting_for,
+                timeout=max(wake_up_at - now, 0),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                pending.discard(future)
+                response = future.result()
+                results.append((futures[future].name, response))
+                if _quality(response) >= self.good_enough_quality:
+                    log(
+                        f"{futures[future].name} answered in "
+                        f"{time.monotonic() - start:.2f}s; not waiting for the others"
+                    )
+                    return results
+
+        return results
+
+    def _ask(self, service, data, call):
+        started = time.monotonic()
+        call["started"] = started
+        try:
+            response = service.get_result(data)
+        except Exception as e:
+            warning(f"Translation service {service.name} failed: {e}")
+            response = None
+            failed = True
+        else:
+            failed = False
+
+        with self._lock:
+            if not call["timed_out"]:
+                call["finished"] = True
+                if failed:
+                    self.latencies[service.name].errors += 1
+                else:
+                    self.latencies[service.name].record(time.monotonic() - started)
+        return response
+
+    def _timed_out(self, call):
+        """
+        :return: False if the service answered just in time after all
+        """
+        with self._lock:
+            if call["finished"]:
+                return False
+            call["timed_out"] = True
+            self.latencies[call["service"]].timeouts += 1
+            return True
+
+    def _when_all_done(self, futures, callback):
+        remaining = [len(futures)]
+        results = []
+
+        def one_done(future):
+            with self._lock:
+                results.append((futures[future].name, future.result()))
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                callback(results)
+            except Exception as e:
+                warning(f"Failed to process all the translations: {e}")
+
+        for future in futures:
+            future.add_done_callback(one_done)
+
+    def stats(self):
+        with self._lock:
+            return {
+                name: latency.as_dictionary()
+                for name, latency in self.latencies.items()
+            }
@@ -0,0 +1,403 @@
+"""
+
+Translates ahead of time the words that a reader is likely to click in
+an article they just opened, so that when they click one of them the
+translation comes from the TRANSLATION_CACHE instead of the translators.
+
+The likely clicked words of a paragraph are the rarest of its words that
+are still in the wordstats lists of the language (the words that are
+not, are mostly names and numbers) and that are beyond the vocabulary of
+a reader of the level of the user; the words that the user already
+translated are skipped: they come from their own past translations.
+
+The words are translated with the sentence they are in as context, and
+only in the background; opening the article does not wait for them. The
+translations are remembered by the position of the word in the article
+(see TranslationCache.position_key), which is what the reader sends when
+the word is clicked: the context it sends can be a different part of the
+text than the tokenized sentence.
+
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from string import punctuation
+
+from zeeguu.api.utils.session_cache import SqliteStore
+from zeeguu.api.utils.translation_cache import TRANSLATION_CACHE, best_translation
+from zeeguu.core.word_stats import UNKNOWN_WORD_RANK, ranks_for
+from zeeguu.logging import log, warning
+
+punctuation_extended = "»«" + punctuation
+
+DEFAULT_WORDS_PER_PARAGRAPH = 3
+DEFAULT_MAX_WORDS_PER_ARTICLE = 30
+DEFAULT_MAX_WORDS_PER_USER = 200
+BUDGET_PERIOD = 60 * 60  # Seconds
+
+# a reader of difficulty level 0 knows about the 500 most frequent words,
+# and the vocabulary doubles with every CEFR level (1.7 difficulty levels,
+# see CEFR_TO_DIFFICULTY_MAPPING): 1000 words at the end of A1,
+# 16000 at the end of C1
+WORDS_KNOWN_AT_LEVEL_0 = 500
+DIFFICULTY_LEVELS_PER_CEFR_LEVEL = 1.7
+
+
+def known_vocabulary_size(level):
+    return int(WORDS_KNOWN_AT_LEVEL_0 * 2 ** (level / DIFFICULTY_LEVELS_PER_CEFR_LEVEL))
+
+
+def sentence_text(sentence):
+    """
+    The text of a tokenized sentence, as the reader sends it as the
+    context of a clicked word
+    """
+    return "".join(
+        token["text"] + (" " if token.get("has_space", True) else "")
+        for token in sentence
+    ).strip()
+
+
+def likely_clicked_words(
+    tokenized_paragraphs, lang_code, level, translated_words, words_per_paragraph
+):
+    """
+    :param tokenized_paragraphs: paragraphs of sentences of token
+    dictionaries, as in the article_info
+    :param level: difficulty level of the reader, from 0 to 10
+    :param translated_words: the words (lowercase) that the reader
+    already translated in this language
+
+    :return: list of (word, sentence, position) with at most
+    words_per_paragraph words for every paragraph, the likeliest to be
+    clicked first; position is the (paragraph_i, sent_i) of the sentence
+    """
+    occurrences = []
+    for paragraph in tokenized_paragraphs:
+        occurrences.append(
+            [
+                (
+                    token["text"].strip(punctuation_extended),
+                    sentence_text(sentence),
+                    (token.get("paragraph_i"), token.get("sent_i")),
+                )
+                for sentence in paragraph
+                for token in sentence
+                if _could_be_clicked(token)
+            ]
+        )
+
+    ranks = ranks_for(
+        [word for paragraph in occurrences for word, _, _ in paragraph], lang_code
+    )
+    vocabulary_size = known_vocabulary_size(level)
+
+    per_paragraph = []
+    for paragraph in occurrences:
+        candidates = {}
+        for word, sentence, position in paragraph:
+            rank = ranks[word].rank
+            if (
+                vocabulary_size < rank < UNKNOWN_WORD_RANK
+                and word.lower() not in translated_words
+                and word.lower() not in candidates
+            ):
+                candidates[word.lower()] = (rank, word, sentence, position)
+        # (the positions can't be compared)
+        rarest_first = sorted(
+            candidates.values(), key=lambda candidate: candidate[:2], reverse=True
+        )
+        per_paragraph.append(
+            [
+                (word, sentence, position)
+                for _, word, sentence, position in rarest_first
+            ][:words_per_paragraph]
+        )
+
+    # the words of the first paragraphs are the first to be clicked
+    return [each for paragraph in per_paragraph for each in paragraph]
+
+
+def _could_be_clicked(token):
+    return (
+        token["text"].strip(punctuation_extended)
+        and not token.get("is_punct")
+        and not token.get("is_symbol")
+        and not token.get("is_like_num")
+        and not token.get("is_like_email")
+        and not token.get("is_like_url")
+        and token.get("pos") != "PROPN"
+    )
+
+
+class SqliteBudgetStore(SqliteStore):
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS prefetch_budget "
+        "(user_id INTEGER PRIMARY KEY, spent INTEGER, period_end REAL)"
+    )
+
+    def take(self, user_id, count, max_words, period):
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT spent, period_end FROM prefetch_budget WHERE user_id = ?",
+                (user_id,),
+            ).fetchone()
+            spent, period_end = row if row and row[1] > now else (0, now + period)
+
+            granted = max(min(count, max_words - spent), 0)
+            connection.execute(
+                "INSERT OR REPLACE INTO prefetch_budget VALUES (?, ?, ?)",
+                (user_id, spent + granted, period_end),
+            )
+            connection.execute(
+                "DELETE FROM prefetch_budget WHERE period_end <= ?", (now,)
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return granted
+
+
+class RedisBudgetStore:
+    """
+    Works with a redis.Redis client, or with anything else that has its
+    set (with ex and nx), incrby, decrby, ttl and expire.
+    """
+
+    KEY_PREFIX = "zeeguu_prefetch_budget:"
+
+    def __init__(self, client):
+        self.client = client
+
+    def take(self, user_id, count, max_words, period):
+        key = self.KEY_PREFIX + str(user_id)
+        self.client.set(key, 0, ex=int(period), nx=True)
+        spent = self.client.incrby(key, count)
+        if self.client.ttl(key) < 0:
+            # it expired right before incrby
+            self.client.expire(key, int(period))
+
+        granted = max(min(count, max_words - (spent - count)), 0)
+        if granted < count:
+            self.client.decrby(key, count - granted)
+        return granted
+
+
+def budget_store_from_url(url):
+    """
+    sqlite:///path/to/file or redis://host:port/db
+    """
+    if url.startswith("sqlite:///"):
+        return SqliteBudgetStore(url[len("sqlite:///") :])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        import redis
+
+        return RedisBudgetStore(redis.Redis.from_url(url))
+    raise ValueError(f"Unknown prefetch budget store: {url}")
+
+
+class PrefetchBudget:
+    """
+    How many words are translated ahead of time for every user, at most
+    max_words every period seconds: the translators are paid by the word.
+
+    Without a store, every process counts on its own, so a user can get
+    max_words from every worker; with a store (see budget_store_from_url)
+    the processes share the count.
+    """
+
+    def __init__(self, max_words, period=BUDGET_PERIOD, store=None):
+        self.max_words = max_words
+        self.period = period
+        self.store = store
+
+        self._spent = {}
+        self._lock = threading.Lock()
+
+    def take(self, user_id, count):
+        """
+        :return: how many of the count words can be translated
+        """
+        if self.store is not None:
+            try:
+                return self.store.take(user_id, count, self.max_words, self.period)
+            except Exception as e:
+                warning(f"Could not use the prefetch budget store: {e}")
+
+        now = time.monotonic()
+        with self._lock:
+            spent, period_end = self._spent.get(user_id, (0, None))
+            if period_end is None or now >= period_end:
+                spent, period_end = 0, now + self.period
+                # forget the users whose period is over
+                self._spent = {
+                    u: entry for u, entry in self._spent.items() if entry[1] > now
+                }
+
+            granted = max(min(count, self.max_words - spent), 0)
+            self._spent[user_id] = (spent + granted, period_end)
+            return granted
+
+
+class TranslationPrefetcher:
+    """
+    Off unless configured; see configure_translation_prefetch
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.words_per_paragraph = DEFAULT_WORDS_PER_PARAGRAPH
+        self.max_words_per_article = DEFAULT_MAX_WORDS_PER_ARTICLE
+        self.budget = PrefetchBudget(DEFAULT_MAX_WORDS_PER_USER)
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="translation_prefetch"
+        )
+
+        self.prefetched = 0
+        self.already_cached = 0
+        self.failed = 0
+
+    def configure(
+        self,
+        enabled,
+        words_per_paragraph,
+        max_words_per_article,
+        max_words_per_user,
+        budget_store=None,
+    ):
+        self.enabled = enabled
+        self.words_per_paragraph = words_per_paragraph
+        self.max_words_per_article = max_words_per_article
+        self.budget = PrefetchBudget(max_words_per_user, store=budget_store)
+
+    def prefetch_for(self, user, article, tokenized_paragraphs):
+        """
+        Picks the words of the article that the user is likely to click
+        and has them translated in the background.
+
+        :param tokenized_paragraphs: the RawJSON of the tokenized
+        paragraphs, as in the article_info
+
+        :return: how many words are going to be translated
+        """
+        if not self.enabled:
+            return 0
+
+        try:
+            return self._prefetch_for(user, article, tokenized_paragraphs)
+        except Exception as e:
+            # the article is what the reader is waiting for
+            warning(f"Failed to prefetch translations for article {article.id}: {e}")
+            return 0
+
+    def _prefetch_for(self, user, article, tokenized_paragraphs):
+        from_lang_code = article.language.code
+        to_lang_code = user.native_language.code
+        level_min, _ = user.levels_for(article.language)
+        words = likely_clicked_words(
+            tokenized_paragraphs.value,
+            from_lang_code,
+            level_min,
+            _translated_words(user, article.language),
+            self.words_per_paragraph,
+        )
+
+        to_translate = []
+        for word, sentence, (paragraph_i, sent_i) in words[
+            : self.max_words_per_article
+        ]:
+            key = TRANSLATION_CACHE.position_key(
+                article.id, paragraph_i, sent_i, word, from_lang_code, to_lang_code
+            )
+            if key is not None and key not in TRANSLATION_CACHE:
+                to_translate.append((key, word, sentence))
+        to_translate = to_translate[: self.budget.take(user.id, len(to_translate))]
+
+        for key, word, sentence in to_translate:
+            self.executor.submit(
+                self._translate, key, word, sentence, from_lang_code, to_lang_code
+            )
+        log(f"Prefetching {len(to_translate)} translations for article {article.id}")
+        return len(to_translate)
+
+    def _translate(self, key, word, context, from_lang_code, to_lang_code):
+        from python_translators.translation_query import TranslationQuery
+
+        from zeeguu.api.utils.translator import get_best_results
+
+        if key in TRANSLATION_CACHE:
+            # the article was opened again in the meantime
+            self.already_cached += 1
+            return
+
+        try:
+            translations = get_best_results(
+                {
+                    "from_lang_code": from_lang_code,
+                    "to_lang_code": to_lang_code,
+                    "word": word,
+                    "query": TranslationQuery.for_word_occurrence(word, context, 1, 7),
+                    "context": context,
+                }
+            ).translations
+        except Exception as e:
+            self.failed += 1
+            warning(f"Failed to prefetch the translation of {word}: {e}")
+            return
+
+        if translations and key not in TRANSLATION_CACHE:
+            TRANSLATION_CACHE.set(key, best_translation(translations))
+            self.prefetched += 1
+
+    def stats(self):
+        return dict(
+            enabled=self.enabled,
+            prefetched=self.prefetched,
+            already_cached=self.already_cached,
+            failed=self.failed,
+        )
+
+
+def _translated_words(user, language):
+    from zeeguu.core.model import Bookmark, UserWord, db
+
+    return {
+        word.lower()
+        for (word,) in db.session.query(UserWord.word)
+        .join(Bookmark, Bookmark.origin_id == UserWord.id)
+        .filter(Bookmark.user_id == user.id)
+        .filter(UserWord.language_id == language.id)
+        .distinct()
+    }
+
+
+TRANSLATION_PREFETCHER = TranslationPrefetcher()
+
+
+def configure_translation_prefetch(config):
+    """
+    - PREFETCH_TRANSLATIONS: whether to translate ahead of time the words
+    that the readers are likely to click in the articles they open
+    (default: False)
+    - PREFETCH_WORDS_PER_PARAGRAPH: (default: 3)
+    - PREFETCH_MAX_WORDS_PER_ARTICLE: (default: 30)
+    - PREFETCH_MAX_WORDS_PER_USER: per hour, in every process unless
+    there's a PREFETCH_BUDGET_STORE (default: 200)
+    - PREFETCH_BUDGET_STORE: sqlite:///path or redis://host:port/db, shared
+    by the processes so that the budget of a user is the same for all of
+    them (default: none)
+    """
+    store_url = config.get("PREFETCH_BUDGET_STORE", None)
+    TRANSLATION_PREFETCHER.configure(
+        config.get("PREFETCH_TRANSLATIONS", False),
+        config.get("PREFETCH_WORDS_PER_PARAGRAPH", DEFAULT_WORDS_PER_PARAGRAPH),
+        config.get("PREFETCH_MAX_WORDS_PER_ARTICLE", DEFAULT_MAX_WORDS_PER_ARTICLE),
+        config.get("PREFETCH_MAX_WORDS_PER_USER", DEFAULT_MAX_WORDS_PER_USER),
+        budget_store_from_url(store_url) if store_url else None,
+    )
@@ -2,6 +2,7 @@ import json
 import os
 
 from zeeguu.logging import log
+from zeeguu.api.utils.translation_orchestrator import TranslationOrchestrator
 
 from apimux.api_base import BaseThirdPartyAPIService
 from apimux.mux import APIMultiplexer
@@ -48,9 +49,9 @@ class WordnikTranslate(BaseThirdPartyAPIService):
             target_language=data["target_language"],
         )
         lang_config["key"] = get_key_from_config(self._key_envvar_name)
-        self._translator = WordnikTranslator(**lang_config)
-        self._translator.quality = 90
-        response = self._translator.translate(data["query"])
+        translator = WordnikTranslator(**lang_config)
+        translator.quality = 90
+        response = translator.translate(data["query"])
         if len(response.translations) == 0:
             return None
         return response
@@ -66,9 +67,9 @@ class GoogleTranslateWithContext(BaseThirdPartyAPIService):
             target_language=data["target_language"],
         )
         # Google Translator WITH context
-        self._translator = GoogleTranslatorFactory.build_with_context(**lang_config)
-        self._translator.quality = 95
-        response = self._translator.translate(data["query"])
+        translator = GoogleTranslatorFactory.build_with_context(**lang_config)
+        translator.quality = 95
+        response = translator.translate(data["query"])
         if len(response.translations) == 0:
             return None
         return response
@@ -86,9 +87,9 @@ class GoogleTranslateWithoutContext(BaseThirdPartyAPIService):
             target_language=data["target_language"],
         )
         # Google Translator WITHOUT context
-        self._translator = GoogleTranslatorFactory.build_contextless(**lang_config)
-        self._translator.quality = 70
-        response = self._translator.translate(data["query"])
+        translator = GoogleTranslatorFactory.build_contextless(**lang_config)
+        translator.quality = 70
+        response = translator.translate(data["query"])
         if len(response.translations) == 0:
             return None
         return response
@@ -106,9 +107,9 @@ class MicrosoftTranslateWithContext(BaseThirdPartyAPIService):
             target_language=data["target_language"],
         )
         # Microsoft Translator WITH context
-        self._translator = MicrosoftTranslatorFactory.build_with_context(**lang_config)
-        self._translator.quality = 80
-        response = self._translator.translate(data["query"])
+        translator = MicrosoftTranslatorFactory.build_with_context(**lang_config)
+        translator.quality = 80
+        response = translator.translate(data["query"])
         if len(response.translations) == 0:
             return None
         return response
@@ -126,23 +127,25 @@ class MicrosoftTranslateWithoutContext(BaseThirdPartyAPIService):
             target_language=data["target_language"],
         )
         # Microsoft Translator WITHOUT context
-        self._translator = MicrosoftTranslatorFactory.build_contextless(**lang_config)
-        self._translator.quality = 60
-        response = self._translator.translate(data["query"])
+        translator = MicrosoftTranslatorFactory.build_contextless(**lang_config)
+        translator.quality = 60
+        response = translator.translate(data["query"])
         if len(response.translations) == 0:
             return None
         return response
 
 
+translators = [
+    GoogleTranslateWithContext(),
+    GoogleTranslateWithoutContext(),
+    MicrosoftTranslateWithContext(),
+    MicrosoftTranslateWithoutContext(),
+]
 api_mux_translators = APIMultiplexer(
-    api_list=[
-        GoogleTranslateWithContext(),
-        GoogleTranslateWithoutContext(),
-        MicrosoftTranslateWithContext(),
-        MicrosoftTranslateWithoutContext(),
-    ],
+    api_list=translators,
     config_filepath=os.environ.get("API_MUX_CONFIG__TRANSLATORS", ""),
 )
+translation_orchestrator = TranslationOrchestrator(translators)
 
 wordnik_api_keys = []
 for env_var_name in os.environ:
@@ -198,7 +201,41 @@ def get_next_results(
         "get_next_results Zeeguu-API - Got results: %s" % json_translator_results
     )
     logger.debug("get_next_results - exclude_services %s" % exclude_services)
-    # Returning data: [('GoogleTranslateWithContext',
+    return _merged_response(translator_results, exclude_results, translator_data)
+
+
+def get_best_results(data, when_all_done=None):
+    """
+    Like get_next_results, but instead of waiting for all the translators
+    it returns as soon as one of them has a good enough translation.
+
+    when_all_done, if given, is called in the background with the
+    response of get_next_results once all the translators answered.
+    """
+    if data["from_lang_code"] == data["to_lang_code"] == "en":
+        response = get_next_results(data, number_of_results=1)
+        if when_all_done:
+            when_all_done(response)
+        return response
+
+    translator_data = {
+        "source_language": data["from_lang_code"],
+        "target_language": data["to_lang_code"],
+        "query": data["query"],
+    }
+
+    def all_done(results):
+        when_all_done(_merged_response(results, [], translator_data))
+
+    translator_results = translation_orchestrator.translate(
+        translator_data, when_all_done=all_done if when_all_done else None
+    )
+    log(f"Got results get_best_results: {translator_results}")
+    return _merged_response(translator_results, [], translator_data)
+
+
+def _merged_response(translator_results, exclude_results, translator_data):
+    # translator_results: [('GoogleTranslateWithContext',
     #                   <python_translators.translation_response.TranslationResponse>), ...]
     translations = []
     for service_name, translation in translator_results:
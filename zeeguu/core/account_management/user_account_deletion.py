@@ -25,6 +25,7 @@ from zeeguu.core.model import (
     UserArticle,
     UserReadingSession,
     UserExerciseSession,
+    UserActivityDailyRollup,
 )
 from zeeguu.core.model import Article
 
@@ -38,6 +39,7 @@ tables_to_modify = [
     UserArticle,
     UserReadingSession,
     UserExerciseSession,
+    UserActivityDailyRollup,
     StarredArticle,
     ArticleDifficultyFeedback,
     PersonalCopy,
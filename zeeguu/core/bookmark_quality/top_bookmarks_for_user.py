@@ -1,14 +1,10 @@
 import zeeguu.core
-from wordstats import Word
 from zeeguu.core.bookmark_quality import quality_top_bookmark
 
 
 def top_bookmarks(self, count=50):
     from zeeguu.core.model import Bookmark, UserWord
 
-    def rank(b):
-        return Word.stats(b.origin.word, b.origin.language.code).rank
-
     query = zeeguu.core.model.db.session.query(Bookmark)
     all_bookmarks = (
         query.join(UserWord, Bookmark.origin_id == UserWord.id)
@@ -23,7 +19,11 @@ def top_bookmarks(self, count=50):
         each for each in all_bookmarks if quality_top_bookmark(each)
     ]
 
-    sorted_bookmarks = sorted(single_word_bookmarks, key=lambda b: rank(b))
+    ranks = Bookmark._word_ranks(single_word_bookmarks)
+    sorted_bookmarks = sorted(
+        single_word_bookmarks,
+        key=lambda b: ranks[b.origin.language.code][b.origin.word].rank,
+    )
     sorted_bookmarks = sorted_bookmarks[:count]
 
     return sorted_bookmarks
@@ -7,7 +7,6 @@
 
 """
 
-from elasticsearch import Elasticsearch
 from elasticsearch_dsl import Search, Q, SF
 from pprint import pprint
 
@@ -27,7 +26,9 @@ from zeeguu.core.elastic.elastic_query_builder import (
     build_elastic_more_like_this_query,
 )
 from zeeguu.core.util.timer_logging_decorator import time_this
-from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
+from zeeguu.core.elastic.settings import ES_ZINDEX
+from zeeguu.core.elastic.client import es_client
+from zeeguu.core.elastic.hits import articles_from_ES_hits
 
 
 def filter_hits_on_score(hits, score_threshold):
@@ -126,7 +127,7 @@ def article_recommendations_for_user(
         unwanted_user_searches,
     ) = _prepare_user_constraints(user)
 
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
 
     # build the query using elastic_query_builder
     query_body = build_elastic_recommender_query(
@@ -147,7 +148,7 @@ def article_recommendations_for_user(
     res = es.search(index=ES_ZINDEX, body=query_body)
 
     hit_list = res["hits"].get("hits")
-    final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
+    final_article_mix.extend(articles_from_ES_hits(hit_list))
 
     # Get articles based on Search preferences
     articles_from_searches = []
@@ -212,12 +213,12 @@ def article_search_for_user(
         use_readability_priority,
     )
 
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
     res = es.search(index=ES_ZINDEX, body=query_body)
     hit_list = res["hits"].get("hits")
     if score_threshold > 0:
         hit_list = filter_hits_on_score(hit_list, score_threshold)
-    final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
+    final_article_mix.extend(articles_from_ES_hits(hit_list))
     final_articles = [a for a in final_article_mix if a is not None and not a.broken]
 
     return final_articles
@@ -233,7 +234,7 @@ def topic_filter_for_user(
     difficulty_level,
     topic,
 ):
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
 
     s = Search().query(Q("term", language=user.learned_language.code()))
 
@@ -277,7 +278,7 @@ def topic_filter_for_user(
 
     hit_list = res["hits"].get("hits")
 
-    final_article_mix = _to_articles_from_ES_hits(hit_list)
+    final_article_mix = articles_from_ES_hits(hit_list)
 
     return [a for a in final_article_mix if a is not None and not a.broken]
 
@@ -290,13 +291,6 @@ def _topics_to_string(input_list):
     return ",".join(input_list)
 
 
-def _to_articles_from_ES_hits(hits):
-    articles = []
-    for hit in hits:
-        articles.append(Article.find_by_id(hit.get("_id")))
-    return articles
-
-
 def _difficuty_level_bounds(level):
     lower_bounds = 1
     upper_bounds = 10
@@ -317,7 +311,7 @@ def __find_articles_like(
     article_age: int,
     language_id: int,
 ) -> "list[Article]":
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
     fields = ["content", "title"]
     language = Language.find_by_id(language_id)
     like_documents = [
@@ -332,7 +326,7 @@ def __find_articles_like(
     )
 
     res = es.search(index=ES_ZINDEX, body=mlt_query, size=limit)
-    articles = _to_articles_from_ES_hits(res["hits"]["hits"])
+    articles = articles_from_ES_hits(res["hits"]["hits"])
     articles = [a for a in articles if a.broken == 0]
     return articles
 
@@ -8,6 +8,7 @@
 
 import newspaper
 from collections import Counter
+from functools import lru_cache
 from time import time
 from pymysql import DataError
 
@@ -22,18 +23,22 @@ from zeeguu.core.content_cleaning import cleanup_text_w_crawl_report
 from zeeguu.core.emailer.zeeguu_mailer import ZeeguuMailer
 from zeeguu.core.model import Url, Feed, UrlKeyword, Topic
 from zeeguu.core.model.article_topic_map import TopicOriginType
+from zeeguu.core.util.http_session import http_session
 import requests
 
 from zeeguu.core.model.article import MAX_CHAR_COUNT_IN_SUMMARY
 
 from sentry_sdk import capture_exception as capture_to_sentry
-from zeeguu.core.elastic.indexing import index_in_elasticsearch
+from zeeguu.core.elastic.indexing import BulkIndexer
 
 from zeeguu.core.content_retriever import (
     readability_download_and_parse,
 )
+from zeeguu.core.content_retriever.image_size import image_size_from_header
 
 TIMEOUT_SECONDS = 10
+# at most this many articles of a feed are downloaded in a crawl
+DEFAULT_ARTICLES_PER_FEED = 1000
 
 
 import zeeguu
@@ -42,9 +47,10 @@ LOG_CONTEXT = "FEED RETRIEVAL"
 
 
 def _url_after_redirects(url):
-    # solve redirects and save the clean url
-    response = requests.get(url)
-    return response.url
+    # solve redirects and save the clean url; the body is not needed
+    # so it's not downloaded (stream) and the connection is released
+    with http_session().get(url, stream=True) as response:
+        return response.url
 
 
 def _date_in_the_future(time):
@@ -77,21 +83,57 @@ def banned_url(url):
     return False
 
 
+# Enough to read the size of any PNG / GIF / WebP and of all but the JPEGs
+# with a huge amount of metadata before the frame header
+MAX_BYTES_TO_PROBE_IMAGE = 64 * 1024
+MIN_IMAGE_SIDE = 300
+
+
+def _image_size_with_pil(data):
+    from PIL import Image
+    from io import BytesIO
+
+    with Image.open(BytesIO(data)) as im:
+        return im.size
+
+
+@lru_cache(maxsize=4096)
+def _image_is_large_enough(img_url):
+    """
+    Downloads only as much of the image as is needed to read its size.
+    If the size is not in the first bytes (e.g. a JPEG with lots of
+    metadata before the frame) the whole image is downloaded and read
+    with PIL.
+
+    Results are cached per url: feeds reuse the same images (e.g. logos)
+    for many articles. Network errors and images that PIL can't read
+    raise, so they are not cached.
+    """
+    header = b""
+    size = None
+    with http_session().get(img_url, stream=True) as response:
+        chunks = response.iter_content(chunk_size=4096)
+        for chunk in chunks:
+            header += chunk
+            size = image_size_from_header(header)
+            if size or len(header) >= MAX_BYTES_TO_PROBE_IMAGE:
+                break
+
+        if not size:
+            size = _image_size_with_pil(header + b"".join(chunks))
+
+    im_x, im_y = size
+    # Quality Check that the image is at least 300x300 ( not an icon )
+    if im_x < MIN_IMAGE_SIDE and im_y < MIN_IMAGE_SIDE:
+        print("Skipped image due to low resolution")
+        return False
+    return True
+
+
 def extract_article_image(np_article):
     if np_article.top_image != "":
-        # from https://stackoverflow.com/questions/7391945/how-do-i-read-image-data-from-a-url-in-python
-        from PIL import Image
-        import requests
-        from io import BytesIO
-
         try:
-            response = requests.get(np_article.top_image)
-            im = Image.open(BytesIO(response.content))
-            im_x, im_y = im.size
-            # Quality Check that the image is at least 300x300 ( not an icon )
-            if im_x < 300 and im_y < 300:
-                print("Skipped image due to low resolution")
-            else:
+            if _image_is_large_enough(np_article.top_image):
                 return np_article.top_image
         except Exception as e:
             print(f"Failed to parse image: '{e}'")
@@ -99,14 +141,46 @@ def extract_article_image(np_article):
         return ""
 
 
+def crawl_report_es_indexer(session, crawl_report):
+    """
+    A BulkIndexer that records the articles it fails to index in the crawl_report
+    """
+
+    def on_failure(article, error):
+        crawl_report.add_es_indexing_error(article.feed, article.url.as_string(), error)
+
+    return BulkIndexer(session, on_failure=on_failure)
+
+
 def download_from_feed(
-    feed: Feed, session, crawl_report, limit=1000, save_in_elastic=True
+    feed: Feed,
+    session,
+    crawl_report,
+    limit=DEFAULT_ARTICLES_PER_FEED,
+    save_in_elastic=True,
+    crawling_pool=None,
+    es_indexer=None,
+    seen_urls=None,
 ):
     """
 
     Session is needed because this saves stuff to the DB.
 
 
+    When a crawling_pool is given, the feed and its articles are downloaded
+    by the pool's threads (possibly while the previous feed is still being
+    processed); everything that touches the DB still happens here.
+
+
+    New articles are indexed in ES in batches by the es_indexer; if none is
+    given, the articles of this feed are indexed at the end of the feed.
+
+
+    seen_urls is the set of the urls of the feed items already handled in
+    this crawl (e.g. because another feed had them too); it is updated
+    with the items of this feed.
+
+
     last_crawled_time is useful because otherwise there would be a lot of time
     wasted trying to retrieve the same articles, especially the ones which
     can't be retrieved, so they won't be cached.
@@ -114,6 +188,11 @@ def download_from_feed(
 
     """
 
+    flush_es_indexer = False
+    if save_in_elastic and es_indexer is None:
+        es_indexer = crawl_report_es_indexer(session, crawl_report)
+        flush_es_indexer = True
+
     summary_stream = ""
     start_feed_time = time()
     downloaded = 0
@@ -129,7 +208,10 @@ def download_from_feed(
         log(f"LAST CRAWLED::: {last_retrieval_time_from_DB}")
 
     try:
-        items = feed.feed_items(last_retrieval_time_from_DB)
+        if crawling_pool:
+            items = crawling_pool.feed_items(feed, limit)
+        else:
+            items = feed.feed_items(last_retrieval_time_from_DB)
     except Exception as e:
         import traceback
 
@@ -137,10 +219,24 @@ def download_from_feed(
         capture_to_sentry(e)
         return ""
 
+    if feed.not_modified_since_last_crawl():
+        logp(f"*** Not modified since the last crawl: {feed.title}")
+        crawl_report.set_feed_not_modified(feed)
+        crawl_report.set_feed_crawl_time(feed, round(time() - start_feed_time, 2))
+        return ""
+
+    if seen_urls is None:
+        seen_urls = set()
+
+    # one query for all the items, instead of one or more for each of them
+    urls_in_db = model.Article.urls_in_db(each["url"] for each in items)
+
+    reached_limit = False
     skipped_already_in_db = 0
     for feed_item in items:
 
         if downloaded >= limit:
+            reached_limit = True
             break
 
         feed_item_timestamp = feed_item["published_datetime"]
@@ -162,22 +258,35 @@ def download_from_feed(
             session.commit()
 
         logp(feed_item["url"])
-        # check if the article is already in the DB
-        art = model.Article.find(feed_item["url"])
-        if art:
+        if feed_item["url"] in seen_urls:
+            logp(" - Already seen in this crawl")
+            continue
+        seen_urls.add(feed_item["url"])
+
+        if feed_item["url"] in urls_in_db:
             skipped_already_in_db += 1
             logp(" - Already in DB")
             continue
 
+        prefetched = None
         try:
-            url = _url_after_redirects(feed_item["url"])
+            if crawling_pool:
+                prefetched = crawling_pool.fetched_item(feed, feed_item["url"])
+                url = prefetched.url
+            else:
+                url = _url_after_redirects(feed_item["url"])
 
-            # check if the article after resolving redirects is already in the DB
-            art = model.Article.find(url)
-            if art:
-                skipped_already_in_db += 1
-                logp(" - Already in DB")
-                continue
+            if url != feed_item["url"]:
+                if url in seen_urls:
+                    logp(" - Already seen in this crawl")
+                    continue
+                seen_urls.add(url)
+
+                # check if the article after resolving redirects is already in the DB
+                if model.Article.find(url):
+                    skipped_already_in_db += 1
+                    logp(" - Already in DB")
+                    continue
 
         except requests.exceptions.TooManyRedirects:
             raise Exception(f"- Too many redirects")
@@ -197,6 +306,7 @@ def download_from_feed(
                 feed_item,
                 url,
                 crawl_report,
+                prefetched,
             )
             # Politiken sometimes has titles that have
             # strange characters instead of å æ ø
@@ -210,7 +320,7 @@ def download_from_feed(
             downloaded += 1
             if save_in_elastic and not new_article.broken:
                 if new_article:
-                    index_in_elasticsearch(new_article, session)
+                    es_indexer.add(new_article)
 
             downloaded_titles.append(
                 new_article.title + " " + new_article.url.as_string()
@@ -225,11 +335,6 @@ def download_from_feed(
             skipped_due_to_low_quality += 1
             continue
 
-        except SkippedAlreadyInDB:
-            skipped_already_in_db += 1
-            logp(" - Already in DB")
-            continue
-
         except FailedToParseWithReadabilityServer as e:
             logp(f" - failed to parse with readability server (server said: {e})")
             continue
@@ -274,22 +379,38 @@ def download_from_feed(
     logp(f"*** Low Quality: {skipped_due_to_low_quality}")
     logp(f"*** Already in DB: {skipped_already_in_db}")
     logp(f"*** ")
+    if not reached_limit:
+        # the items we did not get to must not be skipped next time
+        feed.remember_feed_version()
+        session.add(feed)
     session.commit()
 
+    if flush_es_indexer:
+        es_indexer.flush()
+
+    if crawling_pool:
+        crawling_pool.done_with(feed)
+
     return summary_stream
 
 
-def download_feed_item(session, feed, feed_item, url, crawl_report):
+def download_feed_item(session, feed, feed_item, url, crawl_report, prefetched=None):
+    """
+    The caller makes sure that there is no article for the url yet.
+
+    prefetched is the FetchedFeedItem for the url if a CrawlingPool
+    already downloaded the article
+    """
     title = feed_item["title"]
 
     published_datetime = feed_item["published_datetime"]
 
-    art = model.Article.find(url)
-
-    if art:
-        raise SkippedAlreadyInDB()
-
-    np_article = readability_download_and_parse(url)
+    if prefetched:
+        if prefetched.error:
+            raise prefetched.error
+        np_article = prefetched.np_article
+    else:
+        np_article = readability_download_and_parse(url, feed_item.get("np_article"))
 
     is_quality_article, reason, code = sufficient_quality(
         np_article, feed.language.code
@@ -336,7 +457,10 @@ def download_feed_item(session, feed, feed_item, url, crawl_report):
         session.add(new_article)
         raise SkippedForLowQuality(reason)
 
-    img_url = extract_article_image(np_article)
+    if prefetched:
+        img_url = prefetched.img_url
+    else:
+        img_url = extract_article_image(np_article)
     if img_url != "":
         new_article.img_url = Url.find_or_create(session, img_url)
 
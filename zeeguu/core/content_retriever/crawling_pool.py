@@ -0,0 +1,210 @@
+"""
+
+Runs the network-bound part of crawling (listing feeds, resolving
+redirects, downloading and parsing articles, checking images) on a
+pool of threads, so that many feeds and articles can be fetched at
+the same time.
+
+Everything that touches the DB (and the CrawlReport) stays in the
+thread that created the pool: the worker threads only receive plain
+strings and only return plain python objects. The only exception is the
+check for the articles that are already in the DB while listing a feed,
+which the listing threads do with sessions of their own.
+
+"""
+
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from sqlalchemy.orm import Session
+
+from zeeguu.core.content_retriever import readability_download_and_parse
+from zeeguu.core.content_retriever.article_downloader import (
+    _date_in_the_future,
+    _url_after_redirects,
+    banned_url,
+    extract_article_image,
+)
+from zeeguu.core.model import Article, db
+from zeeguu.logging import log
+
+DEFAULT_MAX_REQUESTS_PER_DOMAIN = 2
+DEFAULT_SECONDS_BETWEEN_REQUESTS_PER_DOMAIN = 1.0
+
+
+class DomainPoliteness:
+    """
+    Limits how many requests go to the same domain at the same time
+    and how often a new request to that domain can be started.
+    """
+
+    def __init__(
+        self,
+        max_requests_per_domain=DEFAULT_MAX_REQUESTS_PER_DOMAIN,
+        seconds_between_requests=DEFAULT_SECONDS_BETWEEN_REQUESTS_PER_DOMAIN,
+    ):
+        self.max_requests_per_domain = max_requests_per_domain
+        self.seconds_between_requests = seconds_between_requests
+
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_request_time = {}
+
+    @contextmanager
+    def slot(self, url):
+        domain = urlparse(url).netloc.lower()
+
+        with self._lock:
+            semaphore = self._semaphores.setdefault(
+                domain, threading.Semaphore(self.max_requests_per_domain)
+            )
+
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_request_time.get(domain, now))
+                self._next_request_time[domain] = start + self.seconds_between_requests
+
+            if start > now:
+                time.sleep(start - now)
+
+            yield
+
+
+# url is the url after redirects; if downloading the article failed,
+# np_article is None and error is the exception that was raised
+FetchedFeedItem = namedtuple(
+    "FetchedFeedItem", ["url", "np_article", "img_url", "error"]
+)
+
+
+class CrawlingPool:
+    def __init__(
+        self,
+        workers,
+        max_requests_per_domain=DEFAULT_MAX_REQUESTS_PER_DOMAIN,
+        seconds_between_requests=DEFAULT_SECONDS_BETWEEN_REQUESTS_PER_DOMAIN,
+    ):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="crawler"
+        )
+        # listing a feed can take long (newspaper feeds download all their
+        # articles), so listings have their own threads: the items of the
+        # current feed never wait behind the listings of the next ones
+        self.listing_executor = ThreadPoolExecutor(
+            max_workers=max(workers // 2, 1), thread_name_prefix="feed_lister"
+        )
+        self.politeness = DomainPoliteness(
+            max_requests_per_domain, seconds_between_requests
+        )
+
+        # feed.id -> future of the feed candidates from the feed handler
+        self._listings = {}
+        # feed.id -> the feed items to download (or the exception we got)
+        self._feed_items = {}
+        # feed.id -> {feed item url: future of FetchedFeedItem}
+        self._fetched = {}
+
+    def shutdown(self):
+        self.listing_executor.shutdown(wait=False, cancel_futures=True)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def list_feeds(self, feeds):
+        """
+        Starts downloading the given feeds; call from the DB thread.
+        """
+        for feed in feeds:
+            if feed.id in self._listings or feed.id in self._feed_items:
+                continue
+            feed.initializeFeedHandler()
+            self._listings[feed.id] = self.listing_executor.submit(
+                self._list_feed, feed.feed_handler, db.engine
+            )
+
+    def _list_feed(self, feed_handler, engine):
+        # like Feed.feed_items, newspaper feeds don't download the
+        # articles that are already in the DB
+        with Session(engine) as session, self.politeness.slot(feed_handler.url):
+            return feed_handler.get_feed_articles(
+                urls_to_skip=lambda urls: Article.urls_in_db(urls, session)
+            )
+
+    def prefetch(self, feed, seen_urls=(), limit=None):
+        """
+        Starts fetching the articles of the feed that are not in the DB yet
+        and not among the seen_urls, at most limit of them (the others are
+        fetched when they are asked for); call from the DB thread. Errors
+        are kept until feed_items is called.
+        """
+        if feed.id in self._feed_items:
+            return
+
+        try:
+            self.list_feeds([feed])
+            candidates = self._listings.pop(feed.id).result()
+            items = feed.feed_items(feed.last_crawled_time, candidates)
+        except Exception as e:
+            self._feed_items[feed.id] = e
+            return
+
+        self._feed_items[feed.id] = items
+        urls_in_db = Article.urls_in_db(each["url"] for each in items)
+        to_fetch = [
+            each
+            for each in items
+            if not _date_in_the_future(each["published_datetime"])
+            and each["url"] not in urls_in_db
+            and each["url"] not in seen_urls
+        ]
+        self._fetched[feed.id] = {
+            each["url"]: self.executor.submit(
+                self._fetch_item, each["url"], each.get("np_article")
+            )
+            for each in to_fetch[:limit]
+        }
+        log(f"*** Prefetching {len(self._fetched[feed.id])} items of {feed.title}")
+
+    def feed_items(self, feed, limit=None):
+        """
+        The items of the feed newer than its last_crawled_time, like
+        Feed.feed_items; raises whatever listing the feed raised.
+        """
+        self.prefetch(feed, limit=limit)
+        items = self._feed_items[feed.id]
+        if isinstance(items, Exception):
+            raise items
+        return items
+
+    def fetched_item(self, feed, url):
+        """
+        Returns the FetchedFeedItem for the url; raises if the
+        redirects of the url could not be resolved.
+        """
+        future = self._fetched.get(feed.id, {}).pop(url, None)
+        if future is None:
+            future = self.executor.submit(self._fetch_item, url)
+        return future.result()
+
+    def done_with(self, feed):
+        self._feed_items.pop(feed.id, None)
+        for future in self._fetched.pop(feed.id, {}).values():
+            future.cancel()
+
+    def _fetch_item(self, feed_item_url, np_article=None):
+        with self.politeness.slot(feed_item_url):
+            url = _url_after_redirects(feed_item_url)
+
+        if banned_url(url):
+            return FetchedFeedItem(url, None, "", None)
+
+        try:
+            with self.politeness.slot(url):
+                np_article = readability_download_and_parse(url, np_article)
+            img_url = extract_article_image(np_article)
+            return FetchedFeedItem(url, np_article, img_url, None)
+        except Exception as e:
+            return FetchedFeedItem(url, None, "", e)
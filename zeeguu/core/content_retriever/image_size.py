@@ -0,0 +1,80 @@
+"""
+
+Reads the size of an image from the first bytes of its file, so we
+don't have to download and decode the whole image to find out if
+it's big enough to be shown with an article.
+
+"""
+
+import struct
+
+# JPEG start-of-frame markers (the ones that give the size of the image);
+# C4, C8 and CC are other kinds of segments
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7}
+_JPEG_SOF_MARKERS |= {0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _png_size(data):
+    if len(data) >= 24 and data[12:16] == b"IHDR":
+        return struct.unpack(">II", data[16:24])
+
+
+def _gif_size(data):
+    if len(data) >= 10:
+        return struct.unpack("<HH", data[6:10])
+
+
+def _webp_size(data):
+    if len(data) < 30:
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and data[20] == 0x2F:
+        b = data[21:25]
+        width = 1 + (b[0] | (b[1] & 0x3F) << 8)
+        height = 1 + (b[1] >> 6 | b[2] << 2 | (b[3] & 0x0F) << 10)
+        return width, height
+    if chunk == b"VP8X":
+        width = 1 + int.from_bytes(data[24:27], "little")
+        height = 1 + int.from_bytes(data[27:30], "little")
+        return width, height
+
+
+def _jpeg_size(data):
+    i = 2
+    while i + 9 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            # padding
+            i += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", data[i + 5 : i + 9])
+            return width, height
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            # markers without a length
+            i += 2
+            continue
+        (segment_length,) = struct.unpack(">H", data[i + 2 : i + 4])
+        i += 2 + segment_length
+
+
+def image_size_from_header(data):
+    """
+    :param data: the first bytes of a PNG, GIF, WebP or JPEG file
+    :return: (width, height), or None if the format is not one of the
+    above or if the size is not within the given bytes
+    """
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return _png_size(data)
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return _gif_size(data)
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return _webp_size(data)
+    if data.startswith(b"\xff\xd8"):
+        return _jpeg_size(data)
+    return None
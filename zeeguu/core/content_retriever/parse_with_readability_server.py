@@ -2,22 +2,24 @@ import json
 
 import newspaper
 from langdetect import detect
-import requests
-
 from zeeguu.core.content_retriever.crawler_exceptions import (
     FailedToParseWithReadabilityServer,
 )
+from zeeguu.core.util.http_session import http_session
 
 READABILITY_SERVER_CLEANUP_URI = "http://readability_server:3456/cleanup?url="
 TIMEOUT_SECONDS = 20
 
 
-def download_and_parse(url, request_timeout=TIMEOUT_SECONDS):
-    # This code will be run twice when using a newspaper source
-    # Maybe add a flag to avoid running this if the feed type == newspaper
-    np_article = newspaper.Article(url=url)
-    np_article.download()
-    np_article.parse()
+def download_and_parse(url, request_timeout=TIMEOUT_SECONDS, np_article=None):
+    """
+    np_article is the newspaper Article of the url, if it was already
+    downloaded and parsed (e.g. by a NewspaperFeed while listing the feed)
+    """
+    if np_article is None:
+        np_article = newspaper.Article(url=url)
+        np_article.download()
+        np_article.parse()
 
     if np_article.text == "":
         # raise Exception("Newspaper got empty article from: " + url)
@@ -28,7 +30,9 @@ def download_and_parse(url, request_timeout=TIMEOUT_SECONDS):
     # Is there a timeout?
     # When using the tool to download articles, this got stuck
     # in this line of code.
-    result = requests.get(READABILITY_SERVER_CLEANUP_URI + url, timeout=request_timeout)
+    result = http_session().get(
+        READABILITY_SERVER_CLEANUP_URI + url, timeout=request_timeout
+    )
     if result.status_code == 500:
         raise FailedToParseWithReadabilityServer(result.text)
 
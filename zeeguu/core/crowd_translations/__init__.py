@@ -1,4 +1,6 @@
-from zeeguu.core.model import Language, Text, Bookmark
+from zeeguu.core.model import Language, Text, Bookmark, UserWord
+from zeeguu.core.model.bookmark import WordAlias
+from zeeguu.core.util import text_hash
 
 
 def get_own_past_translation(
@@ -7,18 +9,18 @@ def get_own_past_translation(
     to_language = Language.find(to_lang_code)
     from_language = Language.find(from_lang_code)
 
-    ocurrences_of_context = Text.find_all(context_str, from_language)
-    # might be occuring in different articles (very unlikely)
-    # but the text is the same;
-    # might have a translation in one of the articles, but
-    # not in the others...
-
-    for each_context in ocurrences_of_context:
-        for bookmark in Bookmark.find_all_for_text_and_user(each_context, user):
-            if (
-                    bookmark.origin.word == word
-                    and bookmark.translation.language == to_language
-            ):
-                return bookmark
-
-    return None
+    # the context might be occuring in different articles (very unlikely)
+    # but the text is the same; might have a translation in one of the
+    # articles, but not in the others... any of them will do
+    return (
+        Bookmark.query.join(Text, Bookmark.text_id == Text.id)
+        .join(UserWord, Bookmark.origin_id == UserWord.id)
+        .join(WordAlias, Bookmark.translation_id == WordAlias.id)
+        .filter(Bookmark.user_id == user.id)
+        .filter(Text.content_hash == text_hash(context_str))
+        .filter(Text.language_id == from_language.id)
+        .filter(UserWord.word == word)
+        .filter(WordAlias.language_id == to_language.id)
+        .order_by(Text.id, Bookmark.id)
+        .first()
+    )
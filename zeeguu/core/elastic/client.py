@@ -0,0 +1,42 @@
+from elasticsearch import Elasticsearch
+
+from zeeguu.core.elastic.settings import (
+    ES_CONN_STRING,
+    ES_CONNECTIONS_PER_NODE,
+    ES_REQUEST_TIMEOUT_SECONDS,
+    ES_MAX_RETRIES,
+    ES_SNIFF,
+)
+from zeeguu.core.util.per_process import PerProcessSingleton
+
+
+def _create_client():
+    sniffing = {}
+    if ES_SNIFF:
+        sniffing = dict(
+            sniff_on_start=True,
+            sniff_on_node_failure=True,
+            min_delay_between_sniffing=60,
+        )
+    return Elasticsearch(
+        ES_CONN_STRING,
+        connections_per_node=ES_CONNECTIONS_PER_NODE,
+        request_timeout=ES_REQUEST_TIMEOUT_SECONDS,
+        max_retries=ES_MAX_RETRIES,
+        retry_on_timeout=True,
+        **sniffing,
+    )
+
+
+_client = PerProcessSingleton(_create_client)
+
+
+def es_client():
+    """
+    The Elasticsearch client shared by everything in this process.
+
+    It's created the first time it's needed, and it keeps a pool of
+    connections open to ES, so requests don't pay for setting up a client
+    and a new connection every time.
+    """
+    return _client.get()
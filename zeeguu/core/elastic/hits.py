@@ -0,0 +1,9 @@
+from zeeguu.core.model import Article
+
+
+def articles_from_ES_hits(hits):
+    """
+    The articles of the hits, in the order of the hits, loaded with one query;
+    hits for articles that are not in the DB anymore or are broken are skipped
+    """
+    return Article.find_by_ids([hit.get("_id") for hit in hits])
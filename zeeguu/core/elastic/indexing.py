@@ -1,10 +1,26 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+
 from zeeguu.core.model import UrlKeyword, Topic
 from zeeguu.core.model.article_url_keyword_map import ArticleUrlKeywordMap
 from zeeguu.core.model.article_topic_map import TopicOriginType, ArticleTopicMap
 from zeeguu.core.model.difficulty_lingo_rank import DifficultyLingoRank
-from elasticsearch import Elasticsearch
-from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
-from zeeguu.core.semantic_vector_api import get_embedding_from_article
+from elasticsearch.helpers import bulk
+from zeeguu.core.elastic.client import es_client
+from zeeguu.core.elastic.settings import (
+    ES_ZINDEX,
+    ES_BULK_BATCH_SIZE,
+    ES_BULK_FLUSH_INTERVAL_SECONDS,
+)
+from zeeguu.core.semantic_vector_api import (
+    get_embedding_from_article,
+    get_embedding_from_text,
+)
+from zeeguu.logging import log
+
+# how many embeddings are requested at the same time when bulk indexing
+PARALLEL_EMBEDDING_REQUESTS = 8
 
 
 def find_topics(article_id, session):
@@ -39,16 +55,26 @@ def find_filter_url_keywords(article_id, session):
     return topic_kewyords
 
 
-def document_from_article(article, session, current_doc=None):
-    topics, topics_inferred = find_topics(article.id, session)
-    embedding_generation_required = current_doc is None
-    # Embeddings only need to be re-computed if the document
-    # doesn't exist or the text is updated.
-    # This is the most expensive operation in the indexing process, so it
-    # saves time by skipping it.
-    if current_doc is not None:
-        embedding_generation_required = current_doc["content"] != article.content
-    doc = {
+def find_topics_for_articles(article_ids, session):
+    """
+    Like find_topics, but for many articles with a single query;
+    returns {article_id: (article_topics, inferred_article_topics)}
+    """
+    topics = defaultdict(lambda: ([], []))
+    rows = (
+        session.query(ArticleTopicMap.article_id, ArticleTopicMap.origin_type, Topic)
+        .join(Topic, ArticleTopicMap.topic_id == Topic.id)
+        .filter(ArticleTopicMap.article_id.in_(article_ids))
+        .all()
+    )
+    for article_id, origin_type, topic in rows:
+        inferred = origin_type == TopicOriginType.INFERRED.value
+        topics[article_id][1 if inferred else 0].append(topic)
+    return topics
+
+
+def _document(article, topics, topics_inferred, lr_difficulty):
+    return {
         "title": article.title,
         "author": article.authors,
         "content": article.content,
@@ -62,10 +88,27 @@ def document_from_article(article, session, current_doc=None):
         "topics_inferred": [t.title for t in topics_inferred],
         "language": article.language.name,
         "fk_difficulty": article.fk_difficulty,
-        "lr_difficulty": DifficultyLingoRank.value_for_article(article),
+        "lr_difficulty": lr_difficulty,
         "url": article.url.as_string(),
         "video": article.video,
     }
+
+
+def document_from_article(article, session, current_doc=None):
+    topics, topics_inferred = find_topics(article.id, session)
+    embedding_generation_required = current_doc is None
+    # Embeddings only need to be re-computed if the document
+    # doesn't exist or the text is updated.
+    # This is the most expensive operation in the indexing process, so it
+    # saves time by skipping it.
+    if current_doc is not None:
+        embedding_generation_required = current_doc["content"] != article.content
+    doc = _document(
+        article,
+        topics,
+        topics_inferred,
+        DifficultyLingoRank.value_for_article(article),
+    )
     if not embedding_generation_required and current_doc is not None:
         doc["sem_vec"] = current_doc["sem_vec"]
     else:
@@ -74,7 +117,7 @@ def document_from_article(article, session, current_doc=None):
 
 
 def create_or_update(article, session):
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
     doc = document_from_article(article, session)
 
     if es.exists(index=ES_ZINDEX, id=article.id):
@@ -86,7 +129,7 @@ def create_or_update(article, session):
 
 
 def create_or_update_doc_for_bulk(article, session):
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
     doc_data = document_from_article(article, session)
     doc = {}
     doc["_id"] = article.id
@@ -112,7 +155,7 @@ def index_in_elasticsearch(new_article, session):
     # as ElasticSearch isn't persistent data
     """
     try:
-        es = Elasticsearch(ES_CONN_STRING)
+        es = es_client()
         doc = document_from_article(new_article, session)
         res = es.index(index=ES_ZINDEX, id=new_article.id, document=doc)
 
@@ -123,8 +166,133 @@ def index_in_elasticsearch(new_article, session):
 
 
 def remove_from_index(article):
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
     if es.exists(index=ES_ZINDEX, id=article.id):
         print("Found in ES Index")
         es.delete(index=ES_ZINDEX, id=article.id)
         print("After deletion from the index.")
+
+
+class BulkIndexer:
+    """
+    Collects articles and indexes them in ES in batches, with one bulk
+    request per batch instead of one request per article; the embeddings
+    of a batch are requested in parallel.
+
+    A batch is sent when batch_size articles are waiting or when
+    flush_interval_seconds passed since the last one was sent; call
+    flush() at the end to send what's left.
+
+    on_failure(article, error) is called for every article that could
+    not be indexed.
+    """
+
+    def __init__(
+        self,
+        session,
+        batch_size=ES_BULK_BATCH_SIZE,
+        flush_interval_seconds=ES_BULK_FLUSH_INTERVAL_SECONDS,
+        on_failure=None,
+    ):
+        self.session = session
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.on_failure = on_failure
+
+        self._pending = []
+        self._last_flush = time()
+
+        self.indexed = 0
+        self.failed = 0
+
+    def add(self, article):
+        self._pending.append(article)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def flush_if_due(self):
+        if self._pending and time() - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def _failed(self, article, error):
+        self.failed += 1
+        try:
+            log(f"Could not index article {article.id} in ES: {error}")
+            if self.on_failure:
+                self.on_failure(article, str(error))
+        except Exception as e:
+            # e.g. the article was rolled back after it was added
+            log(f"Could not index an article in ES: {error} ({e})")
+
+    def _documents(self, articles):
+        # the worker threads only get strings, no DB objects
+        texts = []
+        for article in list(articles):
+            try:
+                texts.append((article.content, article.language.name.lower()))
+            except Exception as e:
+                self._failed(article, e)
+                articles.remove(article)
+
+        ids = [a.id for a in articles]
+        topics = find_topics_for_articles(ids, self.session)
+        lr_difficulties = dict(
+            self.session.query(
+                DifficultyLingoRank.article_id, DifficultyLingoRank.difficulty
+            )
+            .filter(DifficultyLingoRank.article_id.in_(ids))
+            .all()
+        )
+
+        def embedding(text_and_language):
+            try:
+                return get_embedding_from_text(*text_and_language)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(PARALLEL_EMBEDDING_REQUESTS) as executor:
+            embeddings = list(executor.map(embedding, texts))
+
+        documents = {}
+        for article, sem_vec in zip(articles, embeddings):
+            if isinstance(sem_vec, Exception):
+                self._failed(article, sem_vec)
+                continue
+            try:
+                doc = _document(
+                    article,
+                    *topics[article.id],
+                    lr_difficulties.get(article.id),
+                )
+                doc["sem_vec"] = sem_vec
+                documents[article.id] = doc
+            except Exception as e:
+                self._failed(article, e)
+        return documents
+
+    def flush(self):
+        articles, self._pending = self._pending, []
+        self._last_flush = time()
+        if not articles:
+            return
+
+        documents = self._documents(articles)
+        by_id = {a.id: a for a in articles}
+
+        actions = [
+            {"_op_type": "index", "_index": ES_ZINDEX, "_id": id, "_source": doc}
+            for id, doc in documents.items()
+        ]
+        try:
+            indexed, errors = bulk(es_client(), actions, raise_on_error=False)
+        except Exception as e:
+            for id in documents:
+                self._failed(by_id[id], e)
+            return
+
+        self.indexed += indexed
+        for error in errors:
+            info = next(iter(error.values()))
+            self._failed(by_id[int(info["_id"])], info.get("error", info))
@@ -6,3 +6,19 @@ import os
 ES_CONN_STRING = os.environ.get("ZEEGUU_ES_CONN_STRING", "http://127.0.0.1:9200")
 # what index to use in elasticsearch
 ES_ZINDEX = "zeeguu"
+
+# when crawling, articles are indexed in batches of this size, or
+# every so many seconds, whichever comes first
+ES_BULK_BATCH_SIZE = int(os.environ.get("ZEEGUU_ES_BULK_BATCH_SIZE", 50))
+ES_BULK_FLUSH_INTERVAL_SECONDS = float(
+    os.environ.get("ZEEGUU_ES_BULK_FLUSH_INTERVAL_SECONDS", 60)
+)
+
+# the ES client that is shared by everything in a process (see client.py)
+ES_CONNECTIONS_PER_NODE = int(os.environ.get("ZEEGUU_ES_CONNECTIONS_PER_NODE", 10))
+ES_REQUEST_TIMEOUT_SECONDS = float(
+    os.environ.get("ZEEGUU_ES_REQUEST_TIMEOUT_SECONDS", 10)
+)
+ES_MAX_RETRIES = int(os.environ.get("ZEEGUU_ES_MAX_RETRIES", 2))
+# only makes sense with a cluster whose nodes can be reached from here
+ES_SNIFF = os.environ.get("ZEEGUU_ES_SNIFF", "false").lower() in ("1", "true", "yes")
@@ -1,11 +1,86 @@
 import random
+import threading
+from array import array
+from bisect import bisect_left
 
-from zeeguu.core.word_stats import lang_info
-from zeeguu.core.word_filter import (
-    BAD_WORD_LIST,
-    PROPER_NAMES_LIST,
-    remove_words_based_on_list,
-)
+from zeeguu.core.word_stats import UNKNOWN_WORD_RANK, rank_for, ranked_words
+from zeeguu.core.word_filter import BAD_WORD_LIST, PROPER_NAMES_LIST
+
+# the distractors are picked among the BAND_SIZE words closest in
+# frequency to the word the user has to practice...
+BAND_SIZE = 2000
+# ... preferably among those of about the same length
+MAX_LENGTH_DIFFERENCE = 2
+ATTEMPTS_PER_DISTRACTOR = 20
+
+
+class DistractorPool:
+    """
+    The words of a language that can be used as distractors, the most
+    frequent first: no bad words, no proper names, no one letter words.
+
+    Built once per language and process; after that, picking distractors
+    for a word takes a handful of random indices instead of going through
+    all the words of the language.
+    """
+
+    def __init__(self, lang_code):
+        self.words = []
+        self.ranks = array("l")
+        for word, rank in ranked_words(lang_code):
+            if (
+                len(word) > 1
+                and word not in BAD_WORD_LIST
+                and word not in PROPER_NAMES_LIST
+            ):
+                self.words.append(word)
+                self.ranks.append(rank)
+
+    def band(self, rank):
+        """
+        :return: (start, end) of the BAND_SIZE words closest to the rank;
+        the words that wordstats does not know get the rarest ones
+        """
+        if rank == UNKNOWN_WORD_RANK:
+            position = len(self.words)
+        else:
+            position = bisect_left(self.ranks, rank)
+        start = max(0, min(position - BAND_SIZE // 2, len(self.words) - BAND_SIZE))
+        return start, min(len(self.words), start + BAND_SIZE)
+
+    def sample(self, word, rank, count):
+        """
+        :return: count words of the band of the rank, other than word; fewer
+        if the band does not have that many
+        """
+        start, end = self.band(rank)
+        picked = []
+        attempts = count * ATTEMPTS_PER_DISTRACTOR if end > start else 0
+        for _ in range(attempts):
+            if len(picked) == count:
+                return picked
+            candidate = self.words[random.randrange(start, end)]
+            if (
+                candidate != word
+                and candidate not in picked
+                and abs(len(candidate) - len(word)) <= MAX_LENGTH_DIFFERENCE
+            ):
+                picked.append(candidate)
+
+        # not enough words of similar length; any word of the band will do
+        others = sorted(set(self.words[start:end]) - {word} - set(picked))
+        return picked + random.sample(others, min(count - len(picked), len(others)))
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def distractor_pool(lang_code):
+    with _pools_lock:
+        if lang_code not in _pools:
+            _pools[lang_code] = DistractorPool(lang_code)
+        return _pools[lang_code]
 
 
 def similar_words(word, language, user, number_of_words_to_return=2):
@@ -13,18 +88,13 @@ def similar_words(word, language, user, number_of_words_to_return=2):
     words_the_user_must_study = user.scheduled_bookmarks(10)
 
     if len(words_the_user_must_study) == 10:
-        candidates = [each.origin.word for each in words_the_user_must_study]
-    else:
-        candidates = lang_info(language.code).all_words()
-        candidates_filtered = remove_words_based_on_list(candidates, BAD_WORD_LIST)
-        candidates_filtered = remove_words_based_on_list(
-            candidates_filtered, PROPER_NAMES_LIST
+        candidates = list(
+            {each.origin.word for each in words_the_user_must_study} - {word}
         )
-        # Update candidates to be based on the filtered words.
-        candidates = [w for w in candidates_filtered if len(w) > 1]
-
-    random_sample = random.sample(candidates, number_of_words_to_return)
-    while word in random_sample:
-        random_sample = random.sample(candidates, number_of_words_to_return)
+        # the same word can be scheduled more than once
+        if len(candidates) >= number_of_words_to_return:
+            return random.sample(candidates, number_of_words_to_return)
 
-    return random_sample
+    return distractor_pool(language.code).sample(
+        word.lower(), rank_for(word, language.code).rank, number_of_words_to_return
+    )
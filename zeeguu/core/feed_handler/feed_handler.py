@@ -10,6 +10,14 @@ class FeedHandler:
         self.description = ""
         self.image_url_string = ""
 
+        # what the feed document looked like last time we downloaded it;
+        # handlers that can tell that it did not change since then set
+        # not_modified and return no articles
+        self.etag = None
+        self.last_modified = None
+        self.content_hash = None
+        self.not_modified = False
+
     def get_server_time(self, article_date) -> datetime:
         if type(article_date) is datetime:
             return normalize_to_server_time(article_date)
@@ -22,7 +30,7 @@ class FeedHandler:
         """
         NotImplementedError
 
-    def get_feed_articles(self) -> list[dict]:
+    def get_feed_articles(self, urls_to_skip=None) -> list[dict]:
         """
         Returns a list[dictionary] containing the following fields:
             title:str, the title of the article
@@ -31,5 +39,12 @@ class FeedHandler:
             summary:str, the summary of the article if available
             published:str, the date of the article as string
             published_datetime:datetime, date time of the article
+            np_article:newspaper.Article, the downloaded and parsed article,
+                only for the handlers that download the articles to list them
+
+        urls_to_skip is an optional function from a list of urls to the
+        set of those we are not interested in (e.g. the ones already in
+        the DB); handlers that download the articles to list them leave
+        these out.
         """
         NotImplementedError
@@ -23,7 +23,7 @@ class NewspaperFeed(FeedHandler):
         self.description = data.description
         self.image_url_string = data.favicon
 
-    def get_feed_articles(self) -> list[dict]:
+    def get_feed_articles(self, urls_to_skip=None) -> list[dict]:
         """
         Returns a list[dictionary] containing the following fields:
             title:str, the title of the article
@@ -31,6 +31,11 @@ class NewspaperFeed(FeedHandler):
             content:str, the content of the article
             summary:str, the summary of the article if available
             published_datetime:datetime, date time of the article
+            np_article:newspaper.Article, the downloaded and parsed article,
+                so that the crawler does not have to download it again
+
+        The articles whose urls are in urls_to_skip(urls) are not
+        downloaded and not returned.
         """
         print("Newspaper Built!")
         # Not sure if we should use cache (as currently the crawler checks if the article is in)
@@ -47,7 +52,14 @@ class NewspaperFeed(FeedHandler):
 
         feed_items = []
         log(f"** Articles in feed: {len(feed_data)}")
+        skipped_urls = (
+            urls_to_skip([article.url for article in feed_data])
+            if urls_to_skip
+            else set()
+        )
         for article in feed_data:
+            if article.url in skipped_urls:
+                continue
             try:
                 article.download()
                 article.parse()
@@ -59,6 +71,7 @@ class NewspaperFeed(FeedHandler):
                     content=article.text,
                     summary=article.summary,
                     published_datetime=publish_date,
+                    np_article=article,
                 )
                 feed_items.append(new_item_data_dict)
             except Exception as e:
@@ -1,8 +1,11 @@
+import hashlib
+
 import feedparser
 import requests
 
 from .feed_handler import FeedHandler
 from zeeguu.logging import log, logp
+from zeeguu.core.util.http_session import http_session
 
 
 class RSSFeed(FeedHandler):
@@ -31,7 +34,7 @@ class RSSFeed(FeedHandler):
         except:
             print("Could not find any image url.")
 
-    def get_feed_articles(self) -> list[dict]:
+    def get_feed_articles(self, urls_to_skip=None) -> list[dict]:
         """
         Returns a list[dictionary] containing the following fields:
             title:str, the title of the article
@@ -47,13 +50,36 @@ class RSSFeed(FeedHandler):
             "User-Agent": "Mozilla/5.0 (Windows NT 6.1; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/56.0.2924.76 Safari/537.36"
         }  # This is chrome, you can set whatever browser you like
 
+        # conditional GET: servers answer 304 if the feed did not change
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        self.not_modified = False
         feed_items = []
         try:
-            response = requests.get(
+            response = http_session().get(
                 self.url,
                 headers=headers,
                 timeout=(connect_timeout_seconds, read_timeout_seconds),
             )
+            if response.status_code == 304:
+                log(f"** Feed not modified since the last crawl")
+                self.not_modified = True
+                return feed_items
+
+            # not every server supports conditional GETs
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            if content_hash == self.content_hash:
+                log(f"** Feed identical to the one of the last crawl")
+                self.not_modified = True
+                return feed_items
+
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
+            self.content_hash = content_hash
+
             feed_data = feedparser.parse(response.text)
 
             log(f"** Articles in feed: {len(feed_data.entries)}")
@@ -1,3 +1,6 @@
+from collections import Counter, namedtuple
+from functools import lru_cache
+
 import nltk
 import pyphen
 from numpy import math
@@ -7,7 +10,25 @@ from zeeguu.core.language.difficulty_estimator_strategy import (
 )
 from zeeguu.core.util.text import split_words_from_text
 from zeeguu.core.model.language import Language
-from collections import Counter
+
+# distinct (language, word) pairs whose syllable count is remembered
+MAX_CACHED_SYLLABLE_COUNTS = 200_000
+
+TextStatistics = namedtuple(
+    "TextStatistics", ["number_of_words", "number_of_sentences", "number_of_syllables"]
+)
+
+
+@lru_cache(maxsize=None)
+def _hyphenator(language_code):
+    # pyphen can't hyphenate on 'no' - so we use 'nb' instead
+    code = "nb" if language_code == "no" else language_code
+    return pyphen.Pyphen(lang=code)
+
+
+@lru_cache(maxsize=MAX_CACHED_SYLLABLE_COUNTS)
+def _syllables_in_word(language_code, word):
+    return len(_hyphenator(language_code).positions(word)) + 1
 
 
 class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
@@ -32,7 +53,23 @@ class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
                     discrete: string [EASY, MEDIUM, HARD]
         """
         flesch_kincaid_index = cls.flesch_kincaid_readability_index(text, language)
+        return cls._difficulty_scores(flesch_kincaid_index)
+
+    @classmethod
+    def estimate_difficulties(cls, texts, language: "Language"):
+        """
+        Like estimate_difficulty, for many texts in the same language, e.g.
+        when recomputing the difficulties of all the articles in the DB
 
+        :return: list with the difficulty dictionary of each of the texts
+        """
+        return [
+            cls._difficulty_scores(cls.flesch_kincaid_readability_index(t, language))
+            for t in texts
+        ]
+
+    @classmethod
+    def _difficulty_scores(cls, flesch_kincaid_index):
         difficulty_scores = dict(
             normalized=cls.normalize_difficulty(flesch_kincaid_index),
             discrete=cls.discrete_difficulty(flesch_kincaid_index),
@@ -43,18 +80,30 @@ class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
         return difficulty_scores
 
     @classmethod
-    def flesch_kincaid_readability_index(cls, text: str, language: "Language"):
-        words = [w.lower() for w in split_words_from_text(text)]
+    def text_statistics(cls, text: str, language: "Language"):
+        """
+        Counts the words, sentences and syllables of the text; each distinct
+        word is hyphenated only once (and remembered for the next texts)
+        """
+        word_counts = Counter(w.lower() for w in split_words_from_text(text))
+        sentences = nltk.sent_tokenize(text)
 
         number_of_syllables = 0
-        number_of_words = len(words)
-        for word, freq in Counter(words).items():
+        for word, freq in word_counts.items():
             syllables_in_word = cls.estimate_number_of_syllables_in_word_pyphen(
                 word, language
             )
             number_of_syllables += syllables_in_word * freq
 
-        number_of_sentences = len(nltk.sent_tokenize(text))
+        return TextStatistics(
+            sum(word_counts.values()), len(sentences), number_of_syllables
+        )
+
+    @classmethod
+    def flesch_kincaid_readability_index(cls, text: str, language: "Language"):
+        number_of_words, number_of_sentences, number_of_syllables = cls.text_statistics(
+            text, language
+        )
 
         constants = cls.get_constants_for_language(language)
 
@@ -108,11 +157,7 @@ class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
                 syllables = len(word) / cls.AVERAGE_SYLLABLE_LENGTH
             return int(math.floor(syllables))  # Truncate the number of syllables
         else:
-            # pyphen can't hyphenate on 'no' - so we use 'nb' instead
-            code = "nb" if language.code == "no" else language.code
-            dic = pyphen.Pyphen(lang=code)
-            syllables = len(dic.positions(word)) + 1
-            return syllables
+            return _syllables_in_word(language.code, word)
 
     @classmethod
     def normalize_difficulty(cls, score: int):
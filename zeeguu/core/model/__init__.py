@@ -31,6 +31,7 @@ from .language import Language
 from .url import Url
 from .domain_name import DomainName
 from .article import Article
+from .article_tokenization_cache import ArticleTokenizationCache
 from .bookmark import Bookmark
 from .text import Text
 from .user_word import UserWord
@@ -76,6 +77,7 @@ from .topic_filter import TopicFilter
 
 from .user_reading_session import UserReadingSession
 from .user_exercise_session import UserExerciseSession
+from .user_activity_daily_rollup import UserActivityDailyRollup
 
 
 # bookmark scheduling
@@ -6,7 +6,7 @@ import time
 import sqlalchemy
 from langdetect import detect
 from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UnicodeText, Table
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship, backref, joinedload, selectinload
 from sqlalchemy.orm.exc import NoResultFound
 from zeeguu.core.model.article_topic_map import TopicOriginType
 
@@ -86,6 +86,14 @@ class Article(db.Model):
     topics = relationship("ArticleTopicMap", back_populates="article")
 
     url_keywords = relationship("ArticleUrlKeywordMap", back_populates="article")
+
+    # tokenized title and content; see ArticleTokenizationCache
+    tokenization_cache = relationship(
+        "ArticleTokenizationCache",
+        back_populates="article",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
     # Few words in an article is very often not an
     # actual article but the caption for a video / comic.
     # Or maybe an article that's behind a paywall and
@@ -190,6 +198,11 @@ class Article(db.Model):
         self.summary = content[:MAX_CHAR_COUNT_IN_SUMMARY]
 
         self.compute_fk_and_wordcount()
+        self.invalidate_tokenization_cache()
+
+    def invalidate_tokenization_cache(self):
+        # the cached entries are orphaned and thus deleted at the next flush
+        self.tokenization_cache = []
 
     def article_info(self, with_content=False):
         """
@@ -262,18 +275,21 @@ class Article(db.Model):
 
         if with_content:
             from zeeguu.core.tokenization import get_tokenizer, TOKENIZER_MODEL
+            from zeeguu.core.model.article_tokenization_cache import (
+                ArticleTokenizationCache,
+            )
 
             tokenizer = get_tokenizer(self.language, TOKENIZER_MODEL)
 
+            tokenized_paragraphs, tokenized_title = (
+                ArticleTokenizationCache.tokenize_article(self, tokenizer)
+            )
+
             result_dict["content"] = self.content
             result_dict["htmlContent"] = self.htmlContent
             result_dict["paragraphs"] = tokenizer.split_into_paragraphs(self.content)
-            result_dict["tokenized_paragraphs"] = tokenizer.tokenize_text(
-                self.content, flatten=False
-            )
-            result_dict["tokenized_title"] = tokenizer.tokenize_text(
-                self.title, flatten=False
-            )
+            result_dict["tokenized_paragraphs"] = tokenized_paragraphs
+            result_dict["tokenized_title"] = tokenized_title
 
         result_dict["has_uploader"] = True if self.uploader_id else False
 
@@ -367,6 +383,7 @@ class Article(db.Model):
         self.content = parsed.text
         self.htmlContent = parsed.htmlContent
         self.compute_fk_and_wordcount()
+        self.invalidate_tokenization_cache()
 
         from zeeguu.core.content_quality.quality_filter import (
             sufficient_quality_plain_text,
@@ -524,6 +541,36 @@ class Article(db.Model):
     def find_by_id(cls, id: int):
         return Article.query.filter(Article.id == id).first()
 
+    @classmethod
+    def find_by_ids(cls, ids, include_broken=False):
+        """
+        Loads the articles with one query, together with everything that
+        article_info needs (urls, feed, language, topics), so that listing
+        them doesn't run more queries per article.
+
+        :return: the articles in the order of the ids; ids that don't exist
+        (and broken articles, unless include_broken) are left out
+        """
+        from zeeguu.core.model import Url, Feed
+
+        ids = [int(each) for each in ids]
+        if not ids:
+            return []
+
+        query = cls.query.filter(cls.id.in_(ids)).options(
+            joinedload(cls.url).joinedload(Url.domain),
+            joinedload(cls.img_url).joinedload(Url.domain),
+            joinedload(cls.language),
+            joinedload(cls.feed).joinedload(Feed.image_url).joinedload(Url.domain),
+            selectinload(cls.topics).joinedload(ArticleTopicMap.topic),
+        )
+        by_id = {
+            article.id: article
+            for article in query.all()
+            if include_broken or not article.broken
+        }
+        return [by_id[id] for id in ids if id in by_id]
+
     @classmethod
     def uploaded_by(cls, uploader_id: int):
         return Article.query.filter(Article.uploader_id == uploader_id).all()
@@ -545,6 +592,35 @@ class Article(db.Model):
         except NoResultFound:
             return None
 
+    @classmethod
+    def urls_in_db(cls, urls, session=None):
+        """
+        Like find, but for many urls with a single query
+
+        :param session: to query with, instead of db.session (e.g. in a
+        thread without an app context)
+
+        :return: the set of the given urls for which there is an article
+        """
+        from zeeguu.core.model import Url, DomainName
+
+        urls = set(urls)
+        if not urls:
+            return set()
+
+        rows = (
+            (session or db.session)
+            .query(DomainName.domain_name, Url.path)
+            .join(Url, Url.domain_name_id == DomainName.id)
+            .join(cls, cls.url_id == Url.id)
+            .filter(DomainName.domain_name.in_({Url.get_domain(u) for u in urls}))
+            .filter(Url.path.in_({Url.get_path(u) for u in urls}))
+            .all()
+        )
+        found = {domain + path for domain, path in rows}
+
+        return {u for u in urls if Url.get_domain(u) + Url.get_path(u) in found}
+
     @classmethod
     def all_older_than(cls, days):
         import datetime
@@ -0,0 +1,154 @@
+import hashlib
+import zlib
+
+import sqlalchemy
+from sqlalchemy import Column, Integer, String, ForeignKey, LargeBinary
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.orm import Session, relationship
+
+from zeeguu.core.model.article import Article
+from zeeguu.core.util.encoding import RawJSON
+from zeeguu.logging import warning
+
+from zeeguu.core.model import db
+
+COMPRESSED_JSON = LargeBinary().with_variant(LONGBLOB, "mysql")
+
+
+class ArticleTokenizationCache(db.Model):
+    """
+    The tokenized title and content of an article, as sent to the reader.
+
+    Tokenizing an article with Stanza is the most expensive part of opening it,
+    and the text of an article hardly ever changes after crawling, so we
+    tokenize once and keep the result here.
+
+    An entry is only valid for the tokenizer model it was computed with and for
+    the exact text (language, title, content) that was tokenized; the
+    content_hash captures the latter. FORMAT_VERSION must be bumped whenever
+    the serialized form of the tokens changes so old entries get recomputed.
+    """
+
+    __tablename__ = "article_tokenization_cache"
+    __table_args__ = {"mysql_collate": "utf8_bin"}
+
+    FORMAT_VERSION = 1
+
+    article_id = Column(
+        Integer, ForeignKey(Article.id, ondelete="CASCADE"), primary_key=True
+    )
+    article = relationship(Article, back_populates="tokenization_cache")
+
+    tokenizer_model = Column(Integer, primary_key=True)
+    content_hash = Column(String(64))
+    format_version = Column(Integer)
+
+    tokenized_paragraphs = Column(COMPRESSED_JSON)
+    tokenized_title = Column(COMPRESSED_JSON)
+
+    def __init__(self, article_id, tokenizer_model, content_hash):
+        self.article_id = article_id
+        self.tokenizer_model = int(tokenizer_model)
+        self.content_hash = content_hash
+
+    def __repr__(self):
+        return f"<ArticleTokenizationCache {self.article_id} (model: {self.tokenizer_model})>"
+
+    @staticmethod
+    def _compress(tokens_json):
+        return zlib.compress(tokens_json.encode("utf-8"))
+
+    @staticmethod
+    def _decompress(blob):
+        return RawJSON(zlib.decompress(blob).decode("utf-8"))
+
+    @classmethod
+    def content_hash_for(cls, article):
+        # the tokenization depends on the language as well as on the text
+        language_code = article.language.code if article.language else ""
+        text = f"{language_code}\n{article.title or ''}\n{article.content or ''}"
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def is_valid_for(self, content_hash):
+        return (
+            self.content_hash == content_hash
+            and self.format_version == self.FORMAT_VERSION
+        )
+
+    def set_tokens(self, paragraphs_json, title_json):
+        self.format_version = self.FORMAT_VERSION
+        self.tokenized_paragraphs = self._compress(paragraphs_json)
+        self.tokenized_title = self._compress(title_json)
+
+    def get_tokens(self):
+        return (
+            self._decompress(self.tokenized_paragraphs),
+            self._decompress(self.tokenized_title),
+        )
+
+    @classmethod
+    def find(cls, article, tokenizer_model):
+        return cls.query.filter_by(
+            article_id=article.id, tokenizer_model=int(tokenizer_model)
+        ).first()
+
+    @classmethod
+    def tokenize_article(cls, article, tokenizer):
+        """
+        Returns (tokenized_paragraphs, tokenized_title) for the article,
+        running the tokenizer only if there is no valid cached entry. Both
+        are RawJSON: the tokens go to the reader without ever becoming
+        dictionaries.
+
+        Articles that are not saved yet (no id) are tokenized without caching.
+
+        The cache is read and written with sessions of its own: this is
+        called while serving GET requests, whose session may have changes
+        that are not ours to commit or roll back, and committing it would
+        also expire all the objects the request already loaded.
+        """
+        from zeeguu.core.tokenization.token import tokens_as_json
+
+        if article.id is None:
+            return tuple(
+                RawJSON(
+                    tokens_as_json(tokenizer.tokenize_text(text, False, flatten=False))
+                )
+                for text in (article.content, article.title)
+            )
+
+        key = (article.id, int(tokenizer.model_type))
+        content_hash = cls.content_hash_for(article)
+        with Session(db.engine) as session:
+            cached = session.get(cls, key)
+            if cached and cached.is_valid_for(content_hash):
+                return cached.get_tokens()
+
+        # Token objects are written to JSON directly; going through
+        # as_serializable_dictionary would build a dict for every token
+        paragraphs_json, title_json = [
+            tokens_as_json(tokenizer.tokenize_text(text, False, flatten=False))
+            for text in (article.content, article.title)
+        ]
+
+        with Session(db.engine) as session:
+            cached = session.get(cls, key)
+            if not cached:
+                cached = cls(article.id, tokenizer.model_type, content_hash)
+                session.add(cached)
+            cached.content_hash = content_hash
+            cached.set_tokens(paragraphs_json, title_json)
+            try:
+                session.commit()
+            except sqlalchemy.exc.IntegrityError:
+                # somebody else opened the article at the same time and
+                # saved the tokens first; theirs are just as good as ours
+                session.rollback()
+            except sqlalchemy.exc.DBAPIError as e:
+                # e.g. a lock wait timeout, because the caller's transaction
+                # changed the article and did not commit yet; the tokens
+                # are cached the next time
+                session.rollback()
+                warning(f"Could not cache the tokens of article {article.id}: {e}")
+
+        return RawJSON(paragraphs_json), RawJSON(title_json)
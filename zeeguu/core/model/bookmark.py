@@ -4,7 +4,6 @@ import sqlalchemy
 from sqlalchemy import Column, ForeignKey, Integer, Table
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm.exc import NoResultFound
-from wordstats import Word
 
 from zeeguu.logging import log
 from zeeguu.core.bookmark_quality.fit_for_study import fit_for_study
@@ -18,6 +17,7 @@ from zeeguu.core.model.text import Text
 from zeeguu.core.model.user import User
 from zeeguu.core.model.user_word import UserWord
 from zeeguu.core.util.encoding import datetime_to_json
+from zeeguu.core.word_stats import UNKNOWN_WORD_RANK, rank_for, ranks_for
 from zeeguu.core.model.learning_cycle import LearningCycle
 from zeeguu.core.model.bookmark_user_preference import UserWordExPreference
 
@@ -36,7 +36,11 @@ WordAlias = db.aliased(UserWord, name="translated_word")
 
 
 class Bookmark(db.Model):
-    __table_args__ = {"mysql_collate": "utf8_bin"}
+    __table_args__ = (
+        # to find the past translations of a user in a given context
+        db.Index("bookmark_user_text", "user_id", "text_id"),
+        {"mysql_collate": "utf8_bin"},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
 
@@ -277,6 +281,19 @@ class Bookmark(db.Model):
         if not with_exercise_info:
             return result
 
+        word_rank = rank_for(self.origin.word, self.origin.language.code)
+
+        try:
+            scheduler = self.get_scheduler()
+            bookmark_scheduler = scheduler.query.filter(
+                scheduler.bookmark_id == self.id
+            ).one()
+        except sqlalchemy.exc.NoResultFound:
+            bookmark_scheduler = None
+
+        return {**result, **self._exercise_info(word_rank, bookmark_scheduler)}
+
+    def _exercise_info(self, word_rank, bookmark_scheduler):
         try:
             translation_word = self.translation.word
             translation_language = self.translation.language.code
@@ -288,22 +305,15 @@ class Bookmark(db.Model):
             )
             print(str(e))
 
-        word_info = Word.stats(self.origin.word, self.origin.language.code)
-
         learned_datetime = (
             str(self.learned_time.date()) if self.learned_time is not None else ""
         )
 
         created_day = "today" if self.time.date() == datetime.now().date() else ""
 
-        # Fetch the BasicSRSchedule instance associated with the current bookmark
         from zeeguu.core.word_scheduling import ONE_DAY
 
-        try:
-            scheduler = self.get_scheduler()
-            bookmark_scheduler = scheduler.query.filter(
-                scheduler.bookmark_id == self.id
-            ).one()
+        if bookmark_scheduler is not None:
             cooling_interval_in_days = bookmark_scheduler.cooling_interval // ONE_DAY
             next_practice_time = bookmark_scheduler.next_practice_time
             can_update_schedule = (
@@ -317,7 +327,7 @@ class Bookmark(db.Model):
 
             is_about_to_be_learned = bookmark_scheduler.is_about_to_be_learned()
 
-        except sqlalchemy.exc.NoResultFound:
+        else:
             cooling_interval_in_days = None
             can_update_schedule = None
             consecutive_correct_answers = None
@@ -329,9 +339,9 @@ class Bookmark(db.Model):
             from_lang=self.origin.language.code,
             to_lang=translation_language,
             url=self.text.url(),
-            origin_importance=word_info.importance,
+            origin_importance=word_rank.importance,
             learned_datetime=learned_datetime,
-            origin_rank=word_info.rank if word_info.rank != 100000 else "",
+            origin_rank=word_rank.rank if word_rank.rank != UNKNOWN_WORD_RANK else "",
             starred=self.starred if self.starred is not None else False,
             article_id=self.text.article_id if self.text.article_id else "",
             created_day=created_day,  # human readable stuff...
@@ -351,8 +361,115 @@ class Bookmark(db.Model):
         )
 
         exercise_info_dict["from"] = self.origin.word
-        result = {**result, **exercise_info_dict}
-        return result
+        return exercise_info_dict
+
+    @classmethod
+    def as_dictionaries(
+        cls,
+        bookmarks,
+        with_exercise_info=False,
+        with_title=False,
+        with_context=True,
+        with_context_tokenized=False,
+    ):
+        """
+        Same as calling as_dictionary on each of the bookmarks, but the
+        contexts are tokenized in one batch per language instead of
+        running the tokenizer once for every bookmark, and the words,
+        texts, articles and schedules are loaded with a few queries
+        instead of several for every bookmark.
+        """
+        if bookmarks and (with_exercise_info or with_title):
+            cls._load_related(bookmarks)
+
+        results = [
+            each.as_dictionary(with_title=with_title, with_context=with_context)
+            for each in bookmarks
+        ]
+
+        if with_exercise_info:
+            schedules = cls._schedules(bookmarks)
+            word_ranks = cls._word_ranks(bookmarks)
+            for each, result in zip(bookmarks, results):
+                word_rank = word_ranks[each.origin.language.code][each.origin.word]
+                result.update(each._exercise_info(word_rank, schedules.get(each.id)))
+
+        if with_context_tokenized:
+            for result, tokenized in zip(results, cls._tokenized_contexts(bookmarks)):
+                result["context_tokenized"] = tokenized
+
+        return results
+
+    @classmethod
+    def _load_related(cls, bookmarks):
+        from sqlalchemy.orm import joinedload
+        from zeeguu.core.model.url import Url
+
+        # loading the bookmarks again fills in the relationships of the
+        # objects we already have; no_autoflush, because callers sometimes
+        # change bookmarks only for the serialization (e.g. learning_cycle)
+        with db.session.no_autoflush:
+            cls.query.filter(cls.id.in_([each.id for each in bookmarks])).options(
+                joinedload(cls.origin).joinedload(UserWord.language),
+                joinedload(cls.translation).joinedload(UserWord.language),
+                joinedload(cls.text)
+                .joinedload(Text.article)
+                .joinedload(Article.url)
+                .joinedload(Url.domain),
+            ).all()
+
+    @classmethod
+    def _schedules(cls, bookmarks):
+        """
+        :return: dictionary from bookmark id to its schedule, for the
+        bookmarks that have one
+        """
+        from zeeguu.core.word_scheduling import get_scheduler
+
+        ids = [each.id for each in bookmarks]
+        # finding the scheduler of a user looks at their feature toggles
+        schedulers = {get_scheduler(user) for user in {each.user for each in bookmarks}}
+
+        schedules = {}
+        with db.session.no_autoflush:
+            for scheduler in schedulers:
+                for schedule in scheduler.query.filter(scheduler.bookmark_id.in_(ids)):
+                    schedules[schedule.bookmark_id] = schedule
+        return schedules
+
+    @staticmethod
+    def _word_ranks(bookmarks):
+        """
+        :return: dictionary from language code to the ranks_for of the
+        origin words of the bookmarks in that language
+        """
+        words = {}
+        for each in bookmarks:
+            words.setdefault(each.origin.language.code, set()).add(each.origin.word)
+        return {code: ranks_for(words[code], code) for code in words}
+
+    @classmethod
+    def _tokenized_contexts(cls, bookmarks):
+        from zeeguu.core.tokenization import TOKENIZER_MODEL, get_tokenizer
+
+        tokenized = [None] * len(bookmarks)
+
+        positions_by_language = {}
+        for i, each in enumerate(bookmarks):
+            positions_by_language.setdefault(each.origin.language, []).append(i)
+
+        for language, positions in positions_by_language.items():
+            texts = [bookmarks[i].text for i in positions]
+            tokenizer = get_tokenizer(language, TOKENIZER_MODEL)
+            tokenized_texts = tokenizer.tokenize_many(
+                [text.content for text in texts],
+                [(text.token_i, text.sentence_i, text.paragraph_i) for text in texts],
+                flatten=False,
+            )
+            for i, tokens in zip(positions, tokenized_texts):
+                tokenized[i] = tokens
+
+        return tokenized
 
     @classmethod
     def find_or_create(
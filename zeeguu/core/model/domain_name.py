@@ -9,6 +9,7 @@ import logging
 import zeeguu.core
 
 from zeeguu.core.model import db
+from zeeguu.core.model.reference_cache import ReferenceCache
 
 
 class DomainName(db.Model):
@@ -40,15 +41,18 @@ class DomainName(db.Model):
     @classmethod
     def for_url_string(cls, url_string):
         only_domain_str = DomainName.get_domain(url_string)
-        try:
-            return cls.query.filter(cls.domain_name == only_domain_str).one()
-        except sqlalchemy.orm.exc.NoResultFound:
+        result = cls.cache.find("domain_name", only_domain_str)
+        if result is None:
             # print "tried, but didn't find " + domain_url
             return cls(only_domain_str)
+        return result
 
     @classmethod
     def find(cls, domain_url):
-        return cls.query.filter(DomainName.domain_name == domain_url).one()
+        result = cls.cache.find("domain_name", domain_url)
+        if result is None:
+            raise NoResultFound()
+        return result
 
     @classmethod
     def find_or_create(cls, session, url: str):
@@ -75,3 +79,7 @@ class DomainName(db.Model):
                         time.sleep(0.1)
                         continue
                     break
+
+
+# there are tens of thousands of domains; keep the ones we come across
+DomainName.cache = ReferenceCache(DomainName, ["domain_name"], max_size=50000)
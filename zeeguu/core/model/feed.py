@@ -41,6 +41,11 @@ class Feed(db.Model):
 
     feed_type = db.Column(db.Integer)
 
+    # to detect that the feed did not change since the last crawl
+    etag = db.Column(db.String(255))
+    last_modified = db.Column(db.String(64))
+    content_hash = db.Column(db.String(64))
+
     feed_handler = None
 
     def __init__(
@@ -92,11 +97,30 @@ class Feed(db.Model):
             feed_handler=feed_handler,
         )
 
+    def _new_feed_handler(self):
+        return FEED_TYPE_TO_FEED_HANDLER[self.feed_type](str(self.url), self.feed_type)
+
     def initializeFeedHandler(self):
         if self.feed_handler is None:
-            self.feed_handler = FEED_TYPE_TO_FEED_HANDLER[self.feed_type](
-                str(self.url), self.feed_type
-            )
+            self.feed_handler = self._new_feed_handler()
+            self.feed_handler.etag = self.etag
+            self.feed_handler.last_modified = self.last_modified
+            self.feed_handler.content_hash = self.content_hash
+
+    def not_modified_since_last_crawl(self):
+        return self.feed_handler is not None and self.feed_handler.not_modified
+
+    def remember_feed_version(self):
+        """
+        Saves what the feed document looked like in the last download, so
+        the next crawl can skip the feed if it did not change; only call
+        once all the items of the feed were processed.
+        """
+        if self.feed_handler is None:
+            return
+        self.etag = self.feed_handler.etag
+        self.last_modified = self.feed_handler.last_modified
+        self.content_hash = self.feed_handler.content_hash
 
     def as_dictionary(self):
         language = "unknown_lang"
@@ -114,20 +138,26 @@ class Feed(db.Model):
             feed_type=self.feed_type,
         )
 
-    def feed_items(self, last_retrieval_time_from_DB=None):
+    def feed_items(self, last_retrieval_time_from_DB=None, feed_candidates=None):
         """
+        :param feed_candidates: the items of the feed, if they were
+        already retrieved with feed_handler.get_feed_articles()
         :return: a dictionary with info about that feed
         extracted by feedparser
         and including: title, url, content, summary, time
         """
-        # Since loading this from the DB will cause the file
-        # handler to be set to none, we initialize it here.
-        self.initializeFeedHandler()
-
         if not last_retrieval_time_from_DB:
             last_retrieval_time_from_DB = datetime(1980, 1, 1)
 
-        feed_candidates = self.feed_handler.get_feed_articles()
+        if feed_candidates is None:
+            from zeeguu.core.model import Article
+
+            # Since loading this from the DB will cause the file
+            # handler to be set to none, we initialize it here.
+            self.initializeFeedHandler()
+            feed_candidates = self.feed_handler.get_feed_articles(
+                urls_to_skip=Article.urls_in_db
+            )
 
         skipped_due_to_time = 0
         feed_items = []
@@ -164,7 +194,10 @@ class Feed(db.Model):
             return False
 
     def feed_health_info(self):
-        feed_items = self.feed_items()
+        # all the items of the feed count, also those already in the DB; and
+        # the handler does not know what the feed looked like at the last
+        # crawl, so an unchanged feed is not taken for an empty one
+        feed_items = self._new_feed_handler().get_feed_articles()
         if not feed_items:
             return "Feed seems broken. No items found."
         else:
@@ -6,6 +6,7 @@ from zeeguu.logging import logp
 import zeeguu
 
 from zeeguu.core.model import db
+from zeeguu.core.model.reference_cache import ReferenceCache
 
 
 class Language(db.Model):
@@ -137,7 +138,9 @@ class Language(db.Model):
 
     @classmethod
     def find(cls, code):
-        result = cls.query.filter(Language.code == code).one()
+        result = cls.cache.find("code", code)
+        if result is None:
+            raise NoResultFound()
         return result
 
     @classmethod
@@ -162,7 +165,10 @@ class Language(db.Model):
 
     @classmethod
     def find_by_id(cls, i):
-        return cls.query.filter(Language.id == i).one()
+        result = cls.cache.find("id", i)
+        if result is None:
+            raise NoResultFound()
+        return result
 
     def get_articles(
         self, after_date=None, most_recent_first=False, easiest_first=False
@@ -238,3 +244,6 @@ class Language(db.Model):
         """
 
         return [user.learned_language]
+
+
+Language.cache = ReferenceCache(Language, ["code"], load_all=True)
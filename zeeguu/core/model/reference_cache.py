@@ -0,0 +1,194 @@
+"""
+
+Process-level copies of the rows of the tables that hardly ever change
+(languages, topics, domain names), so that finding one of them by id,
+code or name does not cost a query on every request and every crawled
+article.
+
+"""
+
+import threading
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from zeeguu.core.model import db
+
+_all_caches = []
+
+# (model, id) of the cached rows that the open transaction of a session
+# inserted or changed, in session.info
+_WRITTEN_ROWS = "reference_cache_written_rows"
+
+
+class ReferenceCache:
+    """
+    Keeps detached copies of the rows of a model, by primary key and by
+    the other columns they are looked up by.
+
+    A copy is never handed out: find() returns the instance of the
+    current session, merging the copy into the session without a SELECT
+    if the session did not have one yet. So the instances can be used
+    (and changed) like any other, from any thread.
+
+    A row that is not in the cache is looked up in the DB, so rows that
+    other processes added are found too. Changing or deleting a row
+    through the ORM invalidates the cache of the process that did it;
+    other processes see the change after they invalidate() theirs, e.g.
+    when they restart.
+
+    Rows that the open transaction of the session inserted or changed are
+    not remembered until they are committed: if the transaction is rolled
+    back, their ids or values never existed. And when it is rolled back,
+    the caches of the models it wrote are invalidated.
+
+    With load_all, the whole table is loaded the first time it's needed;
+    otherwise rows are remembered as they are looked up, at most max_size.
+    """
+
+    def __init__(self, model, key_columns, load_all=False, max_size=None):
+        self.model = model
+        self.key_columns = key_columns
+        self.load_all = load_all
+        self.max_size = max_size
+
+        self._lock = threading.Lock()
+        self._by_id = {}
+        self._ids_by_key = {column: {} for column in key_columns}
+        self._loaded = False
+
+        self.hits = 0
+        self.misses = 0
+
+        _all_caches.append(self)
+        for change in ["after_update", "after_delete"]:
+            event.listen(model, change, self._row_changed)
+
+    def find(self, column, value):
+        """
+        :return: the instance whose column is equal to value (column is
+        "id" or one of the key_columns), or None if there's no such row
+        """
+        if self.load_all and not self._loaded:
+            self._load_table()
+
+        with self._lock:
+            if column == "id":
+                copy = self._by_id.get(value)
+            else:
+                copy = self._by_id.get(self._ids_by_key[column].get(value))
+
+        if copy is None:
+            self.misses += 1
+            instance = self.model.query.filter(
+                getattr(self.model, column) == value
+            ).one_or_none()
+            if instance is not None:
+                self.remember(instance)
+            return instance
+
+        self.hits += 1
+        return self._in_session(copy)
+
+    def remember(self, instance):
+        if _written_in_open_transaction(instance):
+            return
+        copy = self._detached_copy(instance)
+        with self._lock:
+            if self.max_size and len(self._by_id) >= self.max_size:
+                self._clear()
+            self._add(copy)
+
+    def invalidate(self):
+        with self._lock:
+            self._clear()
+            self._loaded = False
+
+    def _row_changed(self, mapper, connection, instance):
+        self.invalidate()
+
+    def _load_table(self):
+        instances = self.model.query.all()
+        committed = [
+            each for each in instances if not _written_in_open_transaction(each)
+        ]
+        copies = [self._detached_copy(each) for each in committed]
+        with self._lock:
+            for copy in copies:
+                self._add(copy)
+            # with rows that are not committed yet, the table is loaded
+            # again the next time
+            self._loaded = len(committed) == len(instances)
+
+    def _add(self, copy):
+        # must be called with self._lock held
+        self._by_id[copy.id] = copy
+        for column in self.key_columns:
+            self._ids_by_key[column][getattr(copy, column)] = copy.id
+
+    def _clear(self):
+        # must be called with self._lock held
+        self._by_id.clear()
+        for ids in self._ids_by_key.values():
+            ids.clear()
+
+    def _detached_copy(self, instance):
+        mapper = sqlalchemy.inspect(self.model)
+        copy = mapper.class_manager.new_instance()
+        for column in mapper.column_attrs:
+            set_committed_value(copy, column.key, getattr(instance, column.key))
+        make_transient_to_detached(copy)
+        return copy
+
+    def _in_session(self, copy):
+        instance = db.session.identity_map.get(sqlalchemy.inspect(copy).key)
+        if instance is not None:
+            return instance
+        return db.session.merge(copy, load=False)
+
+
+def invalidate_reference_caches():
+    for cache in _all_caches:
+        cache.invalidate()
+
+
+def _written_in_open_transaction(instance):
+    session = object_session(instance)
+    if session is None:
+        return False
+    return (type(instance), instance.id) in session.info.get(_WRITTEN_ROWS, ())
+
+
+@event.listens_for(Session, "after_flush")
+def _note_written_rows(session, flush_context):
+    cached_models = tuple(cache.model for cache in _all_caches)
+    written = [
+        (type(each), each.id)
+        for each in list(session.new) + list(session.dirty)
+        if isinstance(each, cached_models)
+    ]
+    if written:
+        session.info.setdefault(_WRITTEN_ROWS, set()).update(written)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_rows(session):
+    # a savepoint is committed only when the whole transaction is
+    if not session.in_nested_transaction():
+        session.info.pop(_WRITTEN_ROWS, None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _invalidate_rolled_back_rows(session, transaction):
+    if transaction.parent is not None:
+        return
+    # still there if the transaction was rolled back (or closed) instead
+    # of committed
+    written = session.info.pop(_WRITTEN_ROWS, None)
+    if written:
+        models = {model for model, _ in written}
+        for cache in _all_caches:
+            if cache.model in models:
+                cache.invalidate()
@@ -14,7 +14,10 @@ from zeeguu.core.model import db
 
 
 class Text(db.Model):
-    __table_args__ = {"mysql_collate": "utf8_bin"}
+    __table_args__ = (
+        db.Index("text_content_hash", "content_hash"),
+        {"mysql_collate": "utf8_bin"},
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.String(10000))
@@ -3,6 +3,7 @@ from zeeguu.logging import logp
 from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 from zeeguu.core.model import db
+from zeeguu.core.model.reference_cache import ReferenceCache
 from zeeguu.core.model.language import Language
 from zeeguu.core.model.article_topic_map import ArticleTopicMap
 from datetime import datetime
@@ -70,24 +71,11 @@ class Topic(db.Model):
 
     @classmethod
     def find(cls, name: str):
-        try:
-            return cls.query.filter(cls.title == name).one()
-        except Exception as e:
-            from sentry_sdk import capture_exception
-
-            capture_exception(e)
-            return None
+        return cls.cache.find("title", name)
 
     @classmethod
     def find_by_id(cls, i):
-        try:
-            result = cls.query.filter(cls.id == i).one()
-            return result
-        except Exception as e:
-            from sentry_sdk import capture_exception
-
-            capture_exception(e)
-            return None
+        return cls.cache.find("id", i)
 
     @classmethod
     def get_all_topics(cls, language: Language = None):
@@ -121,3 +109,6 @@ class Topic(db.Model):
 
         topics_available = cls.language_topic_available_cache[language.id][0]
         return topics_available
+
+
+Topic.cache = ReferenceCache(Topic, ["title"], load_all=True)
@@ -656,8 +656,6 @@ class User(db.Model):
 
         from zeeguu.core.model import Bookmark, Text
 
-        json_bookmarks = []
-
         query = zeeguu.core.model.db.session.query(Bookmark)
         bookmarks = (
             query.join(Text)
@@ -679,16 +677,12 @@ class User(db.Model):
         if not json:
             return bookmarks
 
-        for each in bookmarks:
-            json_bookmarks.append(
-                each.as_dictionary(
-                    with_exercise_info=with_exercise_info,
-                    with_title=with_title,
-                    with_context_tokenized=with_tokens,
-                )
-            )
-
-        return json_bookmarks
+        return Bookmark.as_dictionaries(
+            bookmarks,
+            with_exercise_info=with_exercise_info,
+            with_title=with_title,
+            with_context_tokenized=with_tokens,
+        )
 
     def bookmarks_by_url_by_date(self, n_days=365):
         bookmarks_list, dates = self.bookmarks_by_date()
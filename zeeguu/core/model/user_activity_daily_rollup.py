@@ -0,0 +1,330 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text, bindparam
+
+from zeeguu.core.model.language import Language
+from zeeguu.core.model.user import User
+
+from zeeguu.core.model import db
+
+CORRECT_ON_FIRST_TRY_OUTCOMES = ("C", "Correct")
+
+# the last days (today included) that might not be rolled up yet: the rows
+# of a day are only complete once tools/recompute_activity_rollup.py ran
+# after the end of the day (see tools/cron/zeeguu.crontab). Their totals
+# are computed from the raw tables.
+DAYS_NOT_ROLLED_UP = 2
+
+
+def _as_date(value):
+    # date() gives a date in MySQL and a string in sqlite
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class UserActivityDailyRollup(db.Model):
+    """
+    How much a user read and practiced in a language in a day.
+
+    The statistics in the dashboards can then add up a row per day instead
+    of going through every session, bookmark and exercise of the period.
+
+    The rows are derived from the user_reading_session, user_exercise_session,
+    bookmark and exercise tables: a day is recomputed when a session of that
+    day ends, and tools/recompute_activity_rollup.py (run from cron, see
+    tools/cron/zeeguu.crontab) recomputes whole periods. The migration that
+    creates the table is followed by one that backfills it. The last days
+    are not read from the rows, see totals().
+
+    An exercise session counts for the language of its exercises (sessions
+    without exercises are not counted); translations, exercises and learned
+    words for the language of the word.
+    """
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "user_id",
+            "day",
+            "language_id",
+            name="user_activity_daily_rollup_user_day_language",
+        ),
+        {"mysql_collate": "utf8_bin"},
+    )
+    __tablename__ = "user_activity_daily_rollup"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
+    day = db.Column(db.Date, nullable=False)
+    language_id = db.Column(db.Integer, db.ForeignKey(Language.id), nullable=False)
+
+    reading_ms = db.Column(db.BigInteger, default=0)
+    exercise_ms = db.Column(db.BigInteger, default=0)
+    translations = db.Column(db.Integer, default=0)
+    exercises = db.Column(db.Integer, default=0)
+    correct_on_first_try = db.Column(db.Integer, default=0)
+    words_learned = db.Column(db.Integer, default=0)
+
+    COUNTERS = [
+        "reading_ms",
+        "exercise_ms",
+        "translations",
+        "exercises",
+        "correct_on_first_try",
+        "words_learned",
+    ]
+
+    def __init__(self, user_id, day, language_id, **counters):
+        self.user_id = user_id
+        self.day = day
+        self.language_id = language_id
+        for counter in self.COUNTERS:
+            setattr(self, counter, counters.get(counter, 0))
+
+    def __repr__(self):
+        return f"<UserActivityDailyRollup {self.user_id} {self.day} {self.language_id}>"
+
+    @classmethod
+    def recompute(cls, session, from_day, to_day, user_ids=None):
+        """
+        Rebuilds the rows of the days from from_day to to_day (inclusive)
+        from the raw activity tables, for the given users, or for everybody.
+        """
+        rows = cls._compute(session, from_day, to_day, user_ids)
+
+        # rows of the period that have no activity anymore (e.g. all the
+        # bookmarks of the day were deleted) are zeroed; they are not
+        # deleted with a range DELETE, which would lock the whole range and
+        # deadlock with the session end of another worker for the same user
+        existing = session.query(cls.user_id, cls.day, cls.language_id)
+        existing = existing.filter(cls.day >= from_day).filter(cls.day <= to_day)
+        if user_ids is not None:
+            existing = existing.filter(cls.user_id.in_(user_ids))
+        for user_id, day, language_id in existing:
+            key = (user_id, _as_date(day), language_id)
+            if key not in rows:
+                rows[key] = {counter: 0 for counter in cls.COUNTERS}
+
+        # always in the same order, so that concurrent recomputations lock
+        # the rows in the same order too
+        values = [
+            dict(user_id=user_id, day=day, language_id=language_id, **counters)
+            for (user_id, day, language_id), counters in sorted(rows.items())
+        ]
+        if values:
+            session.execute(cls._upsert(session), values)
+        session.commit()
+
+    @classmethod
+    def _compute(cls, session, from_day, to_day, user_ids):
+        """
+        :return: dictionary from (user_id, day, language_id) to the counters
+        of the row, computed from the raw activity tables
+        """
+        from_time = datetime.combine(from_day, datetime.min.time())
+        to_time = datetime.combine(to_day + timedelta(days=1), datetime.min.time())
+
+        rows = defaultdict(lambda: {counter: 0 for counter in cls.COUNTERS})
+        for counter, (user_column, query) in _ROLLUP_QUERIES.items():
+            for user_id, day, language_id, value in cls._execute(
+                session, user_column, query, from_time, to_time, user_ids
+            ):
+                rows[(user_id, _as_date(day), language_id)][counter] += int(value or 0)
+        return rows
+
+    @classmethod
+    def recompute_day_of(cls, session, user_id, time):
+        day = time.date()
+        cls.recompute(session, day, day, [user_id])
+
+    @classmethod
+    def _upsert(cls, session):
+        """
+        INSERT ... ON DUPLICATE KEY UPDATE, or its sqlite equivalent
+        """
+        if session.get_bind().dialect.name == "mysql":
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(cls.__table__)
+            return statement.on_duplicate_key_update(
+                {c: statement.inserted[c] for c in cls.COUNTERS}
+            )
+
+        from sqlalchemy.dialects.sqlite import insert
+
+        statement = insert(cls.__table__)
+        return statement.on_conflict_do_update(
+            index_elements=["user_id", "day", "language_id"],
+            set_={c: statement.excluded[c] for c in cls.COUNTERS},
+        )
+
+    @staticmethod
+    def _execute(session, user_column, query, from_time, to_time, user_ids):
+        params = {"from_time": from_time, "to_time": to_time}
+        if user_ids is None:
+            return session.execute(
+                text(query.replace("{user_condition}", "")), params
+            ).fetchall()
+
+        params["user_ids"] = list(user_ids)
+        statement = text(
+            query.replace("{user_condition}", f"and {user_column} in :user_ids")
+        ).bindparams(bindparam("user_ids", expanding=True))
+        return session.execute(statement, params).fetchall()
+
+    @classmethod
+    def totals(cls, user_ids, from_day, to_day, language_id=None):
+        """
+        :return: dictionary from user id to a dictionary with the sum of
+        every counter over the days from from_day to to_day (inclusive);
+        only the activity in the given language, if language_id is given
+
+        from_day and to_day can also be datetimes or ISO formatted strings
+
+        The days that might not be rolled up yet (see DAYS_NOT_ROLLED_UP)
+        are computed from the raw tables, so that the activity of today,
+        and of sessions that were never ended, is there too.
+        """
+        from_day, to_day = _as_date(from_day), _as_date(to_day)
+        first_raw_day = date.today() - timedelta(days=DAYS_NOT_ROLLED_UP - 1)
+
+        result = {user_id: {c: 0 for c in cls.COUNTERS} for user_id in user_ids}
+
+        if from_day < first_raw_day:
+            last_rolled_up_day = min(to_day, first_raw_day - timedelta(days=1))
+            query = db.session.query(
+                cls.user_id, *[db.func.sum(getattr(cls, c)) for c in cls.COUNTERS]
+            )
+            query = query.filter(cls.user_id.in_(user_ids))
+            query = query.filter(cls.day >= from_day)
+            query = query.filter(cls.day <= last_rolled_up_day)
+            if language_id:
+                query = query.filter(cls.language_id == language_id)
+            query = query.group_by(cls.user_id)
+
+            for user_id, *sums in query.all():
+                for counter, value in zip(cls.COUNTERS, sums):
+                    result[user_id][counter] += int(value or 0)
+
+        if to_day >= first_raw_day:
+            rows = cls._compute(
+                db.session, max(from_day, first_raw_day), to_day, user_ids
+            )
+            for (user_id, _, row_language_id), counters in rows.items():
+                if language_id and row_language_id != language_id:
+                    continue
+                for counter, value in counters.items():
+                    result[user_id][counter] += value
+
+        return result
+
+    @classmethod
+    def by_day(cls, user_id):
+        """
+        :return: list of (day, reading_ms, exercise_ms) for every day on
+        which the user read or practiced, in all the languages together
+        """
+        return (
+            db.session.query(
+                cls.day, db.func.sum(cls.reading_ms), db.func.sum(cls.exercise_ms)
+            )
+            .filter(cls.user_id == user_id)
+            .group_by(cls.day)
+            .order_by(cls.day)
+            .all()
+        )
+
+
+# Every query returns (user_id, day, language_id, value) rows for the
+# activity between :from_time and :to_time; the first element of each
+# pair is the column the query can be restricted to some users by
+_ROLLUP_QUERIES = {
+    "reading_ms": (
+        "urs.user_id",
+        """
+        select urs.user_id, date(urs.start_time), a.language_id, sum(urs.duration)
+        from user_reading_session as urs
+        join article as a on urs.article_id = a.id
+        where urs.start_time >= :from_time and urs.start_time < :to_time
+            {user_condition}
+        group by urs.user_id, date(urs.start_time), a.language_id
+    """,
+    ),
+    # a session counts once, for the language of its exercises; sessions
+    # without exercises are not counted
+    "exercise_ms": (
+        "ues.user_id",
+        """
+        select user_id, day, language_id, duration
+        from (
+            select ues.user_id, date(ues.start_time) as day,
+                (select max(uw.language_id)
+                    from exercise as e
+                    join bookmark_exercise_mapping as bem on bem.exercise_id = e.id
+                    join bookmark as b on bem.bookmark_id = b.id
+                    join user_word as uw on b.origin_id = uw.id
+                    where e.session_id = ues.id) as language_id,
+                ues.duration
+            from user_exercise_session as ues
+            where ues.start_time >= :from_time and ues.start_time < :to_time
+                {user_condition}
+        ) as sessions
+        where language_id is not null
+    """,
+    ),
+    "translations": (
+        "b.user_id",
+        """
+        select b.user_id, date(b.time), uw.language_id, count(b.id)
+        from bookmark as b
+        join user_word as uw on b.origin_id = uw.id
+        where b.time >= :from_time and b.time < :to_time
+            {user_condition}
+        group by b.user_id, date(b.time), uw.language_id
+    """,
+    ),
+    "exercises": (
+        "b.user_id",
+        """
+        select b.user_id, date(e.time), uw.language_id, count(o.outcome)
+        from exercise as e
+        join bookmark_exercise_mapping as bem on bem.exercise_id = e.id
+        join bookmark as b on bem.bookmark_id = b.id
+        join exercise_outcome as o on e.outcome_id = o.id
+        join user_word as uw on b.origin_id = uw.id
+        where e.time >= :from_time and e.time < :to_time
+            {user_condition}
+        group by b.user_id, date(e.time), uw.language_id
+    """,
+    ),
+    "correct_on_first_try": (
+        "b.user_id",
+        f"""
+        select b.user_id, date(e.time), uw.language_id, count(o.outcome)
+        from exercise as e
+        join bookmark_exercise_mapping as bem on bem.exercise_id = e.id
+        join bookmark as b on bem.bookmark_id = b.id
+        join exercise_outcome as o on e.outcome_id = o.id
+        join user_word as uw on b.origin_id = uw.id
+        where e.time >= :from_time and e.time < :to_time
+            and o.outcome in {CORRECT_ON_FIRST_TRY_OUTCOMES}
+            {{user_condition}}
+        group by b.user_id, date(e.time), uw.language_id
+    """,
+    ),
+    "words_learned": (
+        "b.user_id",
+        """
+        select b.user_id, date(b.learned_time), uw.language_id, count(b.id)
+        from bookmark as b
+        join user_word as uw on b.origin_id = uw.id
+        where b.learned_time >= :from_time and b.learned_time < :to_time
+            {user_condition}
+        group by b.user_id, date(b.learned_time), uw.language_id
+    """,
+    ),
+}
@@ -230,11 +230,15 @@ class UserArticle(db.Model):
 
         user_articles = cls.all_starred_or_liked_articles_of_user(user)
 
-        return [
-            cls.user_article_info(user, each.article, with_translations=False)
-            for each in user_articles
-            if each.last_interaction() is not None
-        ]
+        return cls.user_article_infos(
+            user,
+            [
+                each.article
+                for each in user_articles
+                if each.last_interaction() is not None
+            ],
+            with_translations=False,
+        )
 
     @classmethod
     def exists(cls, obj):
@@ -248,20 +252,92 @@ class UserArticle(db.Model):
     def user_article_info(
         cls, user: User, article: Article, with_content=False, with_translations=True
     ):
+        return cls.user_article_infos(user, [article], with_content, with_translations)[
+            0
+        ]
 
-        from zeeguu.core.model import Bookmark
+    @classmethod
+    def user_article_infos(
+        cls, user: User, articles, with_content=False, with_translations=True
+    ):
+        """
+        Same as calling user_article_info for each of the articles, but
+        what the user did with the articles (opened, starred, feedback,
+        personal copies, translations) is loaded with one query for all
+        of them instead of several for every article.
+        """
+        from zeeguu.core.model import Bookmark, Text
 
-        # Initialize returned info with the default article info
-        returned_info = article.article_info(with_content=with_content)
+        articles = list(articles)
+        ids = [each.id for each in articles]
+        if not ids:
+            return []
 
-        user_article_info = UserArticle.find(user, article)
+        user_articles = {
+            each.article_id: each
+            for each in cls.query.filter(cls.user_id == user.id).filter(
+                cls.article_id.in_(ids)
+            )
+        }
 
-        user_diff_feedback = ArticleDifficultyFeedback.find(user, article)
+        # the most recent feedback of every article comes first
+        difficulty_feedbacks = {}
+        for each in (
+            ArticleDifficultyFeedback.query.filter(
+                ArticleDifficultyFeedback.user_id == user.id
+            )
+            .filter(ArticleDifficultyFeedback.article_id.in_(ids))
+            .order_by(ArticleDifficultyFeedback.date.desc())
+        ):
+            difficulty_feedbacks.setdefault(each.article_id, each)
+
+        topics_feedbacks = {}
+        for each in ArticleTopicUserFeedback.query.filter(
+            ArticleTopicUserFeedback.user_id == user.id
+        ).filter(ArticleTopicUserFeedback.article_id.in_(ids)):
+            topics_feedbacks.setdefault(each.article_id, []).append(each)
+
+        personal_copies = {
+            article_id
+            for (article_id,) in PersonalCopy.query.with_entities(
+                PersonalCopy.article_id
+            )
+            .filter(PersonalCopy.user_id == user.id)
+            .filter(PersonalCopy.article_id.in_(ids))
+        }
+
+        translations = {}
+        if with_translations and user_articles:
+            for bookmark, article_id in (
+                Bookmark.query.with_entities(Bookmark, Text.article_id)
+                .join(Text)
+                .filter(Text.article_id.in_(list(user_articles)))
+                .filter(Bookmark.user_id == user.id)
+                .order_by(Bookmark.id)
+            ):
+                translations.setdefault(article_id, []).append(bookmark)
 
-        user_topics_feedback = ArticleTopicUserFeedback.find_given_user_article(
-            article, user
-        )
+        return [
+            cls._user_article_info(
+                article.article_info(with_content=with_content),
+                user_articles.get(article.id),
+                difficulty_feedbacks.get(article.id),
+                topics_feedbacks.get(article.id),
+                article.id in personal_copies,
+                translations.get(article.id, []) if with_translations else None,
+            )
+            for article in articles
+        ]
 
+    @staticmethod
+    def _user_article_info(
+        returned_info,
+        user_article_info,
+        user_diff_feedback,
+        user_topics_feedback,
+        has_personal_copy,
+        translations,
+    ):
         if user_topics_feedback:
             article_topic_list = returned_info["topics_list"]
             topic_list = []
@@ -299,15 +375,11 @@ class UserArticle(db.Model):
                     user_diff_feedback.difficulty_feedback
                 )
 
-            if with_translations:
-                translations = Bookmark.find_all_for_user_and_article(user, article)
+            if translations is not None:
                 returned_info["translations"] = [
                     each.as_dictionary() for each in translations
                 ]
 
-        if PersonalCopy.exists_for(user, article):
-            returned_info["has_personal_copy"] = True
-        else:
-            returned_info["has_personal_copy"] = False
+        returned_info["has_personal_copy"] = has_personal_copy
 
         return returned_info
@@ -1,6 +1,6 @@
 import sqlalchemy.orm
 from sqlalchemy.orm.exc import NoResultFound
-from wordstats import Word
+from zeeguu.core.word_stats import rank_for
 
 import zeeguu.core
 
@@ -32,9 +32,8 @@ class UserWord(db.Model):
         self.word = word
         self.language = language
 
-        # TODO: Performance
         try:
-            self.rank = Word.stats(self.word, self.language.code).rank
+            self.rank = rank_for(self.word, self.language.code).rank
         except FileNotFoundError:
             self.rank = None
         except Exception:
@@ -56,8 +55,7 @@ class UserWord(db.Model):
 
         :return: number between 0 and 10 as returned by the wordstats module
         """
-        stats = Word.stats(self.word, self.language.code)
-        return int(stats.importance)
+        return int(rank_for(self.word, self.language.code).importance)
 
     # we use this in the bookmarks.html to show the importance of a word
     def importance_level_string(self):
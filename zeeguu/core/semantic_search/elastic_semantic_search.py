@@ -1,4 +1,3 @@
-from elasticsearch import Elasticsearch
 from elastic_transport import ConnectionError
 
 from zeeguu.core.model import (
@@ -12,7 +11,9 @@ from zeeguu.core.elastic.elastic_query_builder import (
     more_like_this_query,
 )
 from zeeguu.core.util.timer_logging_decorator import time_this
-from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
+from zeeguu.core.elastic.settings import ES_ZINDEX
+from zeeguu.core.elastic.client import es_client
+from zeeguu.core.elastic.hits import articles_from_ES_hits
 from zeeguu.core.semantic_vector_api import (
     get_embedding_from_article,
     get_embedding_from_text,
@@ -31,11 +32,11 @@ def article_semantic_search_for_user(
 @time_this
 def articles_like_this_tfidf(article: Article):
     query_body = more_like_this_query(10, article.content, article.language)
-    es = Elasticsearch(ES_CONN_STRING)
+    es = es_client()
     res = es.search(index=ES_ZINDEX, body=query_body)
     final_article_mix = []
     hit_list = res["hits"].get("hits")
-    final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
+    final_article_mix.extend(articles_from_ES_hits(hit_list))
 
     return [a for a in final_article_mix if a is not None and not a.broken], hit_list
 
@@ -48,11 +49,11 @@ def articles_like_this_semantic(article: Article):
     final_article_mix = []
 
     try:
-        es = Elasticsearch(ES_CONN_STRING)
+        es = es_client()
         res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
-        final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
+        final_article_mix.extend(articles_from_ES_hits(hit_list))
 
         return [
             a for a in final_article_mix if a is not None and not a.broken
@@ -74,11 +75,11 @@ def add_topics_based_on_semantic_hood_search(
     final_article_mix = []
 
     try:
-        es = Elasticsearch(ES_CONN_STRING)
+        es = es_client()
         res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
-        final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
+        final_article_mix.extend(articles_from_ES_hits(hit_list))
 
         return [
             a for a in final_article_mix if a is not None and not a.broken
@@ -98,11 +99,11 @@ def find_articles_based_on_text(text, k: int = 9):  # hood = (slang) neighborhoo
     final_article_mix = []
 
     try:
-        es = Elasticsearch(ES_CONN_STRING)
+        es = es_client()
         res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
-        final_article_mix.extend(_to_articles_from_ES_hits(hit_list))
+        final_article_mix.extend(articles_from_ES_hits(hit_list))
 
         return [
             a for a in final_article_mix if a is not None and not a.broken
@@ -112,10 +113,3 @@ def find_articles_based_on_text(text, k: int = 9):  # hood = (slang) neighborhoo
     except Exception as e:
         print(f"Error encountered: {e}")
     return [], []
-
-
-def _to_articles_from_ES_hits(hits):
-    articles = []
-    for hit in hits:
-        articles.append(Article.find_by_id(hit.get("_id")))
-    return articles
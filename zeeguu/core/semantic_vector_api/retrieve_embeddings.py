@@ -1,19 +1,22 @@
 import os
-import requests
 from zeeguu.core.model import Article
+from zeeguu.core.util.http_session import http_session
 
 EMB_API_CONN_STRING = os.environ.get(
     "ZEEGUU_EMB_API_CONN_STRING", "http://127.0.0.1:8000"
 )
+# (connect, read); computing the embedding of a long article can take a while
+EMB_API_TIMEOUT = (5, 60)
 
 
 def get_embedding_from_article(a: Article):
-    r = requests.post(
+    r = http_session().post(
         url=f"{EMB_API_CONN_STRING}/get_article_embedding",
         json={
             "article_content": a.content,
             "article_language": a.language.name.lower(),
         },
+        timeout=EMB_API_TIMEOUT,
     )
     return r.json()
 
@@ -24,5 +27,9 @@ def get_embedding_from_text(text: str, language: str = None):
     }
     if language:
         data["article_language"] = language
-    r = requests.post(url=f"{EMB_API_CONN_STRING}/get_article_embedding", json=data)
+    r = http_session().post(
+        url=f"{EMB_API_CONN_STRING}/get_article_embedding",
+        json=data,
+        timeout=EMB_API_TIMEOUT,
+    )
     return r.json()
@@ -0,0 +1,43 @@
+/*
+ The bookmarks the user can study now: the scheduled ones that are due
+ today and the ones fit for study that are not scheduled yet. The most
+ common words come first and, for the same rank, the ones closest to
+ being learned; the first bookmark of every word (ignoring the case) is
+ the one to study. MySQL 5.7 has no window functions, so the caller
+ drops the others.
+ */
+select
+    b.id bookmark_id,
+    lower(uw.word) lower_word,
+    case
+        when uw.rank is null
+        or uw.rank = :unknown_rank then :impossible_rank
+        else uw.rank
+    end word_rank,
+    coalesce(bss.cooling_interval, -1) cooling_interval
+from
+    bookmark b
+    join user_word uw on b.origin_id = uw.id
+    left join basic_sr_schedule bss on b.id = bss.bookmark_id
+where
+    b.user_id = :user_id
+    and uw.language_id = :language_id
+    and (
+        (
+            bss.id is not null
+            and bss.next_practice_time < :end_of_day
+            and (
+                :all_learning_cycles
+                or b.learning_cycle = :receptive
+            )
+        )
+        or (
+            bss.id is null
+            and b.learned_time is null
+            and b.fit_for_study = 1
+        )
+    )
+order by
+    word_rank,
+    cooling_interval desc,
+    bookmark_id
@@ -7,7 +7,8 @@ from zeeguu.core.model.article_topic_map import TopicOriginType
 from zeeguu.core.test.rules.article_rule import ArticleRule
 from zeeguu.core.test.rules.language_rule import LanguageRule
 from zeeguu.core.test.rules.topic_rule import TopicRule
-from zeeguu.core.model import Article, Topic
+from zeeguu.core.model import Article, Topic, ArticleTokenizationCache
+from zeeguu.core.tokenization import TOKENIZER_MODEL
 from zeeguu.core.test.mocking_the_web import (
     URL_CNN_KATHMANDU,
     URL_SPIEGEL_VENEZUELA,
@@ -60,6 +61,46 @@ class ArticleTest(ModelTestMixIn, TestCase):
         assert health_society in article_topics
         assert TopicOriginType.HARDSET == self.article1.topics[0].origin_type
 
+    def test_find_topics_for_articles(self):
+        from zeeguu.core.elastic.indexing import find_topics, find_topics_for_articles
+
+        sports = TopicRule.get_or_create_topic(1)
+        health_society = TopicRule.get_or_create_topic(5)
+        self.article1.add_topic_if_doesnt_exist(
+            sports, session, TopicOriginType.HARDSET
+        )
+        self.article1.add_topic_if_doesnt_exist(
+            health_society, session, TopicOriginType.INFERRED
+        )
+
+        topics = find_topics_for_articles([self.article1.id, self.article2.id], session)
+
+        assert topics[self.article1.id] == ([sports], [health_society])
+        assert topics[self.article1.id] == find_topics(self.article1.id, session)
+        assert topics[self.article2.id] == ([], [])
+
+    def test_find_by_ids_keeps_order_and_skips_broken(self):
+        article3 = ArticleRule().article
+        article3.broken = 1
+        session.commit()
+
+        ids = [self.article2.id, 123456, article3.id, self.article1.id]
+
+        assert Article.find_by_ids(ids) == [self.article2, self.article1]
+        assert Article.find_by_ids(ids, include_broken=True) == [
+            self.article2,
+            article3,
+            self.article1,
+        ]
+
+    def test_urls_in_db(self):
+        url1 = self.article1.url.as_string()
+        url2 = self.article2.url.as_string()
+        unknown = "https://unknown.example.com/article"
+
+        assert Article.urls_in_db([url1, url2, unknown]) == {url1, url2}
+        assert Article.urls_in_db([]) == set()
+
     def test_find_or_create(self):
         self.new_art = Article.find_or_create(session, URL_SPIEGEL_VENEZUELA)
         assert self.new_art.fk_difficulty
@@ -67,3 +108,31 @@ class ArticleTest(ModelTestMixIn, TestCase):
     def test_load_article_without_language_information(self):
         art = Article.find_or_create(session, URL_CNN_KATHMANDU)
         assert art
+
+    def test_tokenization_is_cached(self):
+        self.article1.update(
+            self.language, self.article1.content, "", self.article1.title
+        )
+        session.commit()
+        info = self.article1.article_info(with_content=True)
+
+        cached = ArticleTokenizationCache.find(self.article1, TOKENIZER_MODEL)
+        assert cached
+        assert cached.get_tokens() == (
+            info["tokenized_paragraphs"],
+            info["tokenized_title"],
+        )
+
+    def test_tokenization_cache_is_invalidated_by_update(self):
+        self.article1.update(
+            self.language, self.article1.content, "", self.article1.title
+        )
+        session.commit()
+        self.article1.article_info(with_content=True)
+
+        self.article1.update(self.language, "Some new content.", "", "New title")
+        session.commit()
+        assert not ArticleTokenizationCache.find(self.article1, TOKENIZER_MODEL)
+
+        info = self.article1.article_info(with_content=True)
+        assert info["tokenized_title"].value[0][0][0]["text"] == "New"
@@ -95,6 +95,18 @@ class BookmarkTest(ModelTestMixIn):
     def test_bookmark_is_serializable(self):
         assert self.user.all_bookmarks()[0].as_dictionary()
 
+    def test_bookmarks_are_serialized_together(self):
+        bookmarks = self.user.all_bookmarks()
+        TwoLearningCyclesPerWord.find_or_create(db.session, bookmarks[0])
+        db.session.commit()
+
+        assert Bookmark.as_dictionaries(
+            bookmarks, with_exercise_info=True, with_title=True
+        ) == [
+            each.as_dictionary(with_exercise_info=True, with_title=True)
+            for each in bookmarks
+        ]
+
     def test_bad_quality_bookmark(self):
         random_bookmarks = [BookmarkRule(self.user).bookmark for _ in range(0, 3)]
 
@@ -376,3 +388,24 @@ class BookmarkTest(ModelTestMixIn):
 
     def test_top_bookmarks(self):
         assert top_bookmarks(self.user)
+
+    def test_own_past_translation(self):
+        from zeeguu.core.crowd_translations import get_own_past_translation
+        from zeeguu.core.test.rules.article_rule import ArticleRule
+
+        context = "Der Hund schläft im Haus"
+        article = ArticleRule().article
+        bookmark = Bookmark.find_or_create(
+            db.session, self.user, "Hund", "de", "dog", "en", context, article.id
+        )
+        Bookmark.find_or_create(
+            db.session, self.user, "Haus", "de", "maison", "fr", context, article.id
+        )
+
+        assert (
+            get_own_past_translation(self.user, "Hund", "de", "en", context) == bookmark
+        )
+        assert not get_own_past_translation(self.user, "Haus", "de", "en", context)
+        assert not get_own_past_translation(self.user, "Hund", "de", "en", "Anders")
+        other_user = UserRule().user
+        assert not get_own_past_translation(other_user, "Hund", "de", "en", context)
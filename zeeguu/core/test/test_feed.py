@@ -6,6 +6,7 @@ from zeeguu.core.test.model_test_mixin import ModelTestMixIn
 
 from zeeguu.core.test.rules.feed_rule import FeedRule
 from zeeguu.core.content_retriever.article_downloader import download_from_feed
+from zeeguu.core.content_retriever.crawling_pool import CrawlingPool
 from zeeguu.core.feed_handler import FEED_TYPE
 from tools.crawl_summary.crawl_report import CrawlReport
 
@@ -30,6 +31,23 @@ class FeedTest(ModelTestMixIn, TestCase):
         assert len(self.newspaper_da.get_articles()) > 0
         assert len(self.newspaper_da.get_articles(limit=2)) == 2
 
+    def test_newspaper_items_come_already_parsed(self):
+        self.newspaper_da.initializeFeedHandler()
+        handler = self.newspaper_da.feed_handler
+
+        items = handler.get_feed_articles()
+        assert all(each["np_article"].is_parsed for each in items)
+        assert handler.get_feed_articles(urls_to_skip=lambda urls: set(urls)) == []
+
+    def test_unchanged_feed_is_skipped(self):
+        assert self.spiegel.content_hash
+
+        download_from_feed(self.spiegel, db.session, self.crawl_report, 3, False)
+
+        assert self.spiegel.not_modified_since_last_crawl()
+        assert self.crawl_report.get_total_not_modified_feeds() == 1
+        assert "healthy" in self.spiegel.feed_health_info()
+
     def test_feed_type(self):
         assert self.spiegel.feed_type == FEED_TYPE["rss"]
         assert self.newspaper_da.feed_type == FEED_TYPE["newspaper"]
@@ -48,3 +66,35 @@ class FeedTest(ModelTestMixIn, TestCase):
 
         ordered_by_time = self.spiegel.get_articles(most_recent_first=True)
         assert ordered_by_time[0].published_time >= ordered_by_time[1].published_time
+
+
+class CrawlingPoolTest(ModelTestMixIn, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.crawl_report = CrawlReport()
+        self.spiegel = FeedRule().feed1
+        self.crawl_report.add_feed(self.spiegel)
+
+    def test_download_with_crawling_pool(self):
+        pool = CrawlingPool(workers=4, seconds_between_requests=0)
+        download_from_feed(
+            self.spiegel, db.session, self.crawl_report, 3, False, crawling_pool=pool
+        )
+        pool.shutdown()
+
+        # the same articles as when downloading without the pool
+        assert len(self.spiegel.get_articles()) == 2
+
+    def test_listing_skips_the_articles_already_in_the_db(self):
+        from zeeguu.core.model import Article
+
+        newspaper_da = FeedRule().feed_newspaper_da
+        self.crawl_report.add_feed(newspaper_da)
+        download_from_feed(newspaper_da, db.session, self.crawl_report, 3, False)
+
+        pool = CrawlingPool(workers=2, seconds_between_requests=0)
+        pool.list_feeds([newspaper_da])
+        candidates = pool._listings[newspaper_da.id].result()
+        pool.shutdown()
+
+        assert not Article.urls_in_db(each["url"] for each in candidates)
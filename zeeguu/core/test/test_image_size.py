@@ -0,0 +1,31 @@
+from io import BytesIO
+from unittest import TestCase
+
+from PIL import Image
+
+from zeeguu.core.content_retriever.image_size import image_size_from_header
+
+
+def _image_bytes(image_format, size, **save_args):
+    out = BytesIO()
+    Image.new("RGB", size).save(out, image_format, **save_args)
+    return out.getvalue()
+
+
+class ImageSizeTest(TestCase):
+    def test_size_of_supported_formats(self):
+        for image_format, save_args in [
+            ("PNG", {}),
+            ("GIF", {}),
+            ("JPEG", {}),
+            ("JPEG", {"progressive": True}),
+            ("WEBP", {}),
+            ("WEBP", {"lossless": True}),
+        ]:
+            for size in [(1200, 800), (120, 77)]:
+                data = _image_bytes(image_format, size, **save_args)
+                assert image_size_from_header(data[:1024]) == size, image_format
+
+    def test_unknown_or_truncated(self):
+        assert image_size_from_header(b"<html><body></body></html>") is None
+        assert image_size_from_header(_image_bytes("PNG", (400, 400))[:10]) is None
@@ -57,3 +57,40 @@ class LanguageTest(ModelTestMixIn, TestCase):
 
         self.user.set_native_language(language_should_be.code)
         assert self.user.native_language.id == language_should_be.id
+
+    def test_find_does_not_query_the_db_again(self):
+        from sqlalchemy import event
+
+        language = LanguageRule().random
+        Language.find(language.code)
+        db_session.close()
+
+        queries = []
+
+        def count(*args, **kwargs):
+            queries.append(args)
+
+        event.listen(zeeguu.core.model.db.engine, "before_cursor_execute", count)
+        try:
+            found = Language.find(language.code)
+            assert found is Language.find_by_id(found.id)
+            assert found.name == language.name
+        finally:
+            event.remove(zeeguu.core.model.db.engine, "before_cursor_execute", count)
+        assert not queries
+
+    def test_changes_invalidate_the_cached_languages(self):
+        language = LanguageRule().random
+        Language.find(language.code).name = "Changed"
+        db_session.commit()
+        db_session.close()
+
+        assert Language.find(language.code).name == "Changed"
+
+    def test_rolled_back_languages_are_not_cached(self):
+        db_session.add(Language("xx", "Rolled back"))
+        assert Language.find("xx").name == "Rolled back"
+        db_session.rollback()
+
+        with self.assertRaises(NoResultFound):
+            Language.find("xx")
@@ -0,0 +1,11 @@
+from zeeguu.core.util.per_process import PerProcessSingleton
+
+
+def test_created_once_per_process(monkeypatch):
+    singleton = PerProcessSingleton(object)
+
+    first = singleton.get()
+    assert singleton.get() is first
+
+    monkeypatch.setattr("os.getpid", lambda: -1)
+    assert singleton.get() is not first
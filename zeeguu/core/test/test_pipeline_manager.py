@@ -0,0 +1,58 @@
+import threading
+import time
+from unittest import TestCase
+
+from zeeguu.core.tokenization.pipeline_manager import PipelineManager
+
+
+class PipelineManagerTest(TestCase):
+    def setUp(self):
+        self.created = []
+
+    def _creator(self, key, delay=0):
+        def create():
+            time.sleep(delay)
+            self.created.append(key)
+            return object()
+
+        return create
+
+    def test_pipeline_is_created_once(self):
+        manager = PipelineManager()
+        first = manager.get("en", self._creator("en"))
+        second = manager.get("en", self._creator("en"))
+
+        assert first is second
+        assert self.created == ["en"]
+        assert manager.hits == 1 and manager.misses == 1
+
+    def test_concurrent_requests_create_pipeline_once(self):
+        manager = PipelineManager()
+        threads = [
+            threading.Thread(target=manager.get, args=("da", self._creator("da", 0.1)))
+            for _ in range(5)
+        ]
+        for each in threads:
+            each.start()
+        for each in threads:
+            each.join()
+
+        assert self.created == ["da"]
+
+    def test_least_recently_used_is_evicted(self):
+        manager = PipelineManager(max_resident_pipelines=2)
+        manager.get("en", self._creator("en"))
+        manager.get("da", self._creator("da"))
+        manager.get("en", self._creator("en"))
+        manager.get("fr", self._creator("fr"))
+
+        assert "en" in manager and "fr" in manager
+        assert "da" not in manager
+        assert manager.evictions == 1
+
+    def test_preload(self):
+        manager = PipelineManager()
+        manager.preload(["en", "de"], lambda key: self._creator(key)())
+
+        assert self.created == ["en", "de"]
+        assert len(manager) == 2
@@ -9,7 +9,7 @@ from zeeguu.core.test.rules.scheduler_rule import SchedulerRule
 from zeeguu.core.model import db
 from datetime import datetime, timedelta
 
-from zeeguu.core.word_scheduling import ONE_DAY
+from zeeguu.core.word_scheduling import ONE_DAY, BasicSRSchedule
 
 db_session = db.session
 
@@ -256,6 +256,26 @@ class SchedulerTest(ModelTestMixIn):
         assert schedule.consecutive_correct_answers == 0
         assert schedule.cooling_interval == 0
 
+    def test_bookmarks_priority_to_study_has_one_bookmark_per_word(self):
+        bookmark = self.two_cycles_bookmark1
+        same_word = BookmarkRule(self.two_cycles_user).bookmark
+        same_word.origin = bookmark.origin
+        for each in [bookmark, same_word, self.two_cycles_bookmark2]:
+            each.fit_for_study = 1
+        db_session.commit()
+
+        to_study = BasicSRSchedule.all_bookmarks_priority_to_study(
+            self.two_cycles_user, None
+        )
+
+        words = [each.origin.word.lower() for each in to_study]
+        assert bookmark.origin.word.lower() in words
+        assert len(words) == len(set(words))
+        assert (
+            BasicSRSchedule.all_bookmarks_priority_to_study(self.two_cycles_user, 1)
+            == to_study[:1]
+        )
+
     def test_level_schedule_is_created(self):
         """
         Testing if FourLevelsSchedule creates the schedule once the bookmark is practiced.
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from zeeguu.core.exercises.similar_words import (
+    BAND_SIZE,
+    DistractorPool,
+    distractor_pool,
+)
+from zeeguu.core.word_filter import BAD_WORD_LIST, PROPER_NAMES_LIST
+from zeeguu.core.word_stats import rank_for
+
+
+class SimilarWordsTest(TestCase):
+    def setUp(self):
+        self.pool = distractor_pool("de")
+
+    def test_pool_is_filtered(self):
+        assert distractor_pool("de") is self.pool
+        assert list(self.pool.ranks) == sorted(self.pool.ranks)
+        for word in self.pool.words[:5000]:
+            assert len(word) > 1
+            assert word not in BAD_WORD_LIST
+            assert word not in PROPER_NAMES_LIST
+
+    def test_distractors_have_similar_frequency(self):
+        rank = rank_for("schmetterling", "de").rank
+        start, end = self.pool.band(rank)
+        assert end - start == BAND_SIZE
+
+        for _ in range(20):
+            distractors = self.pool.sample("schmetterling", rank, 3)
+            assert len(set(distractors)) == 3
+            assert "schmetterling" not in distractors
+            assert all(d in self.pool.words[start:end] for d in distractors)
+
+    def test_distractors_for_unknown_words(self):
+        distractors = self.pool.sample("xqzzyx", 100000, 2)
+        assert len(distractors) == 2
+        assert all(d in self.pool.words[-BAND_SIZE:] for d in distractors)
+
+    def test_small_bands_give_fewer_distractors(self):
+        small = DistractorPool.__new__(DistractorPool)
+        small.words, small.ranks = self.pool.words[:2], self.pool.ranks[:2]
+
+        distractors = small.sample(small.words[0], small.ranks[0], 3)
+        assert distractors == [small.words[1]]
@@ -1,7 +1,9 @@
 from zeeguu.core.test.model_test_mixin import ModelTestMixIn
 from zeeguu.core.tokenization import get_tokenizer, TokenizerModel
+from zeeguu.core.tokenization.token import tokens_as_json
 from zeeguu.core.test.rules.language_rule import LanguageRule
 from zeeguu.core.test.mocking_the_web import TESTDATA_FOLDER
+import json
 import os
 import random
 
@@ -389,3 +391,30 @@ class TokenizationTest(ModelTestMixIn):
         )
         assert ["En", "20-årig", "mand"] == [t.text for t in token_number_with_text]
         assert not token_number_with_text[1].is_like_num
+
+    def test_tokenize_many_matches_tokenize_text(self):
+        texts = [
+            "I don't know. He said it's fine.",
+            "This is a paragraph.\n\nThis is another one.",
+            "A single sentence",
+        ]
+        offsets = [(0, 0, 0), (3, 1, 2), (5, 0, 1)]
+
+        batched = self.en_tokenizer.tokenize_many(texts, offsets, flatten=False)
+
+        for text, (token_i, sent_i, par_i), tokens in zip(texts, offsets, batched):
+            assert tokens == self.en_tokenizer.tokenize_text(
+                text,
+                flatten=False,
+                start_token_i=token_i,
+                start_sentence_i=sent_i,
+                start_paragraph_i=par_i,
+            )
+
+    def test_tokens_as_json_matches_serializable_dictionary(self):
+        text = "Email me at someone@example.com or visit www.zeeguu.org!\n\n12,5 «ok»"
+        tokens = self.en_tokenizer.tokenize_text(text, False, flatten=False)
+
+        assert json.loads(tokens_as_json(tokens)) == self.en_tokenizer.tokenize_text(
+            text, flatten=False
+        )
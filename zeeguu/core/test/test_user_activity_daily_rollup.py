@@ -0,0 +1,56 @@
+from zeeguu.core.test.model_test_mixin import ModelTestMixIn
+from zeeguu.core.test.rules.bookmark_rule import BookmarkRule
+from zeeguu.core.test.rules.user_reading_session_rule import ReadingSessionRule
+from zeeguu.core.model import UserActivityDailyRollup, db
+
+
+class UserActivityDailyRollupTest(ModelTestMixIn):
+    def setUp(self):
+        super().setUp()
+        self.reading_session = ReadingSessionRule().w_session
+        self.reading_session.duration = 60000
+        self.user = self.reading_session.user
+        self.day = self.reading_session.start_time.date()
+
+        self.bookmark = BookmarkRule(self.user).bookmark
+        self.bookmark.time = self.reading_session.start_time
+        db.session.commit()
+
+    def test_recompute(self):
+        UserActivityDailyRollup.recompute(db.session, self.day, self.day)
+
+        totals = UserActivityDailyRollup.totals([self.user.id], self.day, self.day)
+        assert totals[self.user.id]["reading_ms"] == 60000
+        assert totals[self.user.id]["translations"] == 1
+        assert totals[self.user.id]["exercises"] == 0
+
+    def test_recompute_is_idempotent(self):
+        UserActivityDailyRollup.recompute(db.session, self.day, self.day)
+        UserActivityDailyRollup.recompute_day_of(
+            db.session, self.user.id, self.reading_session.start_time
+        )
+
+        assert UserActivityDailyRollup.by_day(self.user.id) == [(self.day, 60000, 0)]
+
+    def test_exercise_sessions_without_exercises_are_not_counted(self):
+        from zeeguu.core.model import UserExerciseSession
+
+        session = UserExerciseSession(self.user.id, self.reading_session.start_time)
+        session.duration = 5000
+        db.session.add(session)
+        db.session.commit()
+
+        UserActivityDailyRollup.recompute(db.session, self.day, self.day)
+
+        totals = UserActivityDailyRollup.totals([self.user.id], self.day, self.day)
+        assert totals[self.user.id]["exercise_ms"] == 0
+
+    def test_todays_activity_is_counted_before_it_is_rolled_up(self):
+        from datetime import datetime
+
+        now = datetime.now()
+        self.reading_session.start_time = now
+        db.session.commit()
+
+        totals = UserActivityDailyRollup.totals([self.user.id], now, now)
+        assert totals[self.user.id]["reading_ms"] == 60000
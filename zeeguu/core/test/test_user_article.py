@@ -30,3 +30,13 @@ class UserArticleTest(ModelTestMixIn, TestCase):
     def test_all_starred_or_liked_articles(self):
         self.article.star_for_user(db_session, self.user)
         assert 1 == len(UserArticle.all_starred_or_liked_articles_of_user(self.user))
+
+    def test_user_article_infos(self):
+        other_article = ArticleRule().article
+        self.article.star_for_user(db_session, self.user)
+
+        infos = UserArticle.user_article_infos(self.user, [self.article, other_article])
+
+        assert [each["id"] for each in infos] == [self.article.id, other_article.id]
+        assert infos[0]["starred"] and not infos[1]["starred"]
+        assert infos[1] == UserArticle.user_article_info(self.user, other_article)
@@ -0,0 +1,53 @@
+import sqlite3
+from unittest import TestCase
+from unittest.mock import patch
+
+from wordstats import Word
+from wordstats.disk_store import LanguageStore
+
+import zeeguu.core.word_stats as word_stats
+from zeeguu.core.word_stats import UNKNOWN_WORD, rank_for, ranks_for
+
+
+class WordStatsTest(TestCase):
+    def test_ranks_are_the_ones_of_wordstats(self):
+        words = ["Haus", "und", "der", "Schmetterling", "xqzzyx"]
+
+        ranks = ranks_for(words, "de")
+
+        assert set(ranks) == set(words)
+        for word in words:
+            stats = Word.stats(word, "de")
+            assert ranks[word].rank == stats.rank
+            assert ranks[word].importance == stats.importance
+
+    def test_unknown_words(self):
+        assert rank_for("xqzzyx", "de") == UNKNOWN_WORD
+        # the second time it comes from the cache
+        assert rank_for("xqzzyx", "de") == UNKNOWN_WORD
+
+    def test_words_differing_only_in_case(self):
+        ranks = ranks_for(["Haus", "haus"], "de")
+
+        assert ranks["Haus"] == ranks["haus"] == rank_for("HAUS", "de")
+
+    def test_falls_back_to_lookups_when_the_file_cant_be_queried(self):
+        words = ["Haus", "und", "xqzzyx"]
+        expected = {w: rank_for(w, "de") for w in words}
+        word_stats._ranks_cache.clear()
+
+        original_query = LanguageStore._query
+
+        def query_without_batches(store, sql, params=()):
+            # e.g. wordstats renamed the columns that we query directly
+            if "WHERE word IN" in sql:
+                raise sqlite3.OperationalError("no such column: occurrences")
+            return original_query(store, sql, params)
+
+        try:
+            with patch.object(LanguageStore, "_query", query_without_batches):
+                assert ranks_for(words, "de") == expected
+            # and it does not try again
+            assert not word_stats._direct_queries_work
+        finally:
+            word_stats._direct_queries_work = True
@@ -185,3 +185,21 @@ class FleschKincaidReadingEaseDifficultyEstimatorTest(ModelTestMixIn, TestCase):
             DA_TEXT_YING_MEDIUM, lan, self.user
         )
         self.assertEqual(d["discrete"], "MEDIUM")
+
+    def test_text_statistics(self):
+        lan = LanguageRule().en
+        stats = FleschKincaidDifficultyEstimator.text_statistics(E_EASY_TEXT, lan)
+
+        self.assertEqual((6, 1, 6), stats)
+
+    def test_estimate_difficulties(self):
+        lan = LanguageRule().de
+        texts = [DE_EASY_TEXT, DE_MEDIUM_TEXT, DE_HARD_TEXT]
+
+        self.assertEqual(
+            [
+                FleschKincaidDifficultyEstimator.estimate_difficulty(t, lan, self.user)
+                for t in texts
+            ],
+            FleschKincaidDifficultyEstimator.estimate_difficulties(texts, lan),
+        )
@@ -17,3 +17,19 @@ def get_tokenizer(language, model):
         return StanzaTokenizer(language, model)
     else:
         return NLTKTokenizer(language)
+
+
+def configure_nlp_pipelines(config):
+    """
+    - MAX_RESIDENT_NLP_PIPELINES: how many pipelines a process keeps in memory
+    (default: no limit)
+    - PRELOAD_NLP_PIPELINES: language codes for which the pipeline of the
+    TOKENIZER_MODEL is loaded right away (default: none)
+    """
+    StanzaTokenizer.CACHED_NLP_PIPELINES.configure(
+        config.get("MAX_RESIDENT_NLP_PIPELINES", None)
+    )
+    if TOKENIZER_MODEL in StanzaTokenizer.STANZA_MODELS:
+        StanzaTokenizer.preload(
+            config.get("PRELOAD_NLP_PIPELINES", []), TOKENIZER_MODEL
+        )
@@ -0,0 +1,125 @@
+import threading
+import time
+from collections import OrderedDict
+
+from zeeguu.logging import log, warning
+
+
+def _pipeline_size_in_bytes(pipeline):
+    """
+    Approximates the memory a Stanza pipeline keeps resident by adding up
+    the parameters of the models of its processors.
+    """
+    size = 0
+    for processor in getattr(pipeline, "processors", {}).values():
+        trainer = getattr(processor, "trainer", None)
+        model = getattr(trainer, "model", None)
+        if model is None or not hasattr(model, "parameters"):
+            continue
+        size += sum(p.numel() * p.element_size() for p in model.parameters())
+    return size
+
+
+class PipelineManager:
+    """
+    Keeps the NLP pipelines that were loaded in this process.
+
+    Pipelines take hundreds of MB each, so at most max_resident_pipelines are
+    kept; when a new one is needed the least recently used one is dropped.
+    A pipeline is only built once even when several threads ask for it at
+    the same time: the others wait for the first one to finish loading.
+
+    max_resident_pipelines=None means that there is no limit.
+    """
+
+    def __init__(self, max_resident_pipelines=None):
+        self.max_resident_pipelines = max_resident_pipelines
+
+        self._pipelines = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading_locks = {}
+
+        self.load_seconds = {}
+        self.resident_bytes = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_resident_pipelines=None):
+        with self._lock:
+            self.max_resident_pipelines = max_resident_pipelines
+            self._evict_if_needed()
+
+    def __contains__(self, key):
+        return key in self._pipelines
+
+    def __len__(self):
+        return len(self._pipelines)
+
+    def get(self, key, create_pipeline):
+        """
+        Returns the pipeline for the key, calling create_pipeline() to
+        build it if it's not resident.
+        """
+        with self._lock:
+            if key in self._pipelines:
+                self.hits += 1
+                self._pipelines.move_to_end(key)
+                return self._pipelines[key]
+            loading_lock = self._loading_locks.setdefault(key, threading.Lock())
+
+        with loading_lock:
+            # somebody else might have loaded it while we were waiting
+            with self._lock:
+                if key in self._pipelines:
+                    self.hits += 1
+                    self._pipelines.move_to_end(key)
+                    return self._pipelines[key]
+
+            start = time.time()
+            pipeline = create_pipeline()
+            load_seconds = time.time() - start
+            size = _pipeline_size_in_bytes(pipeline)
+
+            with self._lock:
+                self.misses += 1
+                self.load_seconds[key] = load_seconds
+                self.resident_bytes[key] = size
+                self._pipelines[key] = pipeline
+                self._evict_if_needed()
+                self._loading_locks.pop(key, None)
+
+            log(
+                f"Loaded NLP pipeline {key} in {load_seconds:.2f}s "
+                f"(~{size // (1024 * 1024)}MB); {len(self._pipelines)} resident"
+            )
+            return pipeline
+
+    def preload(self, keys, create_pipeline_for_key):
+        for key in keys:
+            try:
+                self.get(key, lambda: create_pipeline_for_key(key))
+            except Exception as e:
+                warning(f"Could not preload NLP pipeline {key}: {e}")
+
+    def _evict_if_needed(self):
+        # must be called with self._lock held
+        if self.max_resident_pipelines is None:
+            return
+        while len(self._pipelines) > max(self.max_resident_pipelines, 1):
+            key, _ = self._pipelines.popitem(last=False)
+            self.resident_bytes.pop(key, None)
+            self.evictions += 1
+            log(f"Evicted NLP pipeline {key}")
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                resident=[str(key) for key in self._pipelines],
+                resident_bytes=sum(self.resident_bytes.values()),
+                max_resident_pipelines=self.max_resident_pipelines,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                load_seconds={str(k): v for k, v in self.load_seconds.items()},
+            )
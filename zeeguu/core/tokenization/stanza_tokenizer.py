@@ -1,5 +1,6 @@
 from zeeguu.core.tokenization.token import Token
 from zeeguu.core.tokenization.zeeguu_tokenizer import ZeeguuTokenizer, TokenizerModel
+from zeeguu.core.tokenization.pipeline_manager import PipelineManager
 from zeeguu.core.model.language import Language
 import re
 from os import getenv
@@ -31,8 +32,9 @@ class StanzaTokenizer(ZeeguuTokenizer):
         [TokenizerModel.STANZA_TOKEN_ONLY, TokenizerModel.STANZA_TOKEN_POS]
     )
     # We cache the models to avoid having to re-initialize pipelines everytime.
-    # Once the model is loaded it's kept in memory for later use.
-    CACHED_NLP_PIPELINES = {}
+    # Once the model is loaded it's kept in memory for later use; the number of
+    # resident pipelines can be limited with CACHED_NLP_PIPELINES.configure
+    CACHED_NLP_PIPELINES = PipelineManager()
 
     def _get_processor(model: TokenizerModel):
         if model == TokenizerModel.STANZA_TOKEN_ONLY:
@@ -41,20 +43,32 @@ class StanzaTokenizer(ZeeguuTokenizer):
             return "tokenize,pos"
         return ""
 
+    @classmethod
+    def _create_pipeline(cls, language_code: str, model: TokenizerModel):
+        return stanza.Pipeline(
+            lang=language_code,
+            processors=StanzaTokenizer._get_processor(model),
+            download_method=None,
+            model_dir=STANZA_RESOURCE_DIR,
+        )
+
+    @classmethod
+    def preload(cls, language_codes: list, model: TokenizerModel):
+        """
+        Loads the pipelines for the given languages so that the first
+        request for each of them doesn't have to wait for the model to load.
+        """
+        cls.CACHED_NLP_PIPELINES.preload(
+            [(code, model) for code in language_codes],
+            lambda key: cls._create_pipeline(*key),
+        )
+
     def __init__(self, language: Language, model: TokenizerModel):
         super().__init__(language, model)
         key = (self.language.code, self.model_type)
-        if self.model_type in StanzaTokenizer.STANZA_MODELS:
-            # Store used models.
-            if key not in StanzaTokenizer.CACHED_NLP_PIPELINES:
-                pipeline = stanza.Pipeline(
-                    lang=self.language.code,
-                    processors=StanzaTokenizer._get_processor(model),
-                    download_method=None,
-                    model_dir=STANZA_RESOURCE_DIR,
-                )
-                StanzaTokenizer.CACHED_NLP_PIPELINES[key] = pipeline
-        self.nlp_pipeline = StanzaTokenizer.CACHED_NLP_PIPELINES[key]
+        self.nlp_pipeline = StanzaTokenizer.CACHED_NLP_PIPELINES.get(
+            key, lambda: StanzaTokenizer._create_pipeline(*key)
+        )
 
     def is_language_supported(self, language: Language):
         #   This is based on the models installed, if we expand the languages we support
@@ -84,6 +98,53 @@ class StanzaTokenizer(ZeeguuTokenizer):
         start_token_i: int = 0,
         start_sentence_i: int = 0,
         start_paragraph_i: int = 0,
+    ):
+        return self._tokens_from_doc(
+            self.nlp_pipeline(text),
+            as_serializable_dictionary,
+            flatten,
+            start_token_i,
+            start_sentence_i,
+            start_paragraph_i,
+        )
+
+    def tokenize_many(
+        self,
+        texts: list,
+        offsets: list = None,
+        as_serializable_dictionary: bool = True,
+        flatten: bool = True,
+    ):
+        """
+        Runs all the texts through the pipeline in a single call; Stanza
+        tokenizes them together and splits the result back into one
+        document per text.
+        """
+        if offsets is None:
+            offsets = [(0, 0, 0)] * len(texts)
+        docs = self.nlp_pipeline([stanza.Document([], text=text) for text in texts])
+        return [
+            self._tokens_from_doc(
+                doc,
+                as_serializable_dictionary,
+                flatten,
+                start_token_i,
+                start_sentence_i,
+                start_paragraph_i,
+            )
+            for doc, (start_token_i, start_sentence_i, start_paragraph_i) in zip(
+                docs, offsets
+            )
+        ]
+
+    def _tokens_from_doc(
+        self,
+        doc,
+        as_serializable_dictionary: bool,
+        flatten: bool,
+        start_token_i: int,
+        start_sentence_i: int,
+        start_paragraph_i: int,
     ):
         # Backwards compatability (to texts without coordinates.)
         if start_token_i is None:
@@ -93,7 +154,6 @@ class StanzaTokenizer(ZeeguuTokenizer):
         if start_paragraph_i is None:
             start_paragraph_i = 0
         paragraphs = []
-        doc = self.nlp_pipeline(text)
         current_paragraph = []
         s_i = 0
         for sentence in doc.sentences:
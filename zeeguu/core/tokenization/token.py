@@ -1,7 +1,19 @@
 import re
+from functools import lru_cache
+from json.encoder import encode_basestring
 from string import punctuation
 
 
+def _json_value(value):
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
+
 class Token:
     PUNCTUATION = "»«" + punctuation + "–—“‘”“’„¿»«"
     SYMBOLS = "©€£$#&@<=>§¢¥¤®º"
@@ -17,12 +29,32 @@ class Token:
         r"(((http|https)://)?(www\.)?([a-zA-Z0-9@\-/\.]+\.[a-z]{2,4}/?([a-zA-Z0-9?=\.&#/]+)?)+)"
     )
 
+    # An article has thousands of tokens, so we keep them as small as possible
+    __slots__ = (
+        "text",
+        "is_sent_start",
+        "is_punct",
+        "is_symbol",
+        "is_left_punct",
+        "is_right_punct",
+        "par_i",
+        "sent_i",
+        "token_i",
+        "is_like_email",
+        "is_like_url",
+        "is_like_num",
+        "has_space",
+        "pos",
+        "_json_prefix",
+    )
+
+    # not called is_like_email / is_like_url: those names are taken by the slots
     @classmethod
-    def is_like_email(cls, text):
+    def text_is_like_email(cls, text):
         return Token.EMAIL_REGEX.match(text) is not None
 
     @classmethod
-    def is_like_url(cls, text):
+    def text_is_like_url(cls, text):
         return Token.URL_REGEX.match(text) is not None
 
     @classmethod
@@ -43,6 +75,52 @@ class Token:
         text = text.replace("''", '"')
         return text
 
+    @staticmethod
+    @lru_cache(maxsize=2**16)
+    def _classify(text):
+        """
+        Computes everything about a token that only depends on its text.
+
+        Most of the tokens in a text are repeated words, so the result is
+        memoized per distinct text. The cheap character checks avoid running
+        regexes that can't match: an email needs an @, a url needs a dot, and
+        a number starts with a digit.
+
+        Returns the processed text, the flags, and the beginning of the JSON
+        representation of the token (see as_json).
+        """
+        processed = Token._token_punctuation_processing(text)
+        is_punct = Token.is_punctuation(processed)
+        is_symbol = Token.is_like_symbols(processed)
+        is_left_punct = text in Token.LEFT_PUNCTUATION
+        is_right_punct = text in Token.RIGHT_PUNCTUATION
+        is_like_email = "@" in text and Token.text_is_like_email(text)
+        is_like_url = "." in text and Token.text_is_like_url(text)
+        is_like_num = text[:1].isdigit() and Token.NUM_REGEX.match(text) is not None
+
+        json_prefix = (
+            f'{{"text":{encode_basestring(processed)}'
+            f',"is_punct":{_json_value(is_punct)}'
+            f',"is_symbol":{_json_value(is_symbol)}'
+            f',"is_left_punct":{_json_value(is_left_punct)}'
+            f',"is_right_punct":{_json_value(is_right_punct)}'
+            f',"is_like_num":{_json_value(is_like_num)}'
+            f',"is_like_email":{_json_value(is_like_email)}'
+            f',"is_like_url":{_json_value(is_like_url)}'
+        )
+
+        return (
+            processed,
+            is_punct,
+            is_symbol,
+            is_left_punct,
+            is_right_punct,
+            is_like_email,
+            is_like_url,
+            is_like_num,
+            json_prefix,
+        )
+
     def __init__(
         self, text, par_i=None, sent_i=None, token_i=None, has_space=None, pos=None
     ):
@@ -50,18 +128,21 @@ class Token:
         sent_i - the sentence in the overall text.
         token_i - the index of the token in the original sentence.
         """
-        self.text = Token._token_punctuation_processing(text)
+        (
+            self.text,
+            self.is_punct,
+            self.is_symbol,
+            self.is_left_punct,
+            self.is_right_punct,
+            self.is_like_email,
+            self.is_like_url,
+            self.is_like_num,
+            self._json_prefix,
+        ) = Token._classify(text)
         self.is_sent_start = token_i == 0
-        self.is_punct = Token.is_punctuation(self.text)
-        self.is_symbol = Token.is_like_symbols(self.text)
-        self.is_left_punct = text in Token.LEFT_PUNCTUATION
-        self.is_right_punct = text in Token.RIGHT_PUNCTUATION
         self.par_i = par_i
         self.sent_i = sent_i
         self.token_i = token_i
-        self.is_like_email = Token.is_like_email(text)
-        self.is_like_url = Token.is_like_url(text)
-        self.is_like_num = Token.NUM_REGEX.match(text) is not None
         self.has_space = has_space
         self.pos = pos
 
@@ -85,3 +166,29 @@ class Token:
             "has_space": self.has_space,
             "pos": self.pos,
         }
+
+    def as_json(self):
+        """
+        The JSON of as_serializable_dictionary, written directly
+        without building the dictionary first.
+        """
+        return (
+            f"{self._json_prefix}"
+            f',"is_sent_start":{_json_value(self.is_sent_start)}'
+            f',"sent_i":{_json_value(self.sent_i)}'
+            f',"token_i":{_json_value(self.token_i)}'
+            f',"paragraph_i":{_json_value(self.par_i)}'
+            f',"has_space":{_json_value(self.has_space)}'
+            f',"pos":{"null" if self.pos is None else encode_basestring(self.pos)}}}'
+        )
+
+
+def tokens_as_json(tokens):
+    """
+    Writes the result of tokenize_text(..., as_serializable_dictionary=False)
+    as JSON; works both for flat token lists and for the nested
+    paragraph / sentence / token lists.
+    """
+    if isinstance(tokens, Token):
+        return tokens.as_json()
+    return "[" + ",".join([tokens_as_json(each) for each in tokens]) + "]"
@@ -61,5 +61,37 @@ class ZeeguuTokenizer:
         """
         raise NotImplementedError
 
+    def tokenize_many(
+        self,
+        texts: list,
+        offsets: list = None,
+        as_serializable_dictionary=True,
+        flatten=True,
+    ):
+        """
+        Tokenizes several texts at once; returns a list with the result of
+        tokenize_text for each of the texts.
+
+        - offsets:list - optional, one (start_token_i, start_sentence_i, start_paragraph_i)
+        tuple per text; see tokenize_text.
+
+        Tokenizers that can process several documents in one go should override this.
+        """
+        if offsets is None:
+            offsets = [(0, 0, 0)] * len(texts)
+        return [
+            self.tokenize_text(
+                text,
+                as_serializable_dictionary,
+                flatten,
+                start_token_i,
+                start_sentence_i,
+                start_paragraph_i,
+            )
+            for text, (start_token_i, start_sentence_i, start_paragraph_i) in zip(
+                texts, offsets
+            )
+        ]
+
     def get_sentences(self, text: str):
         raise NotImplementedError
@@ -15,6 +15,9 @@ def exercises_duration_by_day(user):
 
 
 def activity_duration_by_day(user):
+    # straight from the sessions rather than from the daily rollup: the
+    # graph must show today's sessions, and those that were never ended,
+    # before the rollup catches up with them
     return {
         "reading": convert_to_date_seconds(reading_duration_by_day(user)),
         "exercises": convert_to_date_seconds(exercises_duration_by_day(user)),
@@ -1,20 +1,45 @@
-from sqlalchemy import text
+from sqlalchemy import text, bindparam
 
 import zeeguu.core
 
 from zeeguu.core.model import db
+from zeeguu.core.model.cohort import Cohort
+from zeeguu.core.model.user_activity_daily_rollup import UserActivityDailyRollup
+
+# before this day the outcomes of the exercises were saved in a different format
+FIRST_DAY_WITH_COMPARABLE_OUTCOMES = "2021-05-24"
 
 
 def exercise_count_and_correctness_percentage(user_id, cohort_id, start_date, end_date):
-    outcome_stats = exercise_outcome_stats(user_id, cohort_id, start_date, end_date)
+    return exercise_count_and_correctness_percentage_for_users(
+        [user_id], cohort_id, start_date, end_date
+    )[user_id]
 
-    total = 0
-    for each in outcome_stats.values():
-        total += each
 
+def exercise_count_and_correctness_percentage_for_users(
+    user_ids, cohort_id, start_date, end_date
+):
+    """
+    Like exercise_count_and_correctness_percentage, but for many users
+    with a single query on the daily activity rollup
+
+    :return: dictionary from user id to the exercise stats of that user
+    """
+    start_date = max(str(start_date)[:10], FIRST_DAY_WITH_COMPARABLE_OUTCOMES)
+    totals = UserActivityDailyRollup.totals(
+        user_ids, start_date, end_date, Cohort.find(cohort_id).language_id
+    )
+    return {
+        user_id: _count_and_correctness_percentage(
+            totals[user_id]["exercises"], totals[user_id]["correct_on_first_try"]
+        )
+        for user_id in user_ids
+    }
+
+
+def _count_and_correctness_percentage(total, correct_count):
     correct_on_1st_try = "0"
     if total != 0:
-        correct_count = outcome_stats.get("C", 0) + outcome_stats.get("Correct", 0)
         correct_on_1st_try = int(correct_count / total * 100) / 100
 
     r = {"correct_on_1st_try": correct_on_1st_try, "number_of_exercises": total}
@@ -121,35 +146,22 @@ def number_of_distinct_words_in_exercises(user_id, cohort_id, start_date, end_da
 
 
 def number_of_learned_words(user_id, cohort_id, start_date, end_date):
-    query = """
-        select 	count(b.id)
-        
-        from bookmark as b
-        join user_word as uw
-            on b.origin_id = uw.id
-        
-        where b.user_id=:userid 
-            and	b.learned_time > :startDate
-            and	b.learned_time < :endDate
-            and uw.language_id = (select language_id from cohort where cohort.id=:cohortId)
-    """
-
-    rows = db.session.execute(
-        text(query),
-        {
-            "userid": user_id,
-            "startDate": start_date,
-            "endDate": end_date,
-            "cohortId": cohort_id,
-        },
+    totals = UserActivityDailyRollup.totals(
+        [user_id], start_date, end_date, Cohort.find(cohort_id).language_id
     )
-
-    return {"learned_words_count": rows.first()[0]}
+    return {"learned_words_count": totals[user_id]["words_learned"]}
 
 
 def exercise_outcome_stats(user_id, cohort_id, start_date: str, end_date: str):
+    stats = exercise_outcome_stats_for_users([user_id], cohort_id, start_date, end_date)
+    return stats[user_id]
+
+
+def exercise_outcome_stats_for_users(
+    user_ids, cohort_id, start_date: str, end_date: str
+):
     query = """
-        select o.outcome, count(o.outcome)
+        select b.user_id, o.outcome, count(o.outcome)
             
         from exercise as e
         join bookmark_exercise_mapping as bem
@@ -161,27 +173,27 @@ def exercise_outcome_stats(user_id, cohort_id, start_date: str, end_date: str):
         join user_word as uw
             on b.origin_id = uw.id
                     
-        where b.user_id=:userid 
+        where b.user_id in :userids 
             and e.time > '2021-05-24' -- before this date data is saved in a different format...
             and	e.time > :startDate
             and	e.time < :endDate
             and uw.language_id = (select language_id from cohort where cohort.id=:cohortId)            
                     
-        group by outcome
+        group by b.user_id, outcome
     """
 
     rows = db.session.execute(
-        text(query),
+        text(query).bindparams(bindparam("userids", expanding=True)),
         {
-            "userid": user_id,
+            "userids": list(user_ids),
             "startDate": start_date,
             "endDate": end_date,
             "cohortId": cohort_id,
         },
     )
 
-    result = {}
+    result = {user_id: {} for user_id in user_ids}
     for row in rows:
-        result[row[0]] = row[1]
+        result[row[0]][row[1]] = row[2]
 
     return result
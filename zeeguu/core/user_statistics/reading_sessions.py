@@ -1,6 +1,6 @@
 from statistics import mean
 
-from sqlalchemy import text
+from sqlalchemy import text, bindparam
 
 import zeeguu.core
 
@@ -8,13 +8,34 @@ from zeeguu.core.model import db
 
 
 def summarize_reading_activity(user_id, cohort_id, start_date, end_date):
+    r_sessions = reading_sessions(
+        user_id, cohort_id, start_date, end_date, with_translations=False
+    )
+    return _summarize_reading_sessions(r_sessions)
+
+
+def summarize_reading_activity_for_users(user_ids, cohort_id, start_date, end_date):
+    """
+    Like summarize_reading_activity, but for many users with a single query
+
+    :return: dictionary from user id to the summary of that user
+    """
+    sessions_by_user = {user_id: [] for user_id in user_ids}
+    for session in _reading_sessions(user_ids, cohort_id, start_date, end_date):
+        sessions_by_user[session["user_id"]].append(session)
+
+    return {
+        user_id: _summarize_reading_sessions(sessions)
+        for user_id, sessions in sessions_by_user.items()
+    }
+
+
+def _summarize_reading_sessions(r_sessions):
     def _mean(l):
         if len(l) == 0:
             return 0
         return int(mean(l))
 
-    r_sessions = reading_sessions(user_id, cohort_id, start_date, end_date)
-
     distinct_texts = set()
     reading_time = 0
     text_lengths = []
@@ -50,7 +71,18 @@ def summarize_reading_activity(user_id, cohort_id, start_date, end_date):
 """
 
 
-def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
+def reading_sessions(
+    user_id, cohort_id, from_date: str, to_date: str, with_translations=True
+):
+    result = _reading_sessions([user_id], cohort_id, from_date, to_date)
+
+    if with_translations:
+        _add_translations_to_sessions(result, user_id)
+
+    return result
+
+
+def _reading_sessions(user_ids, cohort_id, from_date: str, to_date: str):
     query = """
             select  u.id as session_id, 
                 user_id, 
@@ -70,7 +102,7 @@ def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
             on u.article_id = a.id
             
         where 
-            user_id = :userId
+            user_id in :userIds
             and start_time > :startDate
             and last_action_time <= :endDate
             and duration > 0
@@ -81,24 +113,39 @@ def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
     """
 
     rows = db.session.execute(
-        text(query),
+        text(query).bindparams(bindparam("userIds", expanding=True)),
         {
-            "userId": user_id,
+            "userIds": list(user_ids),
             "startDate": from_date,
             "endDate": to_date,
             "cohortId": cohort_id,
         },
     )
 
-    result = []
-    for row in rows:
-        session = dict(row._mapping)
-        session["translations"] = translations_in_interval(
-            session["start_time"], session["end_time"], user_id
-        )
-        result.append(session)
+    return [dict(row._mapping) for row in rows]
 
-    return result
+
+def _add_translations_to_sessions(sessions, user_id):
+    """
+    Sets the translations of every session, like translations_in_interval
+    would, but with one query for all the sessions instead of one per session
+    """
+    if not sessions:
+        return
+
+    translations = translations_in_interval(
+        min(session["start_time"] for session in sessions),
+        max(session["end_time"] for session in sessions),
+        user_id,
+        with_time=True,
+    )
+
+    for session in sessions:
+        session["translations"] = [
+            {key: value for key, value in each.items() if key != "time"}
+            for each in translations
+            if session["start_time"] < each["time"] <= session["end_time"]
+        ]
 
 
 """
@@ -111,10 +158,11 @@ def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
 """
 
 
-def translations_in_interval(start_time, end_time, user_id):
+def translations_in_interval(start_time, end_time, user_id, with_time=False):
     query = """
         select 
             b.id, 
+            b.time,
             uw.word, 
             uwt.word as translation,
             t.content as context,
@@ -148,6 +196,8 @@ def translations_in_interval(start_time, end_time, user_id):
     result = []
     for row in rows:
         session = dict(row._mapping)
+        if not with_time:
+            del session["time"]
         result.append(session)
 
     return result
@@ -11,6 +11,35 @@ class JSONSerializable(object):
         raise NotImplementedError()
 
 
+class RawJSON(object):
+    """
+    A value that is already serialized: json_result writes the JSON text
+    into the response as it is, instead of parsing it into dictionaries
+    only to encode them again. The code that needs the value itself can
+    still get it (parsed once) from value.
+    """
+
+    _NOT_PARSED = object()
+
+    def __init__(self, json_text):
+        self.json = json_text
+        self._value = self._NOT_PARSED
+
+    @property
+    def value(self):
+        if self._value is self._NOT_PARSED:
+            self._value = json.loads(self.json)
+        return self._value
+
+    def __eq__(self, other):
+        if isinstance(other, RawJSON):
+            other = other.value
+        return self.value == other
+
+    def __repr__(self):
+        return f"RawJSON({self.json[:50]!r})"
+
+
 def _encoder(obj):
     if isinstance(obj, JSONSerializable):
         return obj.serialize()
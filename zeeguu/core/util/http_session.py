@@ -0,0 +1,57 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from zeeguu.core.util.per_process import PerProcessSingleton
+
+# (connect, read) in seconds; used for every request that does not pass its own
+DEFAULT_TIMEOUT = (5, 20)
+
+# for how many hosts connection pools are kept; the pool of the least
+# recently used one is dropped beyond that. The crawler talks to the
+# sites of all the feeds, besides the local services
+MAX_HOSTS = 64
+
+# how many connections are kept open to the same host; the crawler
+# can have several threads talking to the same site / local service
+MAX_CONNECTIONS_PER_HOST = 16
+
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 502, 503, 504),
+    # the POSTs we do (embeddings) don't change anything on the server
+    allowed_methods=frozenset(["HEAD", "GET", "POST"]),
+    raise_on_status=False,
+)
+
+
+class _SessionWithTimeout(requests.Session):
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+
+def _create_session():
+    session = _SessionWithTimeout()
+    adapter = HTTPAdapter(
+        pool_connections=MAX_HOSTS,
+        pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+        max_retries=RETRY,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_session = PerProcessSingleton(_create_session)
+
+
+def http_session():
+    """
+    The requests.Session shared by everything in this process that talks
+    to other servers. Reusing it keeps connections alive between requests
+    (no new TCP / TLS handshake per article) and gives every request a
+    timeout and retries with backoff.
+    """
+    return _session.get()
@@ -0,0 +1,27 @@
+import os
+import threading
+
+
+class PerProcessSingleton:
+    """
+    An object shared by all the threads of a process, created by calling
+    create() the first time it's needed.
+
+    A forked process (e.g. a gunicorn worker) creates its own, so what
+    the object holds (e.g. open connections) is never shared between
+    processes.
+    """
+
+    def __init__(self, create):
+        self._create = create
+        self._instance = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        if self._instance is None or self._pid != os.getpid():
+            with self._lock:
+                if self._instance is None or self._pid != os.getpid():
+                    self._instance = self._create()
+                    self._pid = os.getpid()
+        return self._instance
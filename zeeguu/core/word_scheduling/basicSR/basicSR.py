@@ -8,11 +8,22 @@ from zeeguu.core.model import db
 
 from datetime import datetime, timedelta
 
+from sqlalchemy import text
+
+from zeeguu.core.word_stats import UNKNOWN_WORD_RANK
+
 ONE_DAY = 60 * 24
 
 
 class BasicSRSchedule(db.Model):
-    __table_args__ = {"mysql_collate": "utf8_bin"}
+    __table_args__ = (
+        db.Index(
+            "basic_sr_schedule_bookmark_next_practice",
+            "bookmark_id",
+            "next_practice_time",
+        ),
+        {"mysql_collate": "utf8_bin"},
+    )
     __tablename__ = "basic_sr_schedule"
 
     id = db.Column(db.Integer, primary_key=True)
@@ -152,7 +163,7 @@ class BasicSRSchedule(db.Model):
         # The scheduled bookmarks are sorted by the most common in the language and
         # then by cooling interval, meaning the words that are closest to being learned
         # come before the ones that are just learned.
-        scheduled_candidates_query.order_by(
+        scheduled_candidates_query = scheduled_candidates_query.order_by(
             -UserWord.rank.desc(), cls.cooling_interval.desc()
         )  # By using the negative for rank, we ensure NULL is last.
         if limit is None:
@@ -211,28 +222,40 @@ class BasicSRSchedule(db.Model):
          1. Words that are most common in the language (utilizing the word rank in the db
          2. Words that are closest to being learned (indicated by `cooling_interval`,
         the highest the closest it is)
-        """
 
-        def priority_by_rank(bookmark):
-            # If this is updated remember to update the order_by in
-            # get_scheduled_bookmarks_for_user and get_unscheduled_bookmarks_for_user
-            bookmark_info = bookmark.as_dictionary(with_exercise_info=True)
-            cooling_interval = bookmark_info["cooling_interval"]
-            cooling_interval = cooling_interval if cooling_interval is not None else -1
-            word_rank = bookmark_info["origin_rank"]
-            if word_rank == "":
-                word_rank = UserWord.IMPOSSIBLE_RANK
-            return word_rank, -cooling_interval
+        Only one bookmark is returned for each word. The candidates are
+        sorted in the DB and only the ids of the returned ones are loaded.
 
-        scheduled_candidates = cls.get_scheduled_bookmarks_for_user(user, limit)
-        unscheduled_bookmarks = cls.get_unscheduled_bookmarks_for_user(user, limit)
-
-        all_possible_bookmarks = scheduled_candidates + unscheduled_bookmarks
-        no_duplicate_bookmarks = cls.remove_duplicated_bookmarks(all_possible_bookmarks)
-        sorted_candidates = sorted(
-            no_duplicate_bookmarks, key=lambda x: priority_by_rank(x)
+        :param limit: If None all the candidates are returned
+        """
+        from zeeguu.core.sql.queries.query_loader import load_query
+
+        rows = db.session.execute(
+            text(load_query("bookmarks_to_study_by_priority")),
+            {
+                "user_id": user.id,
+                "language_id": user.learned_language_id,
+                "end_of_day": cls.get_end_of_today(),
+                "all_learning_cycles": UserPreference.is_productive_exercises_preference_enabled(
+                    user
+                ),
+                "receptive": LearningCycle.RECEPTIVE,
+                "unknown_rank": UNKNOWN_WORD_RANK,
+                "impossible_rank": UserWord.IMPOSSIBLE_RANK,
+            },
         )
-        return sorted_candidates
+        ids = []
+        seen_words = set()
+        for row in rows:
+            if row.lower_word not in seen_words:
+                seen_words.add(row.lower_word)
+                ids.append(row.bookmark_id)
+                if limit is not None and len(ids) == limit:
+                    break
+
+        bookmarks = Bookmark.query.filter(Bookmark.id.in_(ids)).all()
+        bookmarks_by_id = {each.id: each for each in bookmarks}
+        return [bookmarks_by_id[id] for id in ids]
 
     @classmethod
     def priority_scheduled_bookmarks_to_study(cls, user, limit):
@@ -1,4 +1,18 @@
+import sqlite3
+import threading
+from collections import namedtuple
+
 from wordstats import LanguageInfo
+from wordstats.metrics_computers import compute_importance
+
+from zeeguu.logging import warning
+
+try:
+    from wordstats.disk_store import LanguageStore
+
+    _DISK_STORES = (LanguageStore,)
+except ImportError:
+    _DISK_STORES = ()
 
 lang_cache = {}
 
@@ -13,3 +27,126 @@ def lang_info(lang_code):
 # lang_info("da")
 # lang_info("de")
 # lang_info("nl")
+
+
+# what wordstats gives to the words it does not know
+UNKNOWN_WORD_RANK = 100000
+UNKNOWN_WORD_IMPORTANCE = 0
+
+WordRank = namedtuple("WordRank", ["rank", "importance"])
+UNKNOWN_WORD = WordRank(UNKNOWN_WORD_RANK, UNKNOWN_WORD_IMPORTANCE)
+
+# sqlite allows at most 999 parameters per statement in older versions
+_MAX_WORDS_PER_QUERY = 500
+
+# the words of the bookmarks of the active users come up again and again
+# (every exercise list, every bookmark list); the ranks of the last
+# MAX_CACHED_WORD_RANKS words we looked up, per language, stay in memory
+MAX_CACHED_WORD_RANKS = 50_000
+
+_ranks_cache = {}
+_ranks_lock = threading.Lock()
+
+# wordstats has no public batch lookup, so we query its sqlite file
+# directly; if that stops working (e.g. wordstats changes its schema) we
+# go back to the per-word lookups for the rest of the life of the process
+_direct_queries_work = True
+
+
+def ranks_for(words, lang_code):
+    """
+    The rank and importance of each of the words, looked up in one go.
+
+    The wordstats lists of a language are a read-only sqlite file that every
+    process memory-maps (see wordstats.disk_store), so instead of a query per
+    word (which is what Word.stats does) we ask for all the words we don't
+    already have in memory with a query per few hundred words.
+
+    :return: dictionary from each of the words to a WordRank; the words
+    that are not in the lists of the language get UNKNOWN_WORD
+    """
+    words = set(words)
+    with _ranks_lock:
+        cached = _ranks_cache.setdefault(lang_code, {})
+        result = {w: cached[w.lower()] for w in words if w.lower() in cached}
+
+    missing = {w.lower() for w in words if w not in result}
+    if not missing:
+        return result
+
+    found = _look_up(sorted(missing), lang_code)
+
+    with _ranks_lock:
+        if len(cached) + len(missing) > MAX_CACHED_WORD_RANKS:
+            cached.clear()
+        for w in missing:
+            cached[w] = found.get(w, UNKNOWN_WORD)
+
+    for w in words:
+        if w not in result:
+            result[w] = found.get(w.lower(), UNKNOWN_WORD)
+    return result
+
+
+def rank_for(word, lang_code):
+    return ranks_for([word], lang_code)[word]
+
+
+def _look_up(lowercase_words, lang_code):
+    store = lang_info(lang_code)
+
+    if isinstance(store, _DISK_STORES):
+        found = {}
+        for i in range(0, len(lowercase_words), _MAX_WORDS_PER_QUERY):
+            chunk = lowercase_words[i : i + _MAX_WORDS_PER_QUERY]
+            rows = _query(
+                store,
+                "SELECT word, rank, occurrences FROM words "
+                f"WHERE word IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            if rows is None:
+                break
+            for w, rank, occurrences in rows:
+                found[w] = WordRank(rank, compute_importance(occurrences))
+        else:
+            return found
+
+    # a LanguageInfo that keeps all the words in memory, or a store
+    # that we can't query directly
+    return {
+        w: WordRank(info.rank, info.importance)
+        for w, info in ((w, store[w]) for w in lowercase_words)
+        if info.rank != UNKNOWN_WORD_RANK
+    }
+
+
+def ranked_words(lang_code):
+    """
+    :return: list of (word, rank) with all the words of the language,
+    the most frequent first
+    """
+    store = lang_info(lang_code)
+
+    if isinstance(store, _DISK_STORES):
+        rows = _query(store, "SELECT word, rank FROM words ORDER BY rank")
+        if rows is not None:
+            return rows
+
+    return [(w, store[w].rank) for w in store.all_words()]
+
+
+def _query(store, sql, params=()):
+    """
+    :return: the rows, or None if the words file of the store can't be
+    queried directly anymore
+    """
+    global _direct_queries_work
+    if not _direct_queries_work:
+        return None
+    try:
+        return store._query(sql, params)
+    except (AttributeError, sqlite3.Error) as e:
+        warning(f"Can't query the wordstats file directly, using lookups: {e}")
+        _direct_queries_work = False
+        return None